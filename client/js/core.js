@@ -78,8 +78,10 @@ const AppState = {
 
 // --- WebSocket Manager ---
 class WSManager {
-    constructor(url) {
+    constructor(url, options = {}) {
         this.url = url;
+        // "http" (audio fetched by URL) or "binary" (audio pushed over this socket)
+        this.audioTransport = options.audioTransport || "http";
         this.ws = null;
         this.reconnectInterval = 3000;
         this.handlers = new Map();
@@ -92,11 +94,17 @@ class WSManager {
 
         console.log(`[WS] Connecting to ${this.url}...`);
         this.ws = new WebSocket(this.url);
+        this.ws.binaryType = "arraybuffer";
 
         this.ws.onopen = () => {
             AppState.setWSStatus("CONNECTED");
             console.log("%c[WS] Connected", "color: #00ff00; font-weight: bold;");
 
+            // Negotiate the audio transport before anything else
+            if (this.audioTransport !== "http") {
+                this.send({ type: "hello", audio_transport: this.audioTransport });
+            }
+
             // Sync current mode to backend on reconnect (force skip throttle)
             if (AppState.mode) {
                 console.log(`[WS] Auto-syncing mode: ${AppState.mode}`);
@@ -125,6 +133,10 @@ class WSManager {
         };
 
         this.ws.onmessage = (event) => {
+            if (event.data instanceof ArrayBuffer) {
+                this._routeBinary(event.data);
+                return;
+            }
             try {
                 const data = JSON.parse(event.data);
                 this._routeMessage(data);
@@ -141,6 +153,17 @@ class WSManager {
         this.handlers.get(type).push(callback);
     }
 
+    // Binary audio frame: [16-byte stream id][uint32 seq][payload]
+    _routeBinary(buffer) {
+        if (buffer.byteLength < 20) return;
+        const idBytes = new Uint8Array(buffer, 0, 16);
+        const streamId = Array.from(idBytes, b => b.toString(16).padStart(2, "0")).join("");
+        const seq = new DataView(buffer).getUint32(16);
+        const payload = buffer.slice(20);
+        const listeners = this.handlers.get("audio_chunk") || [];
+        listeners.forEach(cb => cb({ streamId, seq, payload }));
+    }
+
     _routeMessage(data) {
         // Broadcasters
         const listeners = this.handlers.get(data.type) || [];
@@ -198,8 +221,9 @@ function updateOverlay(state) {
     }
 }
 
-// Global instance
-const wsManager = new WSManager("ws://localhost:8765");
+// Global instance (opt into socket audio with ?audio=binary)
+const audioTransport = new URLSearchParams(window.location.search).get("audio") === "binary" ? "binary" : "http";
+const wsManager = new WSManager("ws://localhost:8765", { audioTransport });
 wsManager.connect();
 
 // Auto-sync overlay with state
@@ -1,6 +1,7 @@
 /**
  * vision.js
- * Motion-Reactive Hologram Mode: Camera detects any movement in bg, Lottie robot reacts.
+ * Motion-Reactive Hologram Mode: Camera detects any movement in bg, Lottie robot reacts
+ * (and reacts more strongly when the server's person detector confirms someone is there).
  */
 (function () {
     const container = document.getElementById('hologram-container');
@@ -15,28 +16,48 @@
     });
 
     let isReacting = false;
+    let resetTimer = null;
 
-    // Handle Motion Action
-    wsManager.on('action:motion_detected', () => {
-        // Only react if we are in vision mode
-        if (AppState.mode !== 'VISION') return;
-        if (isReacting) return; // UI side cooldown safety
-
-        console.log("[Hologram] Movement detected! Awakening...");
+    // Speed up, glow and lean toward lookX (px) for `duration` ms
+    function react(lookX, speed, duration) {
         isReacting = true;
 
         // 1. Visual reaction in hologram: Speed up
-        hologramAnim.setSpeed(2.2);
+        hologramAnim.setSpeed(speed);
 
-        // 2. Add temporary intensity to the glow effect
+        // 2. Add temporary intensity to the glow effect, leaning toward the target
+        container.style.setProperty('--look-x', `${lookX.toFixed(0)}px`);
         container.classList.add('reactive-glow');
 
         // Reset after reaction period
-        setTimeout(() => {
+        clearTimeout(resetTimer);
+        resetTimer = setTimeout(() => {
             hologramAnim.setSpeed(1.0);
             container.classList.remove('reactive-glow');
             isReacting = false;
-        }, 1200);
+        }, duration);
+    }
+
+    // Handle Motion Action
+    wsManager.on('action:motion_detected', (data) => {
+        // Only react if we are in vision mode
+        if (AppState.mode !== 'VISION') return;
+        if (isReacting) return; // UI side cooldown safety
+
+        console.log("[Hologram] Movement detected! Awakening...");
+        // centroid is in mirrored frame coordinates, 0..1
+        react(data.centroid ? (data.centroid[0] - 0.5) * 60 : 0, 2.2, 1200);
+    });
+
+    // A person was found in the moving region: stronger, longer reaction aimed at them
+    // (overrides an ongoing motion reaction)
+    wsManager.on('action:person_detected', (data) => {
+        if (AppState.mode !== 'VISION') return;
+        if (!data.boxes || !data.boxes.length) return;
+
+        console.log(`[Hologram] ${data.count} person(s) detected`);
+        const [x, , w] = data.boxes[0];
+        react((x + w / 2 - 0.5) * 80, 2.6, 2000);
     });
 
     console.log("[Vision] Motion-reactive Hologram initialized");
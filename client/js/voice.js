@@ -28,6 +28,65 @@ function logDebug(message, data = null) {
 
     let currentAudio = null;
 
+    // Binary-transport clips being received: stream_id -> { chunks, ... }
+    const binaryStreams = new Map();
+
+    // Plays a clip pushed over the WebSocket. Uses MediaSource to start
+    // playback with the first chunk where supported, else waits for audio_end.
+    function createBinaryAudio(msg) {
+        const entry = { chunks: [], ended: false, sourceBuffer: null, mediaSource: null };
+        binaryStreams.set(msg.stream_id, entry);
+
+        const mime = msg.mime || "audio/mpeg";
+        if (window.MediaSource && MediaSource.isTypeSupported(mime)) {
+            const mediaSource = new MediaSource();
+            entry.mediaSource = mediaSource;
+            mediaSource.addEventListener("sourceopen", () => {
+                entry.sourceBuffer = mediaSource.addSourceBuffer(mime);
+                entry.sourceBuffer.addEventListener("updateend", () => flushBinary(entry));
+                flushBinary(entry);
+            });
+            return new Audio(URL.createObjectURL(mediaSource));
+        }
+
+        // Fallback: assemble the whole clip, then play it as a Blob
+        const audio = new Audio();
+        entry.onComplete = () => {
+            audio.src = URL.createObjectURL(new Blob(entry.chunks, { type: mime }));
+            audio.play().catch(err => console.warn("[Voice] Autoplay blocked", err));
+        };
+        return audio;
+    }
+
+    function flushBinary(entry) {
+        const sb = entry.sourceBuffer;
+        if (!sb || sb.updating) return;
+        if (entry.chunks.length) {
+            sb.appendBuffer(entry.chunks.shift());
+        } else if (entry.ended && entry.mediaSource.readyState === "open") {
+            entry.mediaSource.endOfStream();
+        }
+    }
+
+    wsManager.on('audio_chunk', ({ streamId, payload }) => {
+        const entry = binaryStreams.get(streamId);
+        if (!entry) return;
+        entry.chunks.push(payload);
+        if (entry.mediaSource) flushBinary(entry);
+    });
+
+    wsManager.on('audio_end', (msg) => {
+        const entry = binaryStreams.get(msg.stream_id);
+        if (!entry) return;
+        entry.ended = true;
+        binaryStreams.delete(msg.stream_id);
+        if (entry.mediaSource) {
+            flushBinary(entry);
+        } else if (entry.onComplete) {
+            entry.onComplete();
+        }
+    });
+
     // --- State Mapping ---
     const STATE_COLORS = {
         IDLE: '#00f2ff',
@@ -65,7 +124,8 @@ function logDebug(message, data = null) {
     wsManager.on('action:speak', (msg) => {
         if (AppState.mode !== 'VOICE') return;
 
-        console.log("[Voice] Received audio:", msg.audio_path);
+        const binary = msg.transport === "binary";
+        console.log("[Voice] Received audio:", binary ? `stream ${msg.stream_id}` : msg.audio_path);
 
         // Interrupt existing audio
         if (currentAudio) {
@@ -74,7 +134,7 @@ function logDebug(message, data = null) {
         }
 
         // Create new audio instance
-        currentAudio = new Audio(msg.audio_path);
+        currentAudio = binary ? createBinaryAudio(msg) : new Audio(msg.audio_path);
 
         currentAudio.onplay = () => {
             AppState.setVoiceState('PLAYING');
@@ -90,6 +150,9 @@ function logDebug(message, data = null) {
             AppState.setVoiceState('IDLE');
         };
 
+        // Binary clips without MediaSource start themselves once fully received
+        if (!currentAudio.src) return;
+
         // play() works because user interaction happened (Portals)
         currentAudio.play().catch(err => {
             console.warn("[Voice] Autoplay blocked, likely no interaction yet", err);
@@ -122,6 +185,28 @@ function logDebug(message, data = null) {
         AppState.setVoiceState('IDLE');
     });
 
+    // --- Metrics (debug panel) ---
+    const METRICS_INTERVAL = 10000;
+    let metricsView = null;
+
+    wsManager.on('metrics', (msg) => {
+        if (!debugLog) return;
+        if (!metricsView) {
+            metricsView = document.createElement("pre");
+            metricsView.id = "debug-metrics";
+            debugLog.parentNode.insertBefore(metricsView, debugLog);
+        }
+        const stages = (msg.histograms || {}).hologram_voice_stage_seconds || {};
+        const lines = Object.entries(stages).map(([stage, s]) =>
+            `${stage.padEnd(22)} p50 ${s.p50_ms} ms  p99 ${s.p99_ms} ms  (${s.count})`);
+        metricsView.textContent = lines.join("\n") || "No voice turns yet";
+    });
+
+    setInterval(() => {
+        const open = wsManager.ws && wsManager.ws.readyState === WebSocket.OPEN;
+        if (open && debugLog && AppState.mode === 'VOICE') wsManager.send({ type: "metrics" });
+    }, METRICS_INTERVAL);
+
     // Removing manual click handler as requested
     micBtn.onclick = null;
     micBtn.style.cursor = 'default';
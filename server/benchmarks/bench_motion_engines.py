@@ -0,0 +1,80 @@
+"""
+Benchmark: motion engines compared on throughput and on synthetic scenarios.
+
+Scenarios (640x480, analysed at the default 160x120):
+- sweep:   a dark block crosses the frame quickly (should fire)
+- creep:   the block moves 1 px per frame (slow movement; should fire)
+- flicker: no movement, global brightness jumps by up to +/-25 (should not fire)
+
+Usage: python server/benchmarks/bench_motion_engines.py [--frames 240] [--threshold 0.0065]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from server.components.motion import ENGINES, MotionPreprocessor, create_engine
+
+
+def make_scenario(kind, count, width=640, height=480, seed=0):
+    rng = np.random.default_rng(seed)
+    background = rng.integers(60, 200, (height, width, 3), dtype=np.uint8)
+    frames = []
+    for i in range(count):
+        frame = background.astype(np.int16)
+        frame += rng.integers(-6, 7, (height, width, 3), dtype=np.int16)
+        moving = False
+        if kind == "flicker" and i % 8 == 4:
+            frame += int(rng.integers(-25, 26))
+        if i >= count // 4:
+            if kind == "sweep":
+                x = (i - count // 4) * 12 % (width - 120)
+                moving = True
+            elif kind == "creep":
+                x = 100 + (i - count // 4)
+                moving = True
+            if moving:
+                frame[180:300, x:x + 120] = 15
+        frames.append((np.clip(frame, 0, 255).astype(np.uint8), moving))
+    return frames
+
+
+def run(engine_name, frames, threshold):
+    preprocess = MotionPreprocessor((160, 120))
+    engine = create_engine(engine_name, preprocess)
+    grays = [preprocess(frame) for frame, _ in frames]
+    flagged = missed = false_alarms = 0
+    start = time.perf_counter()
+    for gray, (_, moving) in zip(grays, frames):
+        result = engine.process(gray)
+        detected = result is not None and result.fraction > threshold
+        flagged += detected
+        missed += moving and not detected
+        false_alarms += detected and not moving
+    elapsed = time.perf_counter() - start
+    return len(frames) / elapsed, flagged, missed, false_alarms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=240)
+    parser.add_argument("--threshold", type=float, default=0.0065, help="Motion fraction threshold")
+    args = parser.parse_args()
+
+    print(f"\n--- Motion engine benchmark ({args.frames} frames per scenario, engine time only) ---")
+    print(f"{'scenario':>8} {'engine':>8} {'fps':>8} {'flagged':>8} {'missed':>7} {'false':>6}")
+    for kind in ("sweep", "creep", "flicker"):
+        frames = make_scenario(kind, args.frames)
+        for name in ENGINES:
+            fps, flagged, missed, false_alarms = run(name, frames, args.threshold)
+            print(f"{kind:>8} {name:>8} {fps:8.0f} {flagged:8d} {missed:7d} {false_alarms:6d}")
+
+
+if __name__ == "__main__":
+    main()
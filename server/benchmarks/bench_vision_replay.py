@@ -0,0 +1,135 @@
+"""
+Benchmark: replay a clip through the motion pipeline as fast as it decodes.
+
+Reports frames/second, per-stage timings, event counts and - given labelled
+motion windows - event precision and window recall. Events use the same
+MotionDetector (threshold + cooldown on video time) as the live component.
+
+Labels: JSON list of [start, end] seconds, or a text file with one "start,end" per line.
+
+Usage:
+    python server/benchmarks/bench_vision_replay.py                      # synthetic clip, built-in labels
+    python server/benchmarks/bench_vision_replay.py --source clip.mp4 --labels clip.json
+    python server/benchmarks/bench_vision_replay.py --engine average --size 320x240 --json out.json
+    python server/benchmarks/bench_vision_replay.py --source clip.mp4 --person hog   # + gated person detection cost
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.components.motion import ENGINES, MotionDetector, StageTimer
+from server.components.frame_sources import open_source
+from server.components.person_detector import BACKENDS, PersonDetector
+
+
+def load_labels(path):
+    text = Path(path).read_text(encoding="utf-8")
+    if path.endswith(".json"):
+        return [tuple(map(float, window)) for window in json.loads(text)]
+    labels = []
+    for line in text.splitlines():
+        line = line.split("#")[0].strip()
+        if line:
+            start, end = line.split(",")
+            labels.append((float(start), float(end)))
+    return labels
+
+
+def score(events, labels, slack):
+    """Precision: events inside a window (+slack). Recall: windows with at least one event."""
+    hits = [any(s <= t <= e + slack for s, e in labels) for t in events]
+    covered = [any(s <= t <= e + slack for t in events) for s, e in labels]
+    precision = sum(hits) / len(events) if events else None
+    recall = sum(covered) / len(labels) if labels else None
+    return precision, recall
+
+
+def replay(source, detector, person=None):
+    events = []
+    people = 0
+    frames = 0
+    start = time.perf_counter()
+    while source.grab():
+        now = source.timestamp
+        if detector.cooldown_left(now) > 0:
+            detector.skip()  # Same as live: nothing is analysed during cooldown
+            continue
+        ret, frame = source.retrieve()
+        if not ret:
+            break
+        frames += 1
+        _, event = detector.process(frame, now)
+        if event:
+            events.append(now)
+            found = person(frame, event["regions"], now) if person else None
+            people += bool(found and found["count"])
+    return frames, time.perf_counter() - start, events, people
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default="synthetic:60", help="Frame source spec or clip path")
+    parser.add_argument("--labels", help="Labelled motion windows (synthetic sources have their own)")
+    parser.add_argument("--engine", default="diff", choices=list(ENGINES))
+    parser.add_argument("--size", default="160x120", help="Processing size WxH, or 'full'")
+    parser.add_argument("--threshold", type=float, default=0.0065)
+    parser.add_argument("--cooldown", type=float, default=1.2)
+    parser.add_argument("--slack", type=float, default=0.5, help="Seconds after a window an event still counts")
+    parser.add_argument("--person", choices=list(BACKENDS), help="Also run motion-gated person detection")
+    parser.add_argument("--person-budget", type=float, default=2.0, help="Person detections per second")
+    parser.add_argument("--json", help="Write the results to this file")
+    args = parser.parse_args()
+
+    size = None if args.size == "full" else tuple(int(v) for v in args.size.lower().split("x"))
+    source = open_source(args.source, realtime=False)
+    if not source.isOpened():
+        sys.exit(f"Cannot open {args.source}")
+    labels = load_labels(args.labels) if args.labels else getattr(source, "labels", None)
+
+    timer = StageTimer()
+    detector = MotionDetector(args.engine, size, threshold=args.threshold,
+                              cooldown=args.cooldown, timer=timer)
+    try:
+        person = PersonDetector(args.person, args.person_budget) if args.person else None
+    except RuntimeError as e:
+        sys.exit(f"Person detector {args.person!r} unavailable: {e}")
+    frames, elapsed, events, people = replay(source, detector, person)
+    source.release()
+
+    stages = {name: total / max(1, frames) * 1e6 for name, total in timer.totals.items()}
+    pipeline = sum(stages.values())
+    precision, recall = score(events, labels, args.slack) if labels else (None, None)
+
+    print(f"\n--- Vision replay ({args.source}, engine={args.engine}, size={args.size}) ---")
+    print(f"frames analysed : {frames} in {elapsed:.2f}s ({frames / elapsed:.0f} fps incl. decode)")
+    print(f"pipeline        : {pipeline:.1f} us/frame ({1e6 / pipeline:.0f} fps)" if pipeline else "")
+    for name, us in stages.items():
+        print(f"  {name:<13} : {us:7.1f} us/frame  {us / pipeline:6.1%}")
+    print(f"events          : {len(events)} at {', '.join(f'{t:.1f}s' for t in events) or '-'}")
+    if labels:
+        p = "n/a" if precision is None else f"{precision:.1%}"
+        print(f"labelled windows: {len(labels)}  precision {p}  recall {recall:.1%}")
+    if person:
+        st = person.stats()
+        share = person.seconds / max(1e-9, person.seconds + pipeline * frames / 1e6)
+        print(f"person ({st['kind']})   : {st['runs']} runs, {st['skipped']} over budget, "
+              f"{st['avg_ms']} ms/run, {people} with people, {share:.1%} of analysis CPU "
+              f"({person.seconds / max(1e-9, source.timestamp) * 1000:.1f} ms per second of video)")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "source": args.source, "engine": args.engine, "size": args.size,
+            "frames": frames, "seconds": elapsed, "stages_us": stages,
+            "events": events, "precision": precision, "recall": recall,
+            "person": person.stats() if person else None,
+        }, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
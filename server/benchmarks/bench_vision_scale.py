@@ -0,0 +1,84 @@
+"""
+Benchmark: motion analysis cost at different processing resolutions.
+
+Runs the VisionComponent preprocessing + frame differencing on synthetic
+640x480 frames (a moving block over sensor noise) and reports throughput,
+CPU time per frame and how often each scale flags motion.
+
+Usage: python server/benchmarks/bench_vision_scale.py [--frames 300] [--threshold 0.0065]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from server.components.motion import MotionPreprocessor, FrameDiffEngine
+
+SCALES = [None, (320, 240), (160, 120), (80, 60)]
+
+
+def make_frames(count, width=640, height=480, seed=0):
+    """Static noisy scene; a block sweeps across during the middle third of the run."""
+    rng = np.random.default_rng(seed)
+    background = rng.integers(40, 200, (height, width, 3), dtype=np.uint8)
+    frames = []
+    for i in range(count):
+        frame = background.copy()
+        noise = rng.integers(-6, 7, (height, width, 3), dtype=np.int16)
+        frame = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        moving = count // 3 <= i < 2 * count // 3
+        if moving:
+            x = int((i - count // 3) / (count // 3) * (width - 120))
+            frame[180:300, x:x + 120] = (15, 15, 15)
+        frames.append((frame, moving))
+    return frames
+
+
+def run(frames, size, threshold, rois=None):
+    preprocess = MotionPreprocessor(size, rois)
+    engine = FrameDiffEngine(preprocess)
+    flagged = correct = 0
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for frame, moving in frames:
+        result = engine.process(preprocess(frame))
+        if result is not None:
+            detected = result.fraction > threshold
+            flagged += detected
+            correct += detected == moving
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    return preprocess, len(frames) / wall, cpu / len(frames), flagged, correct / (len(frames) - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--threshold", type=float, default=0.0065, help="Motion fraction threshold")
+    parser.add_argument("--roi", type=float, nargs=4, metavar=("X", "Y", "W", "H"),
+                        help="Optional region (fractions of the frame) to restrict analysis to")
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames)
+    rois = [tuple(args.roi)] if args.roi else None
+    moving = sum(m for _, m in frames)
+
+    print(f"\n--- Vision scale benchmark ({args.frames} frames 640x480, {moving} with motion) ---")
+    if rois:
+        print("(accuracy is against whole-frame ground truth; the block may pass outside the ROI)")
+    print(f"{'size':>9} {'kernel':>7} {'fps':>8} {'cpu ms/frame':>13} {'flagged':>8} {'accuracy':>9}")
+    for size in SCALES:
+        preprocess, fps, cpu, flagged, accuracy = run(frames, size, args.threshold, rois)
+        label = "full" if size is None else f"{size[0]}x{size[1]}"
+        print(f"{label:>9} {preprocess.blur_kernel[0]:>7} {fps:8.0f} {cpu * 1e3:13.2f} "
+              f"{flagged:8d} {accuracy:9.1%}")
+
+
+if __name__ == "__main__":
+    main()
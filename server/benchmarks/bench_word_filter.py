@@ -0,0 +1,194 @@
+"""
+Benchmark: WordFilter scaling with lexicon size and input length.
+
+Builds seeded synthetic lexicons (the shipped blocked_words.txt topped up with
+generated words, 10 to 50k entries), plants known blocked words in clean
+Turkish text from a single word up to LLM-length paragraphs, checks every
+result, and reports throughput and latency percentiles for contains_profanity,
+censor_text and the streaming censor. --legacy-max adds the original per-word
+regex filter for comparison on the smaller lexicons.
+
+Usage:
+    python server/benchmarks/bench_word_filter.py                        # all sizes, writes results/word_filter.json
+    python server/benchmarks/bench_word_filter.py --sizes 10,1000 --calls 500
+    python server/benchmarks/bench_word_filter.py --json runs/word_filter.json --legacy-max 10000
+"""
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core.word_filter import EXACT_MAX_LENGTH, WordFilter
+
+SHIPPED = project_root / "server" / "blocked_words.txt"
+RESULTS = Path(__file__).parent / "results" / "word_filter.json"  # Ignored by git
+SIZES = [10, 100, 1000, 10000, 50000]
+INPUTS = {"word": 1, "sentence": 12, "paragraph": 150}  # Words per text
+STREAM_CHUNK = 8  # Characters per streamed fragment, roughly one LLM token batch
+
+CLEAN_WORDS = (
+    "bugün hava çok güzel ve biz parkta uzun bir yürüyüş yaptık sonra eve dönüp "
+    "kitap okuduk akşam yemeğinde annem mercimek çorbası pişirdi kardeşim ödevini "
+    "bitirdi ben de resim çizdim yarın okulda matematik dersi var öğretmenimiz "
+    "yeni bir konu anlatacak arkadaşlarımla teneffüste top oynamayı seviyorum "
+    "dünya yıldız gezegen güneş ay deniz orman kuş kedi köpek balık çiçek ağaç "
+    "merhaba nasılsın teşekkür ederim lütfen evet hayır belki şimdi sonra"
+).split()
+SYLLABLES = ["ka", "le", "mi", "to", "ru", "ba", "si", "ne", "po", "da", "gü", "şe",
+             "çı", "ro", "ve", "za", "tu", "fe", "ho", "ya", "kö", "bı", "nu", "pe"]
+
+
+class LegacyWordFilter:
+    """The original filter: one regex per word, per call."""
+
+    def __init__(self, words):
+        self.blocked_words = set(words)
+
+    def contains_profanity(self, text):
+        lowered = text.lower()
+        for word in self.blocked_words:
+            if re.search(rf"\b{re.escape(word)}\b", lowered, flags=re.IGNORECASE):
+                return True
+        return False
+
+    def censor_text(self, text, placeholder="***"):
+        censored = text
+        for word in sorted(self.blocked_words, key=len, reverse=True):
+            censored = re.sub(rf"\b{re.escape(word)}\b", placeholder, censored, flags=re.IGNORECASE)
+        return censored
+
+
+def make_lexicon(size, rng):
+    shipped = sorted({w.strip().lower() for w in SHIPPED.read_text(encoding="utf-8").splitlines() if w.strip()})
+    if size <= len(shipped):
+        return shipped[:size]
+    words = set(shipped)
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 6))))
+    return sorted(words)
+
+
+def make_texts(lexicon, n_words, count, rng):
+    """(text, expected censor_text output, contains a blocked word) triples."""
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(CLEAN_WORDS) for _ in range(n_words)]
+        expected = list(words)
+        planted = rng.random() < 0.5
+        if planted:
+            for i in rng.sample(range(n_words), min(n_words, rng.randint(1, 3))):
+                word = rng.choice(lexicon)
+                words[i] = word.title() if len(word) > EXACT_MAX_LENGTH and rng.random() < 0.3 else word
+                expected[i] = "***"
+        end = "." if n_words > 1 else ""
+        texts.append((" ".join(words) + end, " ".join(expected) + end, planted))
+    return texts
+
+
+def measure(func, texts):
+    """Per-call latencies in seconds."""
+    latencies = []
+    for text, _, _ in texts:
+        start = time.perf_counter()
+        func(text)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(latencies, chars):
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    return {
+        "calls": len(ordered),
+        "mean_us": total / len(ordered) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+        "chars_per_s": chars / total if total else None,
+    }
+
+
+def streamed(word_filter):
+    def run(text):
+        censor = word_filter.streaming()
+        out = [censor.feed(text[i:i + STREAM_CHUNK]) for i in range(0, len(text), STREAM_CHUNK)]
+        out.append(censor.flush())
+        return "".join(out)
+    return run
+
+
+def check(word_filter, texts):
+    stream = streamed(word_filter)
+    for text, expected, planted in texts:
+        assert word_filter.contains_profanity(text) == planted, text
+        assert word_filter.censor_text(text) == expected, (text, word_filter.censor_text(text))
+        assert stream(text) == expected, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Comma-separated lexicon sizes")
+    parser.add_argument("--calls", type=int, default=2000, help="Texts per input length (paragraphs get a tenth)")
+    parser.add_argument("--legacy-max", type=int, default=1000, help="Largest lexicon to time the legacy filter on")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=str(RESULTS), help="Write the results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = []
+    builds = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in args.sizes.split(",")):
+            lexicon = make_lexicon(size, rng)
+            path = Path(tmp) / f"lexicon_{size}.txt"
+            path.write_text("\n".join(lexicon) + "\n", encoding="utf-8")
+
+            start = time.perf_counter()
+            word_filter = WordFilter(str(path))
+            builds[size] = time.perf_counter() - start
+            assert not word_filter.contains_profanity(" ".join(CLEAN_WORDS)), "lexicon collides with clean text"
+
+            legacy = LegacyWordFilter(lexicon) if size <= args.legacy_max else None
+            print(f"\n--- Lexicon {size} words (built in {builds[size] * 1000:.0f} ms) ---")
+            for kind, n_words in INPUTS.items():
+                count = args.calls if n_words < 100 else max(10, args.calls // 10)
+                texts = make_texts(lexicon, n_words, count, rng)
+                check(word_filter, texts)
+                chars = sum(len(text) for text, _, _ in texts)
+                ops = {
+                    "contains_profanity": word_filter.contains_profanity,
+                    "censor_text": word_filter.censor_text,
+                    "stream": streamed(word_filter),
+                }
+                if legacy:
+                    ops["legacy_contains"] = legacy.contains_profanity
+                    ops["legacy_censor"] = legacy.censor_text
+                for op, func in ops.items():
+                    stats = summarize(measure(func, texts), chars)
+                    results.append({"lexicon": size, "input": kind, "op": op, **stats})
+                    print(f"{kind:<9} {op:<18} p50 {stats['p50_us']:9.1f} us  p99 {stats['p99_us']:9.1f} us  "
+                          f"{stats['chars_per_s'] / 1e6:7.2f} Mchar/s")
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "build_seconds": builds,
+            "results": results,
+        }, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
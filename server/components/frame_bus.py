@@ -0,0 +1,237 @@
+"""
+Frame Bus - camera frames in shared memory, so any number of consumers
+(motion analysis, preview, recording, other processes) read the same frame
+without reopening the camera or copying it around.
+
+One writer publishes into a small ring of preallocated frame slots. Every slot
+carries the sequence number of the frame in it; readers get a zero-copy NumPy
+view of the newest slot and can call valid(seq) afterwards to check it wasn't
+overwritten while they used it (they have slots - 1 frame periods to finish).
+
+Readers in the owning process are woken through a condition variable; readers
+in other processes attach by name and poll. Frames are only decoded when some
+reader has asked for one since the last publish (see `wanted`).
+
+    bus = FrameBus.attach(vision.stats()["frame_bus"])
+    frame, seq, timestamp = bus.read(0)
+"""
+import time
+import uuid
+import threading
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+# Header layout (int64 fields, then float64 fields)
+_MAGIC, _LATEST, _CLOSED, _SLOTS, _HEIGHT, _WIDTH, _CHANNELS = range(7)
+_INT_FIELDS = 8
+_DEMAND_AT, _PUBLISHED_AT = range(2)
+_FLOAT_FIELDS = 2
+_HEADER_BYTES = 8 * (_INT_FIELDS + _FLOAT_FIELDS)
+MAGIC = 0x484F4C4F46524D31  # "HOLOFRM1"
+
+
+_attach_lock = threading.Lock()  # One resource_tracker patch at a time
+
+
+def _open_shm(name):
+    """
+    Attaches without registering with the resource tracker, which would otherwise
+    unlink the segment when a subscriber exits (and spawned children share the
+    owner's tracker, so unregistering afterwards would drop the owner's entry).
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track flag
+        pass
+    from multiprocessing import resource_tracker
+    with _attach_lock:
+        register = resource_tracker.register
+
+        def register_others(resource, rtype):
+            # Other threads keep registering their own resources meanwhile
+            if rtype != "shared_memory" or resource.lstrip("/") != name.lstrip("/"):
+                register(resource, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class FrameBus:
+    """Shared-memory ring of frame slots. Use FrameBus(slots) to own one, FrameBus.attach(name) to subscribe."""
+
+    def __init__(self, slots=4, poll_interval=0.005):
+        self.slots = slots
+        self.poll_interval = poll_interval  # Wait granularity for readers in other processes
+        self.owner = True
+        self.shm = None
+        self._seq = 0
+        self._cond = threading.Condition()  # Wakes readers in this process
+        self._closed = False
+
+    # --- Layout ---------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.shm.name if self.shm else None
+
+    @property
+    def allocated(self):
+        return self.shm is not None
+
+    def _map(self, slots, shape):
+        h, w, c = shape
+        buf = self.shm.buf
+        self._ints = np.ndarray((_INT_FIELDS,), np.int64, buf, 0)
+        self._floats = np.ndarray((_FLOAT_FIELDS,), np.float64, buf, 8 * _INT_FIELDS)
+        offset = _HEADER_BYTES
+        self._slot_seq = np.ndarray((slots,), np.int64, buf, offset)
+        offset += 8 * slots
+        self._slot_ts = np.ndarray((slots,), np.float64, buf, offset)
+        offset += 8 * slots
+        offset = (offset + 63) // 64 * 64  # Cache-line align the frames
+        self._frames = np.ndarray((slots, h, w, c), np.uint8, buf, offset)
+        self.shape = (h, w, c)
+        self.slots = slots
+
+    @staticmethod
+    def _size(slots, shape):
+        h, w, c = shape
+        return (_HEADER_BYTES + 16 * slots + 63) // 64 * 64 + slots * h * w * c
+
+    def allocate(self, shape):
+        """Owner: creates the shared segment for frames of this (h, w[, c]) shape."""
+        shape = tuple(shape) + (1,) * (3 - len(shape))
+        self.shm = shared_memory.SharedMemory(
+            name=f"holo_{uuid.uuid4().hex[:16]}", create=True, size=self._size(self.slots, shape))
+        with self._cond:
+            self._map(self.slots, shape)
+            self._ints[:] = 0
+            self._ints[_MAGIC] = MAGIC
+            self._ints[_SLOTS] = self.slots
+            self._ints[_HEIGHT], self._ints[_WIDTH], self._ints[_CHANNELS] = shape
+            self._floats[:] = 0.0
+            self._slot_seq[:] = 0
+            self._cond.notify_all()
+
+    @classmethod
+    def attach(cls, name, poll_interval=0.005):
+        """Subscriber: maps an existing bus (from this or another process) by name."""
+        bus = cls(poll_interval=poll_interval)
+        bus.owner = False
+        bus.shm = _open_shm(name)
+        ints = np.ndarray((_INT_FIELDS,), np.int64, bus.shm.buf, 0)
+        if ints[_MAGIC] != MAGIC:
+            del ints
+            bus.shm.close()
+            raise ValueError(f"{name} is not a frame bus")
+        slots, shape = int(ints[_SLOTS]), (int(ints[_HEIGHT]), int(ints[_WIDTH]), int(ints[_CHANNELS]))
+        del ints
+        bus._map(slots, shape)
+        return bus
+
+    # --- Writer ---------------------------------------------------------
+
+    @property
+    def wanted(self):
+        """True if a reader has been waiting for a frame since the last publish."""
+        return self.allocated and self._floats[_DEMAND_AT] >= self._floats[_PUBLISHED_AT]
+
+    def publish(self, frame, timestamp=None):
+        """Owner: copies a frame into the next slot and returns its sequence number."""
+        if not self.allocated:
+            self.allocate(frame.shape)
+        if frame.shape[:2] != self.shape[:2]:
+            frame = cv2.resize(frame, (self.shape[1], self.shape[0]), interpolation=cv2.INTER_AREA)
+        seq = self._seq + 1
+        slot = seq % self.slots
+        self._slot_seq[slot] = -1  # Marks the slot as being written
+        self._frames[slot] = frame.reshape(self.shape)
+        self._slot_ts[slot] = time.time() if timestamp is None else timestamp
+        self._slot_seq[slot] = seq
+        self._ints[_LATEST] = seq
+        self._floats[_PUBLISHED_AT] = time.time()
+        self._seq = seq
+        with self._cond:
+            self._cond.notify_all()
+        return seq
+
+    def close(self):
+        """Owner: tells every reader that no more frames will come."""
+        self._closed = True
+        if self.allocated:
+            self._ints[_CLOSED] = 1
+        with self._cond:
+            self._cond.notify_all()
+
+    # --- Readers --------------------------------------------------------
+
+    @property
+    def closed(self):
+        return self._closed or (self.allocated and bool(self._ints[_CLOSED]))
+
+    def _latest(self, last_seq, copy):
+        seq = int(self._ints[_LATEST])
+        if seq == last_seq or seq <= 0:
+            return None
+        slot = seq % self.slots
+        if self._slot_seq[slot] != seq:
+            return None  # Being overwritten; the next look will find a newer frame
+        frame = self._frames[slot]
+        timestamp = float(self._slot_ts[slot])
+        if copy:
+            frame = frame.copy()
+            if self._slot_seq[slot] != seq:
+                return None
+        return frame, seq, timestamp
+
+    def read(self, last_seq=0, timeout=1.0, copy=False):
+        """
+        Waits for a frame newer than last_seq. Returns (frame, seq, timestamp), or
+        (None, last_seq, 0.0) on timeout / close. Without copy the frame is a view
+        into shared memory; check valid(seq) if it was used for long.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.allocated:
+                found = self._latest(last_seq, copy)
+                if found:
+                    return found
+                # Only ask for a frame when about to wait, so none go stale unread
+                self._floats[_DEMAND_AT] = time.time()
+            if self.closed:
+                return None, last_seq, 0.0
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, last_seq, 0.0
+            if self.owner:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self.closed or (self.allocated and self._ints[_LATEST] != last_seq),
+                        remaining)
+            else:
+                time.sleep(min(self.poll_interval, remaining))
+
+    def valid(self, seq):
+        """True while the frame with this sequence number is still in its slot."""
+        return self.allocated and bool(self._slot_seq[seq % self.slots] == seq)
+
+    def release(self):
+        """Unmaps the segment (and removes it, for the owner). Drop frame views first."""
+        if not self.shm:
+            return
+        shm, self.shm = self.shm, None
+        self._ints = self._floats = self._slot_seq = self._slot_ts = self._frames = None
+        try:
+            shm.close()
+        except BufferError:
+            pass  # A reader still holds a view; the mapping goes away with it
+        if self.owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,176 @@
+"""
+Frame Sources - where VisionComponent gets its frames from.
+All sources follow the cv2.VideoCapture subset the capture loop uses
+(isOpened / grab / retrieve / read / release) and add `timestamp`, the
+time in seconds of the last grabbed frame.
+
+Source specs (VISION_SOURCE / open_source):
+    camera[:index]             local camera (default camera:0)
+    file:<path> or <path>      recorded clip
+    synthetic[:seconds]        generated scene with labelled motion windows
+"""
+import abc
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+
+class FrameSource(abc.ABC):
+    """Base class; subclasses fill in _grab/retrieve."""
+
+    def __init__(self, realtime=True):
+        self.realtime = realtime  # Pace file/synthetic playback at their native FPS
+        self.fps = 30.0
+        self.timestamp = 0.0
+        self.frame_index = -1
+        self._started = None
+
+    def isOpened(self):
+        return False
+
+    def grab(self):
+        if not self._grab():
+            return False
+        self.frame_index += 1
+        self._pace()
+        return True
+
+    @abc.abstractmethod
+    def _grab(self):
+        """Advances to the next frame; False at the end of the source."""
+
+    @abc.abstractmethod
+    def retrieve(self):
+        """(ok, frame) for the last grabbed frame."""
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def release(self):
+        pass
+
+    def _pace(self):
+        # Recorded and synthetic sources carry their own clock
+        self.timestamp = self.frame_index / self.fps
+        if not self.realtime:
+            return
+        if self._started is None:
+            self._started = time.monotonic()
+        delay = self._started + self.timestamp - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class CameraSource(FrameSource):
+    """A local camera, preferring DirectShow where it is available."""
+
+    def __init__(self, index=0):
+        super().__init__(realtime=False)
+        self.cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+        if not self.cap.isOpened():
+            print("❌ Cannot open camera - trying without CAP_DSHOW...")
+            self.cap = cv2.VideoCapture(index)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def _grab(self):
+        return self.cap.grab()
+
+    def _pace(self):
+        self.timestamp = time.monotonic()
+
+    def retrieve(self):
+        return self.cap.retrieve()
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """A recorded clip. With realtime=False it replays as fast as frames decode."""
+
+    def __init__(self, path, realtime=True, loop=False):
+        super().__init__(realtime)
+        self.path = str(path)
+        self.loop = loop
+        self.cap = cv2.VideoCapture(self.path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def _grab(self):
+        if self.cap.grab():
+            return True
+        if not self.loop:
+            return False
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return self.cap.grab()
+
+    def retrieve(self):
+        return self.cap.retrieve()
+
+    def release(self):
+        self.cap.release()
+
+
+class SyntheticSource(FrameSource):
+    """
+    A noisy static scene; during each labelled (start, end) window a dark block
+    sweeps across it. `labels` are the ground truth for benchmarks.
+    """
+
+    def __init__(self, duration=20.0, fps=30.0, size=(640, 480), labels=None,
+                 realtime=True, seed=0):
+        super().__init__(realtime)
+        self.fps = fps
+        self.duration = duration
+        self.size = size
+        self.labels = list(labels) if labels is not None else [
+            (duration * f, duration * f + 1.5) for f in (0.2, 0.45, 0.7)]
+        rng = np.random.default_rng(seed)
+        w, h = size
+        self._background = rng.integers(60, 200, (h, w, 3), dtype=np.uint8)
+        # A small pool of noise patterns keeps generation cheap
+        self._noise = [rng.integers(0, 12, (h, w, 3), dtype=np.uint8) for _ in range(8)]
+        self._open = True
+
+    def isOpened(self):
+        return self._open
+
+    def _grab(self):
+        return self._open and (self.frame_index + 1) / self.fps < self.duration
+
+    def retrieve(self):
+        frame = cv2.add(self._background, self._noise[self.frame_index % len(self._noise)])
+        t = self.frame_index / self.fps
+        w, h = self.size
+        for start, end in self.labels:
+            if start <= t < end:
+                progress = (t - start) / (end - start)
+                bw, bh = w // 5, h // 4
+                x = int(progress * (w - bw))
+                frame[h // 3:h // 3 + bh, x:x + bw] = 15
+        return True, frame
+
+    def release(self):
+        self._open = False
+
+
+def open_source(spec="camera:0", realtime=True):
+    """Builds a frame source from a spec string (see module docstring)."""
+    kind, _, arg = str(spec).partition(":")
+    if kind == "camera":
+        return CameraSource(int(arg or 0))
+    if kind == "synthetic":
+        return SyntheticSource(float(arg or 20.0), realtime=realtime)
+    path = arg if kind == "file" else spec
+    if not Path(path).exists():
+        raise ValueError(f"Unknown frame source {spec!r}")
+    return VideoFileSource(path, realtime=realtime)
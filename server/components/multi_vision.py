@@ -0,0 +1,214 @@
+"""
+Multi-Camera Vision - one worker process per camera, so capture and motion
+analysis scale across cores instead of sharing one GIL. Each worker runs a
+regular VisionComponent; its events and periodic stats come back over a
+multiprocessing queue and are broadcast from the asyncio gateway, tagged
+with the camera ID.
+
+Configure with VISION_SOURCES, a comma-separated list of frame source specs,
+optionally named: "front=camera:0,side=camera:1" (unnamed ones become cam0, cam1, ...).
+"""
+import time
+import queue
+import asyncio
+import threading
+import multiprocessing as mp
+
+from server.components.websocket import broadcast_action
+from server.components.vision import VisionComponent
+
+STATS_INTERVAL = 2.0  # Seconds between worker stats reports
+STATE_POLL = 0.05     # How quickly a worker follows a standby / resume request
+JOIN_TIMEOUT = 3.0    # Grace period for a worker to release its camera on stop
+
+
+def parse_sources(spec):
+    """'front=camera:0,camera:1' -> {'front': 'camera:0', 'cam1': 'camera:1'}"""
+    cameras = {}
+    for i, item in enumerate(s.strip() for s in spec.split(",")):
+        if not item:
+            continue
+        name, sep, source = item.partition("=")
+        if not sep:
+            name, source = f"cam{i}", item
+        cameras[name.strip()] = source.strip()
+    return cameras
+
+
+def camera_worker(camera_id, source, settings, events, stop, active):
+    """
+    Worker process entry point: runs one VisionComponent until stop is set,
+    analysing while `active` is set and on standby (camera kept warm) otherwise.
+    """
+    def on_event(action, data):
+        try:
+            events.put_nowait(("event", camera_id, action, data))
+        except queue.Full:
+            pass  # The gateway is behind; a dropped motion event is harmless
+
+    vision = VisionComponent(source=source, camera_id=camera_id, on_event=on_event)
+    for name, value in settings.items():
+        setattr(vision, name, value)
+    vision.start()
+    paused = False  # Put on standby by the gateway (so going "off" is the standby timeout, not a failure)
+    next_stats = time.monotonic() + STATS_INTERVAL
+    try:
+        while not stop.wait(STATE_POLL):
+            state = vision.state
+            if active.is_set():
+                if state == "standby" or (state == "off" and paused):
+                    vision.start()  # Warm resume, or reopen after the standby timeout
+                    paused = False
+                elif state == "off":
+                    break  # Camera failed or the clip ended
+            elif state == "active":
+                vision.standby()
+                paused = True
+            if time.monotonic() >= next_stats:
+                next_stats += STATS_INTERVAL
+                try:
+                    events.put_nowait(("stats", camera_id, vision.stats()))
+                except queue.Full:
+                    pass
+    finally:
+        vision.stop()
+        vision.join(JOIN_TIMEOUT)
+        try:
+            events.put_nowait(("stopped", camera_id, vision.stats()))
+        except queue.Full:
+            pass
+
+
+class MultiCameraVision:
+    """
+    Drop-in replacement for VisionComponent (start/standby/stop/running/stats)
+    that drives several cameras through worker processes.
+    """
+
+    def __init__(self, cameras, settings=None):
+        self.cameras = dict(cameras)  # camera_id -> source spec
+        self.settings = dict(settings or {})  # VisionComponent attribute overrides
+        self.loop = None
+        self._ctx = mp.get_context("spawn")  # Same behaviour on Windows and Linux
+        self._events = None
+        self._reader = None
+        self._workers = {}  # camera_id -> (process, stop event, active event)
+        self._launcher = None
+        self._camera_stats = {cid: {} for cid in self.cameras}
+        self._event_latency = {cid: 0.0 for cid in self.cameras}
+
+    @property
+    def running(self):
+        return any(not stop.is_set() for _, stop, _ in self._workers.values())
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """Starts every camera worker (process spawning happens off the loop), or resumes them from standby."""
+        if self.running:
+            if all(active.is_set() for _, _, active in self._workers.values()):
+                print("⚠️ Multi-camera vision already running")
+                return
+            print("👁️ Resuming multi-camera vision from standby")
+            self.loop = loop
+            for _, _, active in self._workers.values():
+                active.set()
+            return
+        print(f"👁️ Starting multi-camera vision: {', '.join(self.cameras)}")
+        self.loop = loop
+        if self._events is None:
+            self._events = self._ctx.Queue(maxsize=256)
+            self._reader = threading.Thread(target=self._read_events, name="VisionEvents", daemon=True)
+            self._reader.start()
+
+        previous = (self._launcher, self._workers)
+        self._workers = {cid: (None, self._ctx.Event(), self._ctx.Event()) for cid in self.cameras}
+        for _, _, active in self._workers.values():
+            active.set()
+        self._launcher = threading.Thread(
+            target=self._launch, args=(self._workers, previous),
+            name="VisionLauncher", daemon=True)
+        self._launcher.start()
+
+    def _launch(self, workers, previous):
+        # Cameras held by the last run's workers must be released first
+        self._reap(*previous)
+        for cid, (_, stop, active) in workers.items():
+            if stop.is_set():
+                continue  # Stopped before it was launched
+            process = self._ctx.Process(
+                target=camera_worker,
+                args=(cid, self.cameras[cid], self.settings, self._events, stop, active),
+                name=f"VisionWorker-{cid}", daemon=True)
+            process.start()
+            workers[cid] = (process, stop, active)
+
+    @staticmethod
+    def _reap(launcher, workers):
+        """Stops and joins a run's workers, once its launcher has finished spawning them."""
+        for _, stop, _ in workers.values():
+            stop.set()
+        if launcher:
+            launcher.join()
+        for process, _, _ in workers.values():
+            if process is None:
+                continue
+            process.join(JOIN_TIMEOUT)
+            if process.is_alive():
+                print(f"⚠️ {process.name} did not exit, terminating")
+                process.terminate()
+                process.join(1.0)
+
+    def standby(self):
+        """Pauses analysis in every worker; cameras stay open for the workers' STANDBY_TIMEOUT."""
+        for _, _, active in self._workers.values():
+            active.clear()
+        print("👁️ Multi-camera vision on standby")
+
+    def stop(self):
+        """Signals every worker to stop; they are reaped off the loop."""
+        for _, stop, _ in self._workers.values():
+            stop.set()
+        threading.Thread(target=self._reap, args=(self._launcher, self._workers),
+                         name="VisionReaper", daemon=True).start()
+        print("👁️ Multi-camera vision stopped")
+
+    def _read_events(self):
+        """Reader thread: forwards worker messages to the event loop."""
+        while True:
+            try:
+                kind, cid, *rest = self._events.get()
+            except (EOFError, OSError):
+                return
+            if kind == "event":
+                action, data = rest
+                latency = time.time() - data.get("captured_at", time.time())
+                self._event_latency[cid] += 0.2 * (latency - self._event_latency[cid])
+                if self.loop and not self.loop.is_closed():
+                    self.loop.call_soon_threadsafe(self._broadcast, action, data)
+            else:
+                report = rest[0] or {}
+                report["alive"] = kind == "stats"
+                self._camera_stats[cid] = report
+                if kind == "stopped" and report.get("effective_fps") is not None:
+                    print(f"👁️ Camera {cid}: {report['effective_fps']} fps effective, "
+                          f"analysis latency {report['latency_ms']} ms, "
+                          f"event latency {self._event_latency[cid] * 1000:.1f} ms")
+
+    def _broadcast(self, action_name, data):
+        # Runs on the event loop
+        task = asyncio.ensure_future(broadcast_action(action_name, data))
+        task.add_done_callback(self._log_broadcast_error)
+
+    @staticmethod
+    def _log_broadcast_error(task):
+        if not task.cancelled() and task.exception():
+            print(f"⚠️ Failed to broadcast motion event: {task.exception()}")
+
+    def stats(self):
+        """Per-camera report: effective FPS, analysis latency and event delivery latency."""
+        return {
+            cid: {
+                **self._camera_stats.get(cid, {}),
+                "event_latency_ms": round(self._event_latency[cid] * 1000, 1),
+            }
+            for cid in self.cameras
+        }
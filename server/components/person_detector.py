@@ -0,0 +1,129 @@
+"""
+Person Detector - the expensive second stage of the vision cascade.
+It only runs on frames where motion fired, only inside the motion regions, and
+no more often than a per-second budget allows, so average CPU stays close to
+the motion-only pipeline.
+
+Backends (offline, bundled with opencv-python 4.x):
+- "hog":  HOG + linear SVM full-body people detector
+- "face": Haar frontal-face cascade
+"""
+import time
+
+import cv2
+
+DETECT_MAX_SIDE = 320  # Crops are downscaled to at most this many pixels per side
+REGION_PADDING = 0.25  # Grow the motion box by this fraction on every side
+
+
+def _hog_backend():
+    if not hasattr(cv2, "HOGDescriptor"):
+        raise RuntimeError("this OpenCV build has no HOGDescriptor")
+    hog = cv2.HOGDescriptor()
+    hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+
+    def detect(image):
+        boxes, weights = hog.detectMultiScale(image, winStride=(8, 8), padding=(8, 8), scale=1.05)
+        return [tuple(box) for box, w in zip(boxes, weights) if float(w) > 0.5]
+    return detect
+
+
+def _face_backend():
+    if not hasattr(cv2, "CascadeClassifier"):
+        raise RuntimeError("this OpenCV build has no CascadeClassifier")
+    cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+    if cascade.empty():
+        raise RuntimeError("Haar face cascade not found")
+
+    def detect(image):
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return [tuple(box) for box in cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)]
+    return detect
+
+
+BACKENDS = {"hog": _hog_backend, "face": _face_backend}
+
+
+class DetectionBudget:
+    """Token bucket: at most `per_second` detections on average, bursting up to that many."""
+
+    def __init__(self, per_second=2.0):
+        self.per_second = per_second
+        self.tokens = per_second
+        self._last = None
+
+    def take(self, now=None):
+        now = time.monotonic() if now is None else now
+        if self._last is not None:
+            self.tokens = min(self.per_second, self.tokens + (now - self._last) * self.per_second)
+        self._last = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class PersonDetector:
+    """Runs a backend on the padded union of motion regions, within a budget."""
+
+    def __init__(self, kind="hog", budget_per_second=2.0, backend=None):
+        self.kind = kind
+        self.detect = backend or BACKENDS[kind]()
+        self.budget = DetectionBudget(budget_per_second)
+        self.runs = 0
+        self.skipped = 0  # Motion frames the budget didn't allow
+        self.seconds = 0.0
+
+    def __call__(self, frame, regions, now=None):
+        """
+        frame: full-resolution BGR camera frame (not mirrored).
+        regions: motion regions as (x, y, w, h) fractions of the mirrored frame.
+        now: clock for the budget (monotonic by default; video time in replays).
+        Returns the event payload {"count", "boxes"} (boxes in the same mirrored
+        fractions as motion regions), or None if nothing ran.
+        """
+        if not regions:
+            return None
+        if not self.budget.take(now):
+            self.skipped += 1
+            return None
+        started = time.perf_counter()
+        h, w = frame.shape[:2]
+
+        # Union of the regions, padded, converted from mirrored to camera coordinates
+        x0 = min(r[0] for r in regions)
+        y0 = min(r[1] for r in regions)
+        x1 = max(r[0] + r[2] for r in regions)
+        y1 = max(r[1] + r[3] for r in regions)
+        pad_x, pad_y = (x1 - x0) * REGION_PADDING, (y1 - y0) * REGION_PADDING
+        left = int(max(0.0, 1.0 - (x1 + pad_x)) * w)
+        right = int(min(1.0, 1.0 - (x0 - pad_x)) * w)
+        top = int(max(0.0, y0 - pad_y) * h)
+        bottom = int(min(1.0, y1 + pad_y) * h)
+        crop = frame[top:bottom, left:right]
+
+        scale = min(1.0, DETECT_MAX_SIDE / max(1, crop.shape[0], crop.shape[1]))
+        if scale < 1.0:
+            crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            crop = crop.copy()  # Detach from the frame bus slot
+
+        boxes = []
+        for bx, by, bw, bh in self.detect(crop):
+            # Back to full-frame pixels, then to mirrored fractions
+            fx, fy = left + bx / scale, top + by / scale
+            fw, fh = bw / scale, bh / scale
+            boxes.append([round(1.0 - (fx + fw) / w, 3), round(fy / h, 3),
+                          round(fw / w, 3), round(fh / h, 3)])
+
+        self.runs += 1
+        self.seconds += time.perf_counter() - started
+        return {"count": len(boxes), "boxes": boxes}
+
+    def stats(self):
+        return {
+            "kind": self.kind,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "avg_ms": round(self.seconds / self.runs * 1000, 1) if self.runs else 0.0,
+        }
@@ -1,115 +1,398 @@
 """
-Vision Component - General Motion Detection using OpenCV Frame Differencing
+Vision Component - General Motion Detection using a pluggable OpenCV motion engine
+(frame differencing by default, see server/components/motion.py).
+Camera capture and motion analysis run on their own threads; only the
+resulting events are handed back to the asyncio loop. Frames travel through a
+shared-memory FrameBus, so other consumers can subscribe to the same camera.
 """
-import cv2
+import os
 import time
 import asyncio
-import numpy as np
+import threading
 
 from server.components.websocket import broadcast_action
+from server.components.motion import MotionDetector
+from server.components.frame_sources import open_source
+from server.components.frame_bus import FrameBus
+from server.components.person_detector import PersonDetector
+from server.core import metrics
+
+VISION_STAGE = metrics.histogram(
+    "hologram_vision_stage_seconds", "Vision analysis time per frame (motion) and per run (person)", ("stage",))
+
+
+class DutyCycle:
+    """
+    Chooses how often motion analysis runs: full rate while there is activity,
+    a low idle rate after a quiet spell, and not at all during the event cooldown.
+    Time with analysis paused (camera kept warm) is tracked as "standby".
+    Keeps time and frame counts per level for reporting.
+    """
+
+    LEVELS = ("active", "idle", "cooldown", "standby")
+
+    def __init__(self, active_interval, idle_interval, idle_after):
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.idle_after = idle_after
+        now = time.monotonic()
+        self.level = "active"
+        self.started = now
+        self._since = now
+        self._last_activity = now
+        self.seconds = dict.fromkeys(self.LEVELS, 0.0)
+        self.frames = dict.fromkeys(self.LEVELS, 0)
+
+    def _switch(self, level, now):
+        if level != self.level:
+            self.seconds[self.level] += now - self._since
+            self._since = now
+            self.level = level
+
+    def activity(self, now=None):
+        now = time.monotonic() if now is None else now
+        self._last_activity = now
+        self._switch("active", now)
+
+    def standby(self, now=None):
+        self._switch("standby", time.monotonic() if now is None else now)
+
+    def update(self, cooldown_left=0.0, now=None):
+        """Returns the next analysis interval in seconds."""
+        now = time.monotonic() if now is None else now
+        if cooldown_left > 0:
+            # A cooldown follows an event, so the idle countdown starts after it
+            self._last_activity = now + cooldown_left
+            self._switch("cooldown", now)
+            return cooldown_left
+        if now - self._last_activity > self.idle_after:
+            self._switch("idle", now)
+            return self.idle_interval
+        self._switch("active", now)
+        return self.active_interval
+
+    def count_frame(self):
+        self.frames[self.level] += 1
+
+    def report(self, now=None):
+        now = time.monotonic() if now is None else now
+        seconds = dict(self.seconds)
+        seconds[self.level] += now - self._since
+        elapsed = max(1e-9, now - self.started)
+        analysed = sum(self.frames.values())
+        return {
+            "level": self.level,
+            "effective_fps": round(analysed / elapsed, 2),
+            "seconds": {k: round(v, 2) for k, v in seconds.items()},
+            "frames": dict(self.frames),
+        }
 
 
 class VisionComponent:
-    """Motion detection component based on frame differencing"""
+    """Motion detection component; MOTION_ENGINE picks diff / average / mog2"""
 
-    def __init__(self):
+    def __init__(self, source=None, camera_id=None, on_event=None):
         # Motion Detection Settings
-        self.MOTION_THRESHOLD = 2000  # Non-zero pixels threshold
+        self.MOTION_THRESHOLD = 0.0065  # Changed fraction of the analysed area (~2000 px at 640x480)
         self.MOTION_COOLDOWN = 1.2     # Cooldown in seconds before next event
-        
+        self.PROCESS_INTERVAL = 0.03   # Approx 30 FPS processing while active
+        self.IDLE_INTERVAL = 0.25      # Approx 4 FPS when nothing has moved for a while
+        self.IDLE_AFTER = 5.0          # Seconds without activity before dropping to idle rate
+        self.PROCESS_SIZE = (160, 120)  # Analysis resolution (None = full camera resolution)
+        self.ROIS = []  # Optional (x, y, w, h) regions as fractions of the mirrored frame
+        self.MOTION_ENGINE = "diff"  # "diff", "average" (running background) or "mog2"
+        self.SOURCE = source or os.getenv("VISION_SOURCE", "camera:0")  # See frame_sources.open_source
+        self.FRAME_BUS_SLOTS = 4  # Ring size; readers have slots - 1 frame periods per zero-copy frame
+        self.PERSON_DETECTOR = "hog"  # Motion-gated "hog" / "face" detection, or None
+        self.PERSON_BUDGET = 2.0  # Max person detections per second
+        self.STANDBY_TIMEOUT = 60.0  # Seconds the camera stays open in standby before it is released
+        self.STANDBY_INTERVAL = 1.0  # Baseline refresh period while in standby
+        self.camera_id = camera_id  # Tags events when several cameras are running
+        # Called from the analysis thread as on_event(action, data) instead of
+        # broadcasting on the loop (used by camera worker processes)
+        self.on_event = on_event
+
         # State
-        self.prev_gray = None
+        self.detector = None
         self.last_motion_time = 0
-        
+        self.duty = None
+        self.person = None
+        self.latency = 0.0  # Smoothed capture -> analysis-done time in seconds
+        self.ready_latency = None  # Seconds from the last start() to its first analysed frame
+        self._requested_at = None
+        self._warm = False
+
         self.cap = None
-        self.running = False
+        self.loop = None
+        # Per-run stop flag, analysis (vs standby) flag and frame bus, so a run
+        # that is still shutting down can't interfere with the next one
+        self._stop = None
+        self._active = None
+        self._frames = None
+        self._capture_thread = None
+        self._analysis_thread = None
+
+    @property
+    def running(self):
+        """True while the camera is held open (analysing or on standby)."""
+        return self._stop is not None and not self._stop.is_set()
+
+    @property
+    def state(self):
+        if not self.running:
+            return "off"
+        return "active" if self._active.is_set() else "standby"
 
-    async def camera_loop_async(self, loop: asyncio.AbstractEventLoop):
-        """Main camera processing loop (async version)"""
+    def _open_camera(self):
+        """Opens the camera (blocking). Returns True on success."""
+        # CAMERA GUARD: Don't reopen if already open
+        if self.cap and self.cap.isOpened():
+            print("📸 Camera already open - using existing stream")
+            return True
+
+        print(f"📸 Attempting to open camera ({self.SOURCE})...")
         try:
-            # CAMERA GUARD: Don't reopen if already open
-            if self.cap and self.cap.isOpened():
-                print("📸 Camera already open - using existing stream")
-                self.running = True
-            else:
-                print("📸 Attempting to open camera...")
-                self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-                if not self.cap.isOpened():
-                    print("❌ Cannot open camera - trying without CAP_DSHOW...")
-                    self.cap = cv2.VideoCapture(0)
-                    if not self.cap.isOpened():
-                        print("❌ Cannot open camera - no camera found!")
-                        return
-
-                print("📸 Camera opened successfully")
-                self.running = True
-
-            while self.running:
-                ret, frame = self.cap.read()
+            self.cap = open_source(self.SOURCE)
+        except ValueError as e:
+            print(f"❌ Cannot open camera - {e}")
+            return False
+        if not self.cap.isOpened():
+            print("❌ Cannot open camera - no camera found!")
+            self.cap = None
+            return False
+
+        print("📸 Camera opened successfully")
+        return True
+
+    def _capture_loop(self, stop, frames, previous, analysis):
+        """Capture thread: reads frames as fast as the camera delivers them and publishes them on the bus."""
+        # Let a still-exiting capture thread from the last run release the device first
+        if previous and previous.is_alive():
+            previous.join()
+        try:
+            if stop.is_set() or not self._open_camera():
+                return
+
+            while not stop.is_set():
+                # Grab every frame so the driver buffer never goes stale, but only
+                # decode one when a subscriber is actually waiting for it
+                if not self.cap.grab():
+                    print("⚠️ Failed to read frame from camera")
+                    break
+                if frames.allocated and not frames.wanted:
+                    continue
+                ret, frame = self.cap.retrieve()
                 if not ret:
                     print("⚠️ Failed to read frame from camera")
                     break
+                frames.publish(frame, time.time())
 
-                # 1. Preprocessing
-                frame = cv2.flip(frame, 1)
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                gray = cv2.GaussianBlur(gray, (21, 21), 0)
+        except Exception as e:
+            print(f"❌ Camera loop error: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            stop.set()
+            frames.close()
+            if self.cap:
+                self.cap.release()
+                self.cap = None
+                print("📸 Camera released")
+            # The analysis thread holds views into the bus until it exits
+            analysis.join(2.0)
+            frames.release()
+
+    def _analysis_loop(self, stop, frames, active):
+        """Analysis thread: motion detection on the latest frame only."""
+        seq = 0
+        detector = self.detector = MotionDetector(
+            self.MOTION_ENGINE, self.PROCESS_SIZE, self.ROIS,
+            self.MOTION_THRESHOLD, self.MOTION_COOLDOWN)
+        detector.last_event = self.last_motion_time
+        duty = self.duty
+        person = self.person = self._create_person_detector()
+        try:
+            while not stop.is_set():
+                if not active.is_set():
+                    seq = self._standby(stop, frames, active, detector, seq)
+                    continue
+
+                started = time.monotonic()
+                # No event can be emitted during cooldown, so don't analyse at all
+                cooldown_left = detector.cooldown_left(time.time())
+                if cooldown_left > 0:
+                    detector.skip()
+                    stop.wait(duty.update(cooldown_left))
+                    continue
 
-                # Initialize previous frame if needed
-                if self.prev_gray is None:
-                    self.prev_gray = gray
+                frame, seq, captured_at = frames.read(seq)
+                if frame is None:
                     continue
+                if self._requested_at is not None:
+                    self._report_ready()
+                duty.update()
+                duty.count_frame()
 
-                # 2. Motion Detection (Frame Differencing)
-                # Calculate absolute difference between current frame and previous frame
-                frame_delta = cv2.absdiff(self.prev_gray, gray)
-                # Apply threshold to highlight the differences
-                thresh = cv2.threshold(frame_delta, 25, 255, cv2.THRESH_BINARY)[1]
-                # Dilate the thresholded image to fill in holes
-                thresh = cv2.dilate(thresh, None, iterations=2)
-
-                # Count the number of non-zero pixels (movement)
-                motion_count = cv2.countNonZero(thresh)
-                
-                # 3. Event Triggering with Cooldown
+                # 1-2. Preprocess (downscaled mirror/gray/blur) and run the motion engine
                 now = time.time()
-                if motion_count > self.MOTION_THRESHOLD:
-                    if now - self.last_motion_time > self.MOTION_COOLDOWN:
-                        print(f"🎬 Motion Detected: val={motion_count}")
-                        try:
-                            await broadcast_action("motion_detected")
-                        except Exception as e:
-                            print(f"⚠️ Failed to broadcast motion event: {e}")
-                        self.last_motion_time = now
-
-                # 4. Update previous frame and sleep
-                self.prev_gray = gray
-                
-                # No video streaming to reduce overhead
-                await asyncio.sleep(0.03) # Approx 30 FPS processing
+                with VISION_STAGE.labels(stage="motion").time():
+                    motion, event = detector.process(frame, now)
+
+                # 3. Event Triggering (the detector applies threshold and cooldown)
+                if motion > self.MOTION_THRESHOLD * 0.5:
+                    duty.activity()  # Ramp up before the threshold is crossed
+                if event:
+                    print(f"🎬 Motion Detected: val={motion:.2%}")
+                    event["captured_at"] = captured_at
+                    if self.camera_id is not None:
+                        event["camera_id"] = self.camera_id
+                    self._emit("motion_detected", event)
+                    self.last_motion_time = now
+
+                    # Cascade: the heavier detector only looks where motion fired
+                    people = None
+                    if person:
+                        with VISION_STAGE.labels(stage="person").time():
+                            people = person(frame, event["regions"])
+                    if people and people["count"]:
+                        print(f"🧍 Person Detected: count={people['count']}")
+                        people["captured_at"] = captured_at
+                        if self.camera_id is not None:
+                            people["camera_id"] = self.camera_id
+                        self._emit("person_detected", people)
+                self.latency += 0.1 * ((time.time() - captured_at) - self.latency)
+
+                # 4. Pace the loop at the current duty level
+                del frame  # Don't pin a bus slot while sleeping
+                remaining = duty.update() - (time.monotonic() - started)
+                if remaining > 0:
+                    stop.wait(remaining)
 
         except Exception as e:
-            print(f"❌ Camera loop error: {e}")
+            print(f"❌ Motion analysis error: {e}")
             import traceback
             traceback.print_exc()
         finally:
-            if self.cap:
-                self.cap.release()
-                print("📸 Camera released")
+            r = duty.report()
+            print(f"👁️ Vision duty cycle: {r['effective_fps']} fps effective, "
+                  f"seconds per level {r['seconds']}")
+
+    def _standby(self, stop, frames, active, detector, seq):
+        """
+        Analysis paused with the camera still open. The engine's baseline is refreshed
+        at a trickle so resuming needs no re-initialisation; after STANDBY_TIMEOUT
+        the run ends and the camera is released. Returns the last frame seq.
+        """
+        self.duty.standby()
+        since = time.monotonic()
+        while not active.is_set() and not stop.is_set():
+            if time.monotonic() - since > self.STANDBY_TIMEOUT:
+                print(f"👁️ Standby for {self.STANDBY_TIMEOUT:g}s - releasing camera")
+                stop.set()
+                frames.close()
+                break
+            frame, seq, _ = frames.read(seq, timeout=self.STANDBY_INTERVAL)
+            if frame is not None:
+                detector.refresh(frame)
+                del frame
+            active.wait(self.STANDBY_INTERVAL)
+        self.duty.activity()  # Resume at full rate
+        return seq
+
+    def _report_ready(self):
+        self.ready_latency = time.perf_counter() - self._requested_at
+        self._requested_at = None
+        kind = "warm" if self._warm else "cold"
+        print(f"👁️ Vision ready in {self.ready_latency * 1000:.0f} ms ({kind} start)")
+
+    def _create_person_detector(self):
+        if not self.PERSON_DETECTOR:
+            return None
+        try:
+            return PersonDetector(self.PERSON_DETECTOR, self.PERSON_BUDGET)
+        except (KeyError, RuntimeError) as e:
+            print(f"⚠️ Person detection disabled ({self.PERSON_DETECTOR}): {e}")
+            return None
+
+    def stats(self):
+        """Duty-cycle report for the current (or last) run, or None if never started."""
+        if not self.duty:
+            return None
+        report = self.duty.report()
+        report["latency_ms"] = round(self.latency * 1000, 1)
+        report["frame_bus"] = self._frames.name if self._frames else None
+        report["person"] = self.person.stats() if self.person else None
+        report["state"] = self.state
+        report["ready_ms"] = round(self.ready_latency * 1000, 1) if self.ready_latency is not None else None
+        return report
+
+    def _emit(self, action_name, data=None):
+        """Thread-safe: hands the event to on_event, or schedules a broadcast on the loop."""
+        if self.on_event:
+            self.on_event(action_name, data)
+        elif self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._broadcast, action_name, data)
 
-    def start(self, loop: asyncio.AbstractEventLoop):
-        """Start the vision component"""
+    def _broadcast(self, action_name, data=None):
+        # Runs on the event loop
+        task = asyncio.ensure_future(broadcast_action(action_name, data))
+        task.add_done_callback(self._log_broadcast_error)
+
+    @staticmethod
+    def _log_broadcast_error(task):
+        if not task.cancelled() and task.exception():
+            print(f"⚠️ Failed to broadcast motion event: {task.exception()}")
+
+    def start(self, loop: asyncio.AbstractEventLoop = None):
+        """Start the vision component, or resume it from standby (loop may be None when on_event is set)"""
         if self.running:
-            print("⚠️ Vision component already running")
+            if self._active.is_set():
+                print("⚠️ Vision component already running")
+                return
+            print("👁️ Resuming vision from standby (camera already open)")
+            self.loop = loop or self.loop
+            self._requested_at, self._warm = time.perf_counter(), True
+            self._active.set()
             return
         print("👁️ Starting motion-based vision component...")
-        self.prev_gray = None # Reset state on start
-        asyncio.create_task(self.camera_loop_async(loop))
+        self.loop = loop
+        self._requested_at, self._warm = time.perf_counter(), False
+        self.detector = None # Reset state on start (the analysis thread builds a fresh detector)
+        self.duty = DutyCycle(self.PROCESS_INTERVAL, self.IDLE_INTERVAL, self.IDLE_AFTER)
+        self.latency = 0.0
+        self._stop = threading.Event()
+        self._active = threading.Event()
+        self._active.set()
+        self._frames = FrameBus(self.FRAME_BUS_SLOTS)  # Allocated on the first frame
+
+        previous = self._capture_thread
+        self._analysis_thread = threading.Thread(
+            target=self._analysis_loop, args=(self._stop, self._frames, self._active),
+            name="VisionAnalysis", daemon=True)
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, args=(self._stop, self._frames, previous, self._analysis_thread),
+            name="VisionCapture", daemon=True)
+        self._capture_thread.start()
+        self._analysis_thread.start()
+
+    def join(self, timeout=None):
+        """Waits for the current run's threads to finish (the camera is released by then)."""
+        for thread in (self._analysis_thread, self._capture_thread):
+            if thread:
+                thread.join(timeout)
+
+    def standby(self):
+        """Pauses analysis but keeps the camera open for STANDBY_TIMEOUT seconds,
+        so the next start() resumes without reopening the device."""
+        if self.state != "active":
+            return
+        self._active.clear()
+        print(f"👁️ Vision on standby (camera kept open for {self.STANDBY_TIMEOUT:g}s)")
 
     def stop(self):
-        """Stop the vision component"""
-        self.running = False
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        """Stop the vision component and release the camera"""
+        # The capture thread releases the camera once its current read returns
+        if self._stop:
+            self._stop.set()
+            self._frames.close()
         print("👁️ Vision component stopped")
@@ -1,6 +1,5 @@
 import os
 import time
-import math
 import wave
 import asyncio
 import requests
@@ -12,6 +11,7 @@ from gtts import gTTS
 from dotenv import load_dotenv
 
 from server.components.websocket import broadcast_speak, broadcast_error, broadcast_state
+from server.core.vad import EnergyVAD, frame_rms
 
 load_dotenv()
 
@@ -33,6 +33,7 @@ class VoiceComponent:
         
         self.audio = None
         self.recognizer = sr.Recognizer()
+        self.vad = EnergyVAD(self.SILENCE_THRESHOLD, self.MIN_ENERGY_THRESHOLD)
         self._executor = ThreadPoolExecutor(max_workers=5)
         
         self.running = False
@@ -53,8 +54,7 @@ class VoiceComponent:
 
     def _is_silent(self, data):
         if not data: return True
-        rms = math.sqrt(sum(x*x for x in data)/len(data))
-        return rms < self.SILENCE_THRESHOLD
+        return self.vad.is_silent(frame_rms(data))
 
     def _record_sync(self):
         if not self.audio or not self.active: return None
@@ -72,16 +72,18 @@ class VoiceComponent:
             
             while self.running and self.active:
                 data = stream.read(self.CHUNK, exception_on_overflow=False)
-                audio_data = [int.from_bytes(data[i:i+2], 'little', signed=True) for i in range(0, len(data), 2)]
-                rms = math.sqrt(sum(x*x for x in audio_data)/len(audio_data)) if audio_data else 0
+                rms = frame_rms(data)
                 
-                if not started and rms > self.MIN_ENERGY_THRESHOLD:
-                    started = True
-                    print("🗣️ Speech detected")
+                if not started:
+                    if self.vad.is_speech(rms):
+                        started = True
+                        print("🗣️ Speech detected")
+                    else:
+                        self.vad.observe_ambient(rms)
                 
                 if started:
                     frames.append(data)
-                    if rms < self.SILENCE_THRESHOLD:
+                    if self.vad.is_silent(rms):
                         silent_chunks += 1
                     else:
                         silent_chunks = 0
@@ -2,27 +2,181 @@
 WebSocket Component - Minimalist handler.
 Parses JSON and forwards to EventRouter.
 FIXED: type + action routing & debug support
+
+Audio transport: clients get a URL to fetch over HTTP by default. A client that
+sends {"type": "hello", "audio_transport": "binary"} after connecting receives
+audio over this socket instead: the usual "speak" JSON (with transport/stream_id),
+then binary frames of [16-byte stream id][uint32 seq][payload], then an
+{"type": "audio_end"} message. A stream is never thinned out: when a client's
+queue is full the stream waits for it (up to MAX_CLIENT_LAG) instead of dropping chunks.
 """
 
+import time
 import asyncio
+import struct
+import uuid
+import itertools
 import websockets
 import json
 import logging
+from collections import deque
+
+from server.core import metrics
 
 logger = logging.getLogger("WebSocket")
-clients = set()
+clients = {}  # ws -> ClientConnection
 event_router = None
 
+# Outbound fan-out: every client has its own bounded queue and writer task,
+# so one stalled display can't delay messages to the others.
+SEND_QUEUE_SIZE = 64
+MAX_CLIENT_LAG = 5.0  # Seconds the oldest queued message may wait before the client is dropped
+COALESCE_TYPES = {"state", "metrics"}  # Only the newest of these matters once a queue is full
+LOSSY_TYPES = {"debug", "video", "metrics"}  # Dropped first when a queue is full
+
+AUDIO_TRANSPORTS = ("http", "binary")
+AUDIO_FRAME_HEADER = struct.Struct("!16sI")
+AUDIO_CHUNK_SIZE = 16 * 1024
+_audio_tasks = set()
+
+BROADCAST_TIME = metrics.histogram(
+    "hologram_ws_broadcast_seconds", "Time to serialize and queue a message for every client", ("type",))
+
 
 def set_event_router(router):
     global event_router
     event_router = router
 
 
+class ClientConnection:
+    """Outbound side of one WebSocket: a bounded message queue drained by its own writer task."""
+    _ids = itertools.count(1)
+
+    def __init__(self, ws, maxsize=SEND_QUEUE_SIZE, max_lag=MAX_CLIENT_LAG):
+        self.id = next(self._ids)
+        self.ws = ws
+        self.maxsize = maxsize
+        self.max_lag = max_lag
+        self.audio_transport = "http"  # Negotiated via "hello"
+        self.queue = deque()  # (kind, payload, enqueued_at)
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self._inflight_since = None  # Enqueue time of the message being sent right now
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()  # Set whenever the writer takes a message
+        self._writer = asyncio.create_task(self._write_loop())
+
+    @property
+    def depth(self):
+        return len(self.queue)
+
+    @property
+    def lag(self):
+        """Age in seconds of the oldest message not yet delivered to the socket."""
+        oldest = self._inflight_since or (self.queue[0][2] if self.queue else None)
+        return time.monotonic() - oldest if oldest else 0.0
+
+    def enqueue(self, payload, kind=None):
+        """Queues a message without blocking. Returns False if it was dropped."""
+        if self.closed:
+            return False
+        if self.lag > self.max_lag:
+            logger.warning(f"🐢 Client {self.id} lagging {self.lag:.1f}s behind, disconnecting")
+            self.close()
+            return False
+
+        if len(self.queue) >= self.maxsize and not self._make_room(kind):
+            self.dropped += 1
+            return False
+
+        self.queue.append((kind, payload, time.monotonic()))
+        self._wakeup.set()
+        return True
+
+    async def put(self, payload, kind=None):
+        """
+        Like enqueue(), but waits for room instead of dropping the message, for
+        streams that break with a gap (binary audio). Returns False if the client
+        closed or fell more than max_lag behind (it is disconnected then).
+        """
+        while not self.closed and len(self.queue) >= self.maxsize and not self._make_room(kind):
+            if self.lag > self.max_lag:
+                break  # enqueue() disconnects it
+            self._drained.clear()
+            try:
+                await asyncio.wait_for(self._drained.wait(), self.max_lag)
+            except asyncio.TimeoutError:
+                pass
+        return self.enqueue(payload, kind)
+
+    def _make_room(self, kind):
+        # 1. A newer message of a coalesced type supersedes queued ones
+        if kind in COALESCE_TYPES:
+            stale = [item for item in self.queue if item[0] == kind]
+            for item in stale:
+                self.queue.remove(item)
+            self.coalesced += len(stale)
+            if stale:
+                return True
+        # 2. Sacrifice the oldest lossy message
+        for item in self.queue:
+            if item[0] in LOSSY_TYPES:
+                self.queue.remove(item)
+                self.dropped += 1
+                return True
+        return False
+
+    async def _write_loop(self):
+        try:
+            while True:
+                while not self.queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                _, payload, self._inflight_since = self.queue.popleft()
+                self._drained.set()
+                await self.ws.send(payload)
+                self._inflight_since = None
+        except asyncio.CancelledError:
+            pass
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.error(f"Client {self.id} writer error: {e}")
+        finally:
+            self.closed = True
+            clients.pop(self.ws, None)
+            self._drained.set()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        clients.pop(self.ws, None)
+        self._drained.set()
+        self._writer.cancel()
+        asyncio.create_task(self.ws.close(code=1013, reason="Client too slow"))
+
+
+def client_stats():
+    """Per-client queue metrics (depth, lag, drops) keyed by client ID."""
+    return {
+        conn.id: {
+            "depth": conn.depth,
+            "lag": round(conn.lag, 3),
+            "dropped": conn.dropped,
+            "coalesced": conn.coalesced,
+            "audio_transport": conn.audio_transport,
+        }
+        for conn in list(clients.values())
+    }
+
+
 async def handler(ws):
     """Handle new WebSocket connection"""
     logger.info(f"🔌 Connection attempt... Total: {len(clients)}")
-    clients.add(ws)
+    conn = ClientConnection(ws)
+    clients[ws] = conn
 
     try:
         async for message in ws:
@@ -32,6 +186,11 @@ async def handler(ws):
                 msg_type = data.get("type")
                 action = data.get("action")
 
+                # Protocol negotiation is handled here, not by the EventRouter
+                if msg_type == "hello":
+                    _negotiate(conn, data)
+                    continue
+
                 logger.info(
                     f"[WS IN] type={msg_type} action={action} payload={data}"
                 )
@@ -47,9 +206,8 @@ async def handler(ws):
                 else:
                     event_name = msg_type
 
-                asyncio.create_task(
-                    event_router.dispatch(event_name, data)
-                )
+                # Queued: the router bounds, prioritizes and coalesces dispatch
+                event_router.submit(event_name, data)
 
             except json.JSONDecodeError:
                 logger.error(f"Invalid JSON received: {message}")
@@ -62,38 +220,52 @@ async def handler(ws):
         pass
 
     finally:
-        clients.discard(ws)
+        clients.pop(ws, None)
+        conn.closed = True
+        conn._writer.cancel()
         logger.info(f"❌ Disconnected. Remaining: {len(clients)}")
 
         if not clients and event_router:
-            asyncio.create_task(
-                event_router.dispatch("internal_disconnect", {})
-            )
+            event_router.submit("internal_disconnect", {})
+
+
+def _negotiate(conn, data):
+    transport = data.get("audio_transport", "http")
+    if transport not in AUDIO_TRANSPORTS:
+        transport = "http"
+    conn.audio_transport = transport
+    logger.info(f"🤝 Client negotiated audio transport: {transport}")
+    conn.enqueue(json.dumps({"type": "hello_ack", "audio_transport": transport}), "hello_ack")
 
 
 # =========================
 # BROADCAST HELPERS
 # =========================
 
+def _send_to(targets, msg, kind=None):
+    """Fans a message out to each target's queue; never waits on a slow client."""
+    for conn in targets:
+        conn.enqueue(msg, kind)
+
+
+async def _stream_to(targets, msg, kind):
+    """Queues a message on every target without dropping it, waiting for full queues."""
+    await asyncio.gather(*(conn.put(msg, kind) for conn in targets))
+
+
 async def broadcast_message(message_dict: dict):
     if not clients:
         return
 
-    msg = json.dumps(message_dict)
-    disconnected = []
-
-    for c in list(clients):
-        try:
-            await c.send(msg)
-        except Exception:
-            disconnected.append(c)
-
-    for c in disconnected:
-        clients.discard(c)
+    kind = message_dict.get("type")
+    with BROADCAST_TIME.labels(type=kind).time():
+        _send_to(list(clients.values()), json.dumps(message_dict), kind)
 
 
-async def broadcast_action(action_name: str):
+async def broadcast_action(action_name: str, data: dict = None):
+    """Extra data (e.g. motion regions and centroid) is merged into the message."""
     await broadcast_message({
+        **(data or {}),
         "type": "action",
         "action": action_name
     })
@@ -106,14 +278,75 @@ async def broadcast_state(value: str):
     })
 
 
-async def broadcast_speak(audio_path: str, duration: float, text: str = None):
-    await broadcast_message({
+async def broadcast_speak(audio_path: str, duration: float, text: str = None,
+                          audio=None, mime: str = "audio/mpeg"):
+    """
+    Tells clients to play a clip. `audio` (bytes, or an object with an async
+    iter_chunks()) lets binary-transport clients receive it over the socket;
+    everyone else fetches audio_path over HTTP.
+    """
+    message = {
         "type": "action",
         "action": "speak",
         "audio_path": audio_path,
         "duration": duration,
         "text": text
-    })
+    }
+    connections = list(clients.values())
+    binary = []
+    if audio is not None:
+        binary = [c for c in connections if c.audio_transport == "binary"]
+    http = [c for c in connections if c not in binary]
+
+    if http:
+        with BROADCAST_TIME.labels(type="speak").time():
+            _send_to(http, json.dumps(message), "action")
+    if binary:
+        # Progressive sources may take a while; don't hold up the caller
+        task = asyncio.create_task(_send_binary_audio(binary, message, audio, mime))
+        _audio_tasks.add(task)
+        task.add_done_callback(_audio_tasks.discard)
+
+
+async def _iter_audio(audio):
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        view = memoryview(audio)
+        for i in range(0, len(view), AUDIO_CHUNK_SIZE):
+            yield view[i:i + AUDIO_CHUNK_SIZE]
+    else:
+        async for chunk in audio.iter_chunks():
+            view = memoryview(chunk)
+            for i in range(0, len(view), AUDIO_CHUNK_SIZE):
+                yield view[i:i + AUDIO_CHUNK_SIZE]
+
+
+async def _send_binary_audio(targets, message, audio, mime):
+    stream_id = uuid.uuid4()
+    await _stream_to(targets, json.dumps({
+        **message,
+        "transport": "binary",
+        "stream_id": stream_id.hex,
+        "mime": mime
+    }), "action")
+    seq = 0
+    ok = True
+    try:
+        async for chunk in _iter_audio(audio):
+            targets = [c for c in targets if not c.closed]
+            if not targets:
+                return
+            await _stream_to(targets, AUDIO_FRAME_HEADER.pack(stream_id.bytes, seq) + chunk, "audio")
+            seq += 1
+        ok = getattr(audio, "error", None) is None
+    except Exception as e:
+        logger.error(f"Binary audio stream failed: {e}")
+        ok = False
+    await _stream_to([c for c in targets if not c.closed], json.dumps({
+        "type": "audio_end",
+        "stream_id": stream_id.hex,
+        "chunks": seq,
+        "ok": ok
+    }), "audio_end")
 
 
 async def broadcast_error(error_message: str):
@@ -135,13 +368,7 @@ async def broadcast_video_frame(frame_base64: str):
     if not clients:
         return
 
-    msg = json.dumps({
+    _send_to(list(clients.values()), json.dumps({
         "type": "video",
         "data": frame_base64
-    })
-
-    for c in list(clients):
-        try:
-            await c.send(msg)
-        except:
-            clients.discard(c)
+    }), "video")
@@ -1,3 +1,4 @@
+import time
 import logging
 import asyncio
 
@@ -31,12 +32,14 @@ class ModeController:
             return
 
         logger.info(f"🔄 Mode Switch: {self.current_mode} -> {mode}")
+        started = time.perf_counter()
 
-        # Shutdown outgoing
+        # Shutdown outgoing (vision goes to standby: the camera stays open for a
+        # while so switching back doesn't have to reopen the device)
         if self.current_mode == "VOICE":
             await self.vc.stop()
         elif self.current_mode == "VISION":
-            self.vision.stop()
+            self.vision.standby()
 
         self.current_mode = mode
 
@@ -47,6 +50,8 @@ class ModeController:
         elif mode == "VOICE":
             await self.vc.start()
 
+        logger.info(f"⏱️ Mode switch to {mode} took {(time.perf_counter() - started) * 1000:.1f} ms")
+
     async def handle_disconnect(self, payload=None):
         """Handler for 'internal_disconnect' event."""
         # KALICI COZUM: Client disconnect artik pipeline'i oldurmez.
@@ -1,13 +1,10 @@
 import os
 import time
-import math
-import wave
 import asyncio
+import io
 import logging
-import requests
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
-import pyaudio
 import speech_recognition as sr
 from dotenv import load_dotenv
 from elevenlabs.client import ElevenLabs
@@ -16,10 +13,25 @@ import re
 
 from server.components.websocket import broadcast_speak, broadcast_state, broadcast_error, broadcast_message
 from server.core.word_filter import WordFilter
+from server.core.vad import EnergyVAD
+from server.core.audio_archiver import AudioArchiver
+from server.core.audio_capture import MicrophoneCapture
+from server.core.speculation import SpeculationStats, Speculator
+from server.core.gemini_client import GeminiClient, GeminiError
+from server.core.sentence_splitter import SentenceSplitter
+from server.core.tts_cache import TTSCache
+from server.core.audio_store import MemoryAudioStore
+from server.core.audio_streams import AudioStream
+from server.core import metrics
 
 load_dotenv()  # Fallback, though main.py handles it
 logger = logging.getLogger("VoiceController")
 
+# record / stt / gemini / gemini_first_sentence / tts / tts_first_chunk / playback, plus "response":
+# end of the user's utterance to the first reply clip being sent
+VOICE_STAGE = metrics.histogram(
+    "hologram_voice_stage_seconds", "Voice pipeline stage duration", ("stage",))
+
 
 class VoiceController:
     """
@@ -28,13 +40,49 @@ class VoiceController:
     Enforces a childlike, friendly persona.
     """
     CHUNK = 1024
-    FORMAT = pyaudio.paInt16
+    SAMPLE_WIDTH = 2  # Bytes per sample (paInt16)
     CHANNELS = 1
     RATE = 16000
 
     SILENCE_THRESHOLD = 300
     MIN_ENERGY_THRESHOLD = 500
     SILENCE_DURATION = 2.0
+    ADAPTIVE_VAD = True  # Raise thresholds above the measured ambient noise floor
+    PRE_ROLL = 0.3  # Seconds of audio kept before speech onset
+    CAPTURE_BUFFER_SECONDS = 30.0  # Ring buffer size of the always-open mic stream
+    CAPTURE_RETRY_MIN = 0.5  # Seconds before reopening a microphone that failed, doubled per failure
+    CAPTURE_RETRY_MAX = 10.0
+
+    # Speculative endpointing: start STT on a short pause, commit at SILENCE_DURATION
+    SPECULATIVE_ENDPOINTING = True
+    SPECULATIVE_SILENCE = 0.5
+    SPECULATE_LLM = False  # Also draft the Gemini reply during the pause
+
+    # Stream the Gemini reply and speak it sentence by sentence
+    STREAM_RESPONSES = True
+
+    # Canned replies (always part of the pre-synthesized phrase pack)
+    GREETING = "Merhaba! Ben buradayım!"
+    PROFANITY_REPLY = "Lütfen saygı kurallarına uy."
+    ERROR_REPLY = "Hata oluştu, tekrar deneyebilir misin?"
+    CONNECTION_ERROR_REPLY = "Bağlantı hatası."
+
+    # TTS audio cache (content-addressed, LRU in memory and on disk)
+    TTS_CACHE_MEMORY_MB = 16
+    TTS_CACHE_DISK_MB = 256
+    PHRASE_PACK_FILE = "tts_phrases.txt"
+
+    # Serve ElevenLabs audio progressively via /audio/stream/{id} while it is generated
+    STREAM_TTS = True
+
+    # System instructions for personality
+    PERSONA = (
+        "Sen bir hologram asistansın. "
+        "Karakterin: Çocuksu, nazik, arkadaş canlısı, sakin ve sıcak. "
+        "Konuşma tarzın: Kısa cümleler kur, hafif oyunbaz ol ama asla cıvıklaşma. "
+        "Robotik tondan kaçın, insansı ve samimi ol. "
+        "Cevapların kısa ve öz olsun. "
+    )
 
     # ElevenLabs Personality Settings
     VOICE_ID = "MF3mGyEYCl7XYW7LecBy" # "Elli" (child-like)
@@ -46,7 +94,9 @@ class VoiceController:
         use_speaker_boost=True
     )
 
-    def __init__(self, task_manager, audio_dir=None):
+    def __init__(self, task_manager, audio_dir=None, http_session=None, audio_streams=None,
+                 audio_store=None, microphone=True):
+        """microphone=False skips PyAudio entirely (e.g. prebuild_tts.py only needs TTS)."""
         self.tm = task_manager
         self.audio_dir = audio_dir or Path(".audio_cache")
         self.audio_dir.mkdir(exist_ok=True)
@@ -54,6 +104,24 @@ class VoiceController:
         self.recognizer = sr.Recognizer()
         self._executor = ThreadPoolExecutor(max_workers=5)
         
+        # Voice activity detection (thresholds adapt to the room's noise floor)
+        self.vad = EnergyVAD(self.SILENCE_THRESHOLD, self.MIN_ENERGY_THRESHOLD,
+                             adaptive=self.ADAPTIVE_VAD)
+
+        self.speculation_stats = SpeculationStats()
+        self._turn_started = None  # perf_counter() at the end of the current utterance
+
+        self.audio_streams = audio_streams  # AudioStreamRegistry shared with the HTTP server
+        self.audio_store = audio_store or MemoryAudioStore()  # Finished clips served by /audio/{id}
+        self._init_tts()
+
+        # Optional on-disk copies of recordings, written off the critical path
+        self.archiver = None
+        if os.getenv("ARCHIVE_RECORDINGS", "0").strip() == "1":
+            self.archiver = AudioArchiver(self.audio_dir, channels=self.CHANNELS,
+                                          sample_width=self.SAMPLE_WIDTH,
+                                          rate=self.RATE)
+
         # Word Filtering
         self.word_filter = WordFilter()
         
@@ -64,15 +132,27 @@ class VoiceController:
         # API Keys
         self.api_key = os.getenv("GOOGLE_API_KEY", "").strip()
         self.gemini_model = os.getenv("GEMINI_MODEL", "gemini-1.5-flash").strip()
-        self.el_api_key = os.getenv("ELEVENLABS_API_KEY", "").strip()
 
         if self.api_key:
             masked_key = self.api_key[:4] + "..." + self.api_key[-4:]
             logger.info(f"Gemini API Initialized with key: {masked_key} and model: {self.gemini_model}")
         else:
             logger.error("GOOGLE_API_KEY NOT FOUND IN ENVIRONMENT!")
+        # Shared keep-alive HTTP session (owned by main.py)
+        self.gemini = GeminiClient(self.api_key, self.gemini_model, session=http_session)
+
+        self.capture = None
+        self._capture_retry = self.CAPTURE_RETRY_MIN
+        if microphone:
+            self._init_microphone()
 
-        # Initialize ElevenLabs
+    def _init_tts(self):
+        """ElevenLabs client and TTS cache: everything prebuild_phrases() needs."""
+        self.tts_cache = TTSCache(self.audio_dir / "tts_cache",
+                                  memory_budget=self.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+                                  disk_budget=self.TTS_CACHE_DISK_MB * 1024 * 1024)
+
+        self.el_api_key = os.getenv("ELEVENLABS_API_KEY", "").strip()
         if self.el_api_key:
             try:
                 self.el_client = ElevenLabs(api_key=self.el_api_key)
@@ -84,20 +164,40 @@ class VoiceController:
             logger.error("ELEVENLABS_API_KEY NOT FOUND IN ENVIRONMENT!")
             self.el_client = None
 
+    def _init_microphone(self):
         try:
+            import pyaudio  # Imported here so TTS-only use works without PortAudio
             self.audio = pyaudio.PyAudio()
+            self.capture = MicrophoneCapture(
+                self._open_input_stream, chunk=self.CHUNK,
+                sample_width=self.SAMPLE_WIDTH,
+                rate=self.RATE, channels=self.CHANNELS,
+                buffer_seconds=self.CAPTURE_BUFFER_SECONDS)
         except Exception as e:
             logger.error(f"PyAudio initialization failed: {e}")
 
+    def _open_input_stream(self):
+        return self.audio.open(format=self.audio.get_format_from_width(self.SAMPLE_WIDTH),
+                               channels=self.CHANNELS,
+                               rate=self.RATE, input=True, frames_per_buffer=self.CHUNK)
+
     async def start(self, payload=None):
         """Starts the voice pipeline via TaskManager."""
         self.is_first_interaction = True # Reset on start
+        if self.capture:
+            # Open the microphone once; it stays open across listening turns
+            try:
+                await self._run_in_executor(self.capture.start)
+            except Exception as e:
+                logger.error(f"Microphone open failed: {e}")
         await self.tm.start("voice_pipeline", self.run_pipeline_loop())
 
     async def stop(self, payload=None):
         """Stops the voice pipeline via TaskManager."""
         self.is_running = False
         await self.tm.cancel("voice_pipeline")
+        if self.capture:
+            await self._run_in_executor(self.capture.stop)
 
     async def _run_in_executor(self, func, *args):
         try:
@@ -107,205 +207,411 @@ class VoiceController:
             logger.info("Executor task cancelled.")
             raise
 
-    def _record_sync(self):
-        """Blocking microphone recording with silence detection and timeouts."""
-        if not self.audio or not self.is_running:
+    async def _reopen_capture(self):
+        """
+        Reopens the microphone after its capture thread died (e.g. the device
+        was unplugged), waiting longer after each failure. Returns True if it is running again.
+        """
+        error = self.capture.error
+        logger.warning(f"🎙️ Microphone capture stopped ({error or 'not open'}), reopening in {self._capture_retry:g}s")
+        if self._capture_retry == self.CAPTURE_RETRY_MIN:
+            await broadcast_error("Microphone disconnected, reconnecting")
+        await asyncio.sleep(self._capture_retry)
+        self._capture_retry = min(self._capture_retry * 2, self.CAPTURE_RETRY_MAX)
+        if not self.is_running:
+            return False
+        try:
+            await self._run_in_executor(self.capture.start)
+        except Exception as e:
+            logger.error(f"Microphone reopen failed: {e}")
+            return False
+        return self.capture.running
+
+    def _record_sync(self, speculator=None):
+        """Blocking utterance capture from the always-open microphone stream.
+        Returns the utterance as in-memory sr.AudioData, or None."""
+        if not self.capture or not self.capture.running or not self.is_running:
             return None
-        stream = None
         try:
-            stream = self.audio.open(format=self.FORMAT, channels=self.CHANNELS,
-                                     rate=self.RATE, input=True, frames_per_buffer=self.CHUNK)
-            frames = []
-            started = False
-            silent_chunks = 0
-            max_silent = int(self.SILENCE_DURATION * self.RATE / self.CHUNK)
-
-            # 10 seconds to start speaking
-            max_initial_wait = int(10.0 * self.RATE / self.CHUNK)
-            # 20 seconds total max
-            max_total_duration = int(20.0 * self.RATE / self.CHUNK)
-
-            ticks = 0
-            logger.info("🎤 Microphone listening...")
-
-            while ticks < max_total_duration and self.is_running:
-                ticks += 1
-                try:
-                    data = stream.read(self.CHUNK, exception_on_overflow=False)
-                except Exception as e:
-                    logger.error(f"Stream read error: {e}")
-                    break
-
-                audio_data = [int.from_bytes(
-                    data[i:i+2], 'little', signed=True) for i in range(0, len(data), 2)]
-                rms = math.sqrt(sum(x*x for x in audio_data) /
-                                len(audio_data)) if audio_data else 0
-
-                if not started:
-                    if rms > self.MIN_ENERGY_THRESHOLD:
-                        started = True
-                        logger.info("🗣️ Speech started")
-                    elif ticks > max_initial_wait:
-                        return None
-
-                if started:
-                    frames.append(data)
-                    if rms < self.SILENCE_THRESHOLD:
-                        silent_chunks += 1
-                    else:
-                        silent_chunks = 0
-
-                    if silent_chunks > max_silent:
-                        logger.info("🤫 Silence detected, stopping recording")
-                        break
-
-            if len(frames) < 10:
+            pcm = self.capture.record_utterance(
+                self.vad,
+                silence_duration=self.SILENCE_DURATION,
+                pre_roll=self.PRE_ROLL,
+                initial_timeout=10.0,  # 10 seconds to start speaking
+                max_duration=20.0,     # 20 seconds total max
+                is_running=lambda: self.is_running,
+                speculative_silence=self.SPECULATIVE_SILENCE if speculator else None,
+                on_pause=speculator.on_pause if speculator else None,
+                on_resume=speculator.on_resume if speculator else None)
+            if pcm is None:
                 return None
 
-            path = self.audio_dir / f"rec_{int(time.time())}.wav"
-            wf = wave.open(str(path), 'wb')
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
-            wf.setframerate(self.RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
-            return path
+            if self.archiver:
+                self.archiver.submit(pcm)
+            return sr.AudioData(pcm, self.RATE, self.capture.sample_width)
         except Exception as e:
             logger.error(f"Recording error: {e}")
             return None
-        finally:
-            if stream:
-                try:
-                    stream.stop_stream()
-                    stream.close()
-                except:
-                    pass
-
-    def _stt_sync(self, path):
+
+    def _stt_sync(self, audio):
         try:
-            with sr.AudioFile(str(path)) as source:
-                audio = self.recognizer.record(source)
-            return self.recognizer.recognize_google(audio, language='tr-TR')
+            with VOICE_STAGE.labels(stage="stt").time():
+                return self.recognizer.recognize_google(audio, language='tr-TR')
         except Exception as e:
             logger.warning(f"STT Error: {e}")
             return None
 
-    def _gemini_sync(self, prompt):
-        url = f"https://generativelanguage.googleapis.com/v1/models/{self.gemini_model}:generateContent?key={self.api_key}"
-        
-        # System instructions for personality
-        system_instruction = (
-            "Sen bir hologram asistansın. "
-            "Karakterin: Çocuksu, nazik, arkadaş canlısı, sakin ve sıcak. "
-            "Konuşma tarzın: Kısa cümleler kur, hafif oyunbaz ol ama asla cıvıklaşma. "
-            "Robotik tondan kaçın, insansı ve samimi ol. "
-            "Cevapların kısa ve öz olsun. "
-        )
-        
-        body = {"contents": [
-            {"parts": [{"text": f"{system_instruction}\n\nKullanıcı: {prompt}"}]}]}
+    async def _speculate(self, pcm):
+        """
+        Speculative work on a pause: STT, plus a Gemini draft if SPECULATE_LLM.
+        None if STT returned no text, so the pipeline reruns it on the full utterance.
+        """
+        audio = sr.AudioData(pcm, self.RATE, self.capture.sample_width)
+        text = await self._run_in_executor(self._stt_sync, audio)
+        if not text:
+            return None
+        draft = None
+        if (text and self.SPECULATE_LLM and not self.is_first_interaction
+                and not self.word_filter.contains_profanity(text)):
+            draft = await self._gemini(text)
+        return text, draft
+
+    def _build_prompt(self, prompt):
+        return f"{self.PERSONA}\n\nKullanıcı: {prompt}"
+
+    async def _gemini(self, prompt):
         try:
-            resp = requests.post(url, json=body, timeout=10)
-            if resp.status_code == 200:
-                return resp.json()['candidates'][0]['content']['parts'][0]['text']
-            logger.error(f"Gemini API Error {resp.status_code}: {resp.text}")
-            return "Hata oluştu, tekrar deneyebilir misin?"
+            with VOICE_STAGE.labels(stage="gemini").time():
+                return await self.gemini.generate(self._build_prompt(prompt))
+        except asyncio.CancelledError:
+            raise
+        except GeminiError as e:
+            logger.error(str(e))
+            return self.ERROR_REPLY
         except Exception as e:
             logger.error(f"Gemini Request failed: {e}")
-            return "Bağlantı hatası."
+            return self.CONNECTION_ERROR_REPLY
+
+    async def _gemini_sentences(self, prompt):
+        """Streams the reply, censored as it arrives, and yields it one complete sentence at a time."""
+        splitter = SentenceSplitter()
+        censor = self.word_filter.streaming()
+        emitted = False
+        started = time.perf_counter()
+        try:
+            async for fragment in self.gemini.stream(self._build_prompt(prompt)):
+                for sentence in splitter.feed(censor.feed(fragment)):
+                    if not emitted:
+                        VOICE_STAGE.labels(stage="gemini_first_sentence").observe(time.perf_counter() - started)
+                    emitted = True
+                    yield sentence
+            for sentence in splitter.feed(censor.flush()):
+                yield sentence
+            rest = splitter.flush()
+            if rest:
+                yield rest
+            VOICE_STAGE.labels(stage="gemini").observe(time.perf_counter() - started)
+            if censor.censored:
+                logger.info("🔒 AI response was censored")
+        except asyncio.CancelledError:
+            raise
+        except GeminiError as e:
+            logger.error(str(e))
+            if not emitted:
+                yield self.ERROR_REPLY
+        except Exception as e:
+            logger.error(f"Gemini stream failed: {e}")
+            if not emitted:
+                yield self.CONNECTION_ERROR_REPLY
+
+    def _tts_key(self, text):
+        return TTSCache.make_key(text, self.VOICE_ID, self.EL_MODEL, self.VOICE_SETTINGS)
+
+    def _elevenlabs_chunks(self, text):
+        return self.el_client.text_to_speech.convert(
+            text=text,
+            voice_id=self.VOICE_ID,
+            model_id=self.EL_MODEL,
+            voice_settings=self.VOICE_SETTINGS
+        )
+
+    def _synthesize_elevenlabs(self, text):
+        # Combine generator bytes
+        return b"".join(self._elevenlabs_chunks(text))
+
+    def _store_clip(self, audio_bytes, prefix):
+        """Puts a finished clip in the audio store and returns its ID."""
+        return self.audio_store.put(audio_bytes, prefix, ".mp3")
 
     def _tts_sync(self, text):
+        key = self._tts_key(text)
+        cached = self.tts_cache.get(key)
+        if cached is not None:
+            logger.info(f"🗂️ TTS cache hit for: '{text[:30]}...'")
+            return self._store_clip(cached, "el")
+
         if not self.el_client:
             logger.warning("Falling back to gTTS (ElevenLabs client not initialized)")
             return self._gtts_fallback(text)
             
         try:
             logger.info(f"Generating ElevenLabs audio for: '{text[:30]}...'")
-            audio_generator = self.el_client.text_to_speech.convert(
-                text=text,
-                voice_id=self.VOICE_ID,
-                model_id=self.EL_MODEL,
-                voice_settings=self.VOICE_SETTINGS
-            )
-            
-            # Combine generator bytes
-            audio_bytes = b"".join(audio_generator)
-            
-            path = self.audio_dir / f"el_{int(time.time())}.mp3"
-            with open(path, "wb") as f:
-                f.write(audio_bytes)
-                
-            return path
+            audio_bytes = self._synthesize_elevenlabs(text)
+            self.tts_cache.put(key, audio_bytes)
+            return self._store_clip(audio_bytes, "el")
         except Exception as e:
             logger.error(f"ElevenLabs TTS Error: {e}")
             return self._gtts_fallback(text)
 
-    def _gtts_fallback(self, text):
+    def load_phrase_pack(self):
+        """Canned replies plus the phrases listed in PHRASE_PACK_FILE (or $TTS_PHRASES_FILE)."""
+        phrases = [self.GREETING, self.PROFANITY_REPLY, self.ERROR_REPLY, self.CONNECTION_ERROR_REPLY]
+        path = Path(os.getenv("TTS_PHRASES_FILE", "").strip() or self.PHRASE_PACK_FILE)
+        if not path.is_absolute():
+            path = Path(__file__).parent.parent / path
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                phrases += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        else:
+            logger.warning(f"Phrase pack not found at {path}, using built-in phrases only.")
+        return list(dict.fromkeys(phrases))
+
+    def prebuild_phrases(self, phrases=None):
+        """Blocking: synthesizes any uncached phrase of the pack into the TTS cache."""
+        if not self.el_client:
+            logger.warning("Skipping TTS pre-synthesis (ElevenLabs client not initialized)")
+            return 0
+        built = 0
+        for phrase in phrases or self.load_phrase_pack():
+            key = self._tts_key(phrase)
+            if key in self.tts_cache:
+                continue
+            try:
+                self.tts_cache.put(key, self._synthesize_elevenlabs(phrase))
+                built += 1
+            except Exception as e:
+                logger.error(f"Pre-synthesis failed for '{phrase[:30]}': {e}")
+        logger.info(f"🗂️ Phrase pack ready ({built} newly synthesized)")
+        return built
+
+    def _tts_stream_sync(self, text, key, stream):
+        """Blocking: feeds ElevenLabs chunks into an AudioStream as they arrive,
+        then persists the complete clip to the TTS cache."""
+        chunks = []
+        started = time.perf_counter()
+        try:
+            logger.info(f"Streaming ElevenLabs audio for: '{text[:30]}...'")
+            for chunk in self._elevenlabs_chunks(text):
+                if not chunks:
+                    VOICE_STAGE.labels(stage="tts_first_chunk").observe(time.perf_counter() - started)
+                chunks.append(chunk)
+                stream.feed_threadsafe(chunk)
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS Error: {e}")
+            if chunks:
+                stream.finish_threadsafe(e)
+                return
+            # Nothing sent yet, so the client can still get a complete fallback clip
+            fallback = self._gtts_bytes(text)
+            if not fallback:
+                stream.finish_threadsafe(e)
+                return
+            stream.feed_threadsafe(fallback)
+            stream.finish_threadsafe()
+            return
+        VOICE_STAGE.labels(stage="tts").observe(time.perf_counter() - started)
+        stream.finish_threadsafe()
+        self.tts_cache.put(key, b"".join(chunks))
+
+    def _gtts_bytes(self, text):
+        # Fallback audio is not cached: it doesn't match the configured voice
         from gtts import gTTS
         try:
-            path = self.audio_dir / f"fb_{int(time.time())}.mp3"
-            tts = gTTS(text=text, lang='tr')
-            tts.save(str(path))
-            return path
+            buf = io.BytesIO()
+            gTTS(text=text, lang='tr').write_to_fp(buf)
+            return buf.getvalue()
         except Exception as e:
             logger.error(f"gTTS Fallback Error: {e}")
             return None
 
+    def _gtts_fallback(self, text):
+        audio_bytes = self._gtts_bytes(text)
+        if not audio_bytes:
+            return None
+        return self._store_clip(audio_bytes, "fb")
+
+    def _audio_url(self, audio_id):
+        return f"http://localhost:8090/audio/{audio_id}"
+
+    def _stream_url(self, stream):
+        return f"http://localhost:8090/audio/stream/{stream.id}"
+
+    async def _synthesize(self, text):
+        """
+        Returns (url, audio) for spoken text, or None on failure. Uncached
+        ElevenLabs audio is served progressively: the URL is usable right away
+        and `audio` is an AudioStream that completes once synthesis is done.
+        Otherwise `audio` holds the finished clip's bytes.
+        """
+        if self.STREAM_TTS and self.audio_streams and self.el_client:
+            key = self._tts_key(text)
+            if key not in self.tts_cache:
+                # Timed inside _tts_stream_sync; this returns before synthesis starts
+                stream = self.audio_streams.create("el")
+                asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._tts_stream_sync, text, key, stream)
+                return self._stream_url(stream), stream
+
+        with VOICE_STAGE.labels(stage="tts").time():
+            audio_id = await self._run_in_executor(self._tts_sync, text)
+        clip = self.audio_store.get(audio_id) if audio_id else None
+        if not clip:
+            return None
+        return self._audio_url(audio_id), clip[0]
+
+    def _reply_started(self):
+        """Records the response latency when the first clip of a turn goes out."""
+        if self._turn_started is not None:
+            VOICE_STAGE.labels(stage="response").observe(time.perf_counter() - self._turn_started)
+            self._turn_started = None
+
+    @staticmethod
+    def _speech_duration(text):
+        # ElevenLabs is slightly slower/more expressive than plain reading speed
+        return len(text.split()) * 0.6
+
+    async def _speak(self, response):
+        """Synthesizes one reply, sends it to the clients and waits for playback."""
+        if not response or not response.strip():
+            logger.warning("Empty reply, nothing to speak")
+            return
+        audio = await self._synthesize(response)
+        if audio:
+            url, source = audio
+            self._reply_started()
+            await broadcast_speak(url, 15.0, response, audio=source)
+
+            # Wait for speaking to end (estimated)
+            wait_time = self._speech_duration(response) + 3.0
+            logger.info(f"🔈 Speaking... Waiting {wait_time:.1f}s")
+            with VOICE_STAGE.labels(stage="playback").time():
+                await asyncio.sleep(wait_time)
+
+    async def _speak_streaming(self, prompt):
+        """
+        Streams the Gemini reply and pipelines it sentence by sentence:
+        while one clip plays, the next sentence is already being synthesized.
+        """
+        sentences = asyncio.Queue()
+        clips = asyncio.Queue()
+
+        async def produce():
+            try:
+                async for sentence in self._gemini_sentences(prompt):
+                    sentences.put_nowait(sentence)
+            finally:
+                sentences.put_nowait(None)
+
+        async def synthesize():
+            try:
+                while (sentence := await sentences.get()) is not None:
+                    if not sentence.strip():
+                        continue
+                    audio = await self._synthesize(sentence)  # Already censored while streaming
+                    if audio:
+                        url, source = audio
+                        await clips.put((url, sentence, source))
+                        if isinstance(source, AudioStream):
+                            # One ElevenLabs request at a time; the next starts while this one plays
+                            await source.wait_done()
+            finally:
+                clips.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        synthesizer = asyncio.create_task(synthesize())
+        spoken = []
+        try:
+            while (clip := await clips.get()) is not None:
+                url, sentence, source = clip
+                self._reply_started()
+                await broadcast_speak(url, 15.0, sentence, audio=source)
+                spoken.append(sentence)
+                with VOICE_STAGE.labels(stage="playback").time():
+                    await asyncio.sleep(self._speech_duration(sentence) + 0.5)
+            logger.info(f"AI: {' '.join(spoken)}")
+            if spoken:
+                await asyncio.sleep(2.5)
+        finally:
+            for task in (producer, synthesizer):
+                task.cancel()
+
     async def run_pipeline_loop(self):
         """
         The main voice loop task for hands-free mode.
         """
         self.is_running = True
         logger.info("🚀 Hands-free Voice Pipeline Started")
+        loop = asyncio.get_running_loop()
+        speculator = None
         
         try:
             while self.is_running:
+                if self.capture and not self.capture.running and not await self._reopen_capture():
+                    continue
+
                 await broadcast_state("LISTENING")
+
+                if self.SPECULATIVE_ENDPOINTING:
+                    speculator = Speculator(loop, self._speculate, self.speculation_stats)
                 
-                path = await self._run_in_executor(self._record_sync)
+                recording_started = time.perf_counter()
+                audio = await self._run_in_executor(self._record_sync, speculator)
                 
                 if not self.is_running:
                     break
                     
-                if not path:
+                if not audio:
+                    if speculator:
+                        speculator.cancel()
                     await asyncio.sleep(0.5)
                     continue
+                self._capture_retry = self.CAPTURE_RETRY_MIN  # The microphone works again
+                self._turn_started = time.perf_counter()
+                VOICE_STAGE.labels(stage="record").observe(self._turn_started - recording_started)
 
                 await broadcast_state("WAITING")
 
-                text = await self._run_in_executor(self._stt_sync, path)
+                speculative = await speculator.commit() if speculator else None
+                if speculative:
+                    text, ai_draft = speculative
+                else:
+                    text = await self._run_in_executor(self._stt_sync, audio)
+                    ai_draft = None
                 if text:
                     logger.info(f"User: {text}")
                     await broadcast_message({"type": "transcribe", "text": text})
                     
                     # Greeting Logic
                     if self.is_first_interaction:
-                        response = "Merhaba! Ben buradayım!"
                         self.is_first_interaction = False
                         logger.info("👋 First interaction: Greeted user")
+                        await self._speak(self.GREETING)
+                    # Profanity filter: if user message contains banned words, reply with the default polite message
+                    elif self.word_filter.contains_profanity(text):
+                        logger.info("🔒 Profanity detected in user input; sending filtered response")
+                        await self._speak(self.PROFANITY_REPLY)
+                    elif ai_draft is None and self.STREAM_RESPONSES:
+                        await self._speak_streaming(text)
                     else:
-                        # Profanity filter: if user message contains banned words, reply with the default polite message
-                        if self.word_filter.contains_profanity(text):
-                            response = "Lütfen saygı kurallarına uy."
-                            logger.info("🔒 Profanity detected in user input; sending filtered response")
-                        else:
-                            ai_response = await self._run_in_executor(self._gemini_sync, text)
-                            # Also filter the AI response just in case
-                            response = self.word_filter.censor_text(ai_response)
-                            if response != ai_response:
-                                logger.info("🔒 AI response was censored")
-                            logger.info(f"AI: {response}")
-
-                    audio_path = await self._run_in_executor(self._tts_sync, response)
-                    if audio_path:
-                        url = f"http://localhost:8090/audio/{audio_path.name}"
-                        await broadcast_speak(url, 15.0, response)
-                        
-                        # Wait for speaking to end (estimated)
-                        words = len(response.split())
-                        wait_time = (words * 0.6) + 3.0 # ElevenLabs is slightly slower/more expressive
-                        logger.info(f"🔈 Speaking... Waiting {wait_time:.1f}s")
-                        await asyncio.sleep(wait_time)
+                        ai_response = ai_draft
+                        if ai_response is None:
+                            ai_response = await self._gemini(text)
+                        # Also filter the AI response just in case
+                        response = self.word_filter.censor_text(ai_response)
+                        if response != ai_response:
+                            logger.info("🔒 AI response was censored")
+                        logger.info(f"AI: {response}")
+                        await self._speak(response)
                 
                 await broadcast_state("IDLE")
                 await asyncio.sleep(0.5)
@@ -316,5 +622,7 @@ class VoiceController:
             logger.error(f"Error in voice loop: {e}")
             await broadcast_error(str(e))
         finally:
+            if speculator:
+                speculator.cancel()
             self.is_running = False
             await broadcast_state("IDLE")
@@ -0,0 +1,57 @@
+"""
+Audio Archiver - writes recorded utterances to disk on a background thread,
+keeping WAV encoding and file I/O off the voice pipeline's critical path.
+"""
+import wave
+import queue
+import logging
+import threading
+from pathlib import Path
+
+from server.core.audio_store import new_audio_id
+
+logger = logging.getLogger("AudioArchiver")
+
+
+class AudioArchiver:
+    """Queues PCM buffers and saves them as rec_<id>.wav from a daemon thread."""
+
+    def __init__(self, audio_dir, channels=1, sample_width=2, rate=16000, max_pending=8):
+        self.audio_dir = Path(audio_dir)
+        self.audio_dir.mkdir(exist_ok=True)
+        self.channels = channels
+        self.sample_width = sample_width
+        self.rate = rate
+
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._worker, name="AudioArchiver", daemon=True)
+        self._thread.start()
+
+    def submit(self, pcm):
+        """Schedules a recording for archiving. Never blocks; drops it if the writer is behind."""
+        try:
+            self._queue.put_nowait((pcm, new_audio_id("rec", ".wav")))
+            return True
+        except queue.Full:
+            logger.warning("Archive queue full, dropping recording")
+            return False
+
+    def close(self, timeout=2.0):
+        """Flushes pending recordings and stops the writer thread."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            pcm, name = item
+            try:
+                with wave.open(str(self.audio_dir / name), "wb") as wf:
+                    wf.setnchannels(self.channels)
+                    wf.setsampwidth(self.sample_width)
+                    wf.setframerate(self.rate)
+                    wf.writeframes(pcm)
+            except Exception as e:
+                logger.error(f"Archive write failed for {name}: {e}")
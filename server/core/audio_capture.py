@@ -0,0 +1,271 @@
+"""
+Audio Capture - a long-lived microphone stream feeding a fixed-size ring buffer.
+Utterances are sliced out of the ring (with pre-roll before speech onset), so the
+input device is opened once instead of on every listening turn.
+"""
+import time
+import wave
+import logging
+import threading
+
+from server.core.vad import frame_rms
+
+logger = logging.getLogger("AudioCapture")
+
+
+class RingBuffer:
+    """Fixed-capacity byte ring addressed by absolute stream positions."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buf = bytearray(capacity)
+        self.write_pos = 0  # Total bytes ever written
+
+    @property
+    def oldest(self):
+        """Oldest absolute position still held in the ring."""
+        return max(0, self.write_pos - self.capacity)
+
+    def write(self, data):
+        n = len(data)
+        if n >= self.capacity:
+            data = data[n - self.capacity:]
+            self.write_pos += n - self.capacity
+            n = self.capacity
+        offset = self.write_pos % self.capacity
+        first = min(n, self.capacity - offset)
+        self._buf[offset:offset + first] = data[:first]
+        if first < n:
+            self._buf[:n - first] = data[first:]
+        self.write_pos += n
+
+    def read_into(self, start, end, out, out_offset=0):
+        """Copies [start, end) into a writable buffer. Returns the number of bytes copied."""
+        if start < self.oldest or end > self.write_pos or start > end:
+            raise ValueError(f"Range [{start}, {end}) not available in ring")
+        n = end - start
+        offset = start % self.capacity
+        first = min(n, self.capacity - offset)
+        out[out_offset:out_offset + first] = self._buf[offset:offset + first]
+        if first < n:
+            out[out_offset + first:out_offset + n] = self._buf[:n - first]
+        return n
+
+    def read(self, start, end):
+        out = bytearray(end - start)
+        self.read_into(start, end, out)
+        return out
+
+
+class WavFileStream:
+    """
+    PyAudio-compatible fake input stream backed by a WAV file.
+    Pads with silence after the file ends. `speed` paces reads like a real device
+    (1.0 = real time, 10.0 = ten times faster); None reads as fast as possible.
+    """
+
+    def __init__(self, path, speed=1.0, loop=False):
+        self._wav = wave.open(str(path), "rb")
+        self.sample_width = self._wav.getsampwidth()
+        self.channels = self._wav.getnchannels()
+        self.rate = self._wav.getframerate()
+        self.speed = speed
+        self.loop = loop
+        self._active = True
+
+    def read(self, num_frames, exception_on_overflow=True):
+        if self.speed:
+            time.sleep(num_frames / self.rate / self.speed)
+        frame_bytes = self.sample_width * self.channels
+        data = self._wav.readframes(num_frames)
+        if len(data) < num_frames * frame_bytes and self.loop:
+            self._wav.rewind()
+            data += self._wav.readframes(num_frames - len(data) // frame_bytes)
+        return data + bytes(num_frames * frame_bytes - len(data))
+
+    def is_active(self):
+        return self._active
+
+    def stop_stream(self):
+        self._active = False
+
+    def close(self):
+        self._active = False
+        self._wav.close()
+
+
+class MicrophoneCapture:
+    """
+    Owns one open input stream and a capture thread writing into a RingBuffer.
+    If a read fails (e.g. the device was unplugged) the thread stops, `running`
+    turns False and `error` holds the exception until start() reopens the device.
+    """
+
+    def __init__(self, stream_factory, chunk=1024, sample_width=2, rate=16000,
+                 channels=1, buffer_seconds=30.0):
+        self.stream_factory = stream_factory
+        self.chunk = chunk
+        self.sample_width = sample_width
+        self.rate = rate
+        self.channels = channels
+        self.chunk_bytes = chunk * sample_width * channels
+        self.bytes_per_second = rate * sample_width * channels
+
+        capacity = int(buffer_seconds * self.bytes_per_second)
+        self.ring = RingBuffer(capacity - capacity % self.chunk_bytes)
+
+        self._cond = threading.Condition()
+        self._stream = None
+        self._thread = None
+        self.running = False
+        self.error = None  # Why the capture thread last stopped on its own
+
+    @property
+    def position(self):
+        with self._cond:
+            return self.ring.write_pos
+
+    def start(self):
+        """Opens the device and starts the capture thread (no-op if already running)."""
+        if self.running:
+            return
+        self._close_stream()  # Left over from a capture thread that died
+        self._stream = self.stream_factory()
+        self.error = None
+        self.running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="MicrophoneCapture", daemon=True)
+        self._thread.start()
+        logger.info("🎙️ Microphone stream opened")
+
+    def stop(self):
+        """Stops the capture thread and releases the device."""
+        if not self.running:
+            self._close_stream()  # The thread may have died on a read error
+            return
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        self._close_stream()
+        logger.info("🎙️ Microphone stream closed")
+
+    def _close_stream(self):
+        if self._stream:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+
+    def _capture_loop(self):
+        while self.running:
+            try:
+                data = self._stream.read(self.chunk, exception_on_overflow=False)
+            except Exception as e:
+                logger.error(f"Stream read error: {e}")
+                self.error = e
+                break
+            with self._cond:
+                self.ring.write(data)
+                self._cond.notify_all()
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+
+    def read_chunk(self, pos, timeout=1.0):
+        """
+        Blocks until the chunk starting at `pos` is captured.
+        Returns (data, pos) where pos may have been advanced if the reader fell
+        behind the ring, or (None, pos) on timeout / shutdown.
+        """
+        end = pos + self.chunk_bytes
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.ring.write_pos >= end or not self.running, timeout):
+                return None, pos
+            if self.ring.write_pos < end:
+                return None, pos
+            if pos < self.ring.oldest:
+                logger.warning("Capture reader overrun, skipping ahead")
+                pos = self.ring.oldest
+                end = pos + self.chunk_bytes
+            return bytes(self.ring.read(pos, end)), pos
+
+    def record_utterance(self, vad, silence_duration=2.0, pre_roll=0.3,
+                         initial_timeout=10.0, max_duration=20.0, min_chunks=10,
+                         is_running=lambda: True, speculative_silence=None,
+                         on_pause=None, on_resume=None):
+        """
+        Waits for speech, then records until `silence_duration` of silence.
+        Returns the utterance (including up to `pre_roll` seconds before onset)
+        as one contiguous bytearray, or None if nothing usable was heard.
+
+        If `speculative_silence` is set, on_pause(pcm_so_far) is called once a
+        shorter pause is seen and on_resume() if speech starts again afterwards.
+        """
+        max_silent = int(silence_duration * self.rate / self.chunk)
+        max_initial_wait = int(initial_timeout * self.rate / self.chunk)
+        max_total_duration = int(max_duration * self.rate / self.chunk)
+        pre_roll_bytes = int(pre_roll * self.rate / self.chunk) * self.chunk_bytes
+        speculative_silent = None
+        if speculative_silence is not None and on_pause:
+            speculative_silent = max(1, int(speculative_silence * self.rate / self.chunk))
+
+        listen_start = pos = self.position
+        onset = None
+        silent_chunks = 0
+        chunk_count = 0
+        ticks = 0
+        paused = False
+        logger.info("🎤 Microphone listening...")
+
+        while ticks < max_total_duration and is_running():
+            data, pos = self.read_chunk(pos)
+            if data is None:
+                if not self.running:
+                    break
+                continue
+            chunk_start = pos
+            pos += len(data)
+            ticks += 1
+            rms = frame_rms(data)
+
+            if onset is None:
+                if vad.is_speech(rms):
+                    onset = chunk_start
+                    logger.info("🗣️ Speech started")
+                else:
+                    vad.observe_ambient(rms)
+                    if ticks > max_initial_wait:
+                        return None
+
+            if onset is not None:
+                chunk_count += 1
+                if vad.is_silent(rms):
+                    silent_chunks += 1
+                else:
+                    silent_chunks = 0
+                    if paused:
+                        paused = False
+                        if on_resume:
+                            on_resume()
+
+                if silent_chunks > max_silent:
+                    logger.info("🤫 Silence detected, stopping recording")
+                    break
+
+                if (speculative_silent and not paused and chunk_count >= min_chunks
+                        and silent_chunks >= speculative_silent):
+                    paused = True
+                    on_pause(self._slice(onset, listen_start, pre_roll_bytes, pos))
+
+        if chunk_count < min_chunks:
+            return None
+        return self._slice(onset, listen_start, pre_roll_bytes, pos)
+
+    def _slice(self, onset, listen_start, pre_roll_bytes, end):
+        with self._cond:
+            start = max(onset - pre_roll_bytes, listen_start, self.ring.oldest)
+            return self.ring.read(start, end)
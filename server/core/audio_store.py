@@ -0,0 +1,149 @@
+"""
+Audio Store - where generated clips live until the client fetches them.
+IDs are collision-free and every store is bounded by a byte budget with LRU eviction.
+"""
+import abc
+import uuid
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+logger = logging.getLogger("AudioStore")
+
+CONTENT_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+}
+
+
+def new_audio_id(prefix, extension=".mp3"):
+    """Unique clip ID such as el_3f2a...c9.mp3 (safe to use as a URL path segment)."""
+    return f"{prefix}_{uuid.uuid4().hex}{extension}"
+
+
+def _content_type(audio_id):
+    return CONTENT_TYPES.get(Path(audio_id).suffix.lower(), "application/octet-stream")
+
+
+class AudioStore(abc.ABC):
+    """
+    Base class. put() may be called from worker threads. get() is cheap enough
+    for the event loop unless `blocking` is set, in which case callers on the
+    loop should run it in an executor.
+    """
+    blocking = False  # get() reads the filesystem
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def put(self, data, prefix="el", extension=".mp3"):
+        """Stores a clip and returns its ID."""
+
+    @abc.abstractmethod
+    def get(self, audio_id):
+        """Returns (bytes, content_type), or None if unknown or evicted."""
+
+    @abc.abstractmethod
+    def __len__(self):
+        """Number of clips held."""
+
+
+class MemoryAudioStore(AudioStore):
+    """Keeps clips in RAM only; nothing touches the filesystem."""
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024):
+        super().__init__(budget_bytes)
+        self._clips = OrderedDict()  # id -> bytes, oldest first
+
+    def put(self, data, prefix="el", extension=".mp3"):
+        audio_id = new_audio_id(prefix, extension)
+        data = bytes(data)
+        with self._lock:
+            self._clips[audio_id] = data
+            self.used_bytes += len(data)
+            self._evict()
+        return audio_id
+
+    def get(self, audio_id):
+        with self._lock:
+            data = self._clips.get(audio_id)
+            if data is None:
+                return None
+            self._clips.move_to_end(audio_id)
+        return data, _content_type(audio_id)
+
+    def __len__(self):
+        return len(self._clips)
+
+    def _evict(self):
+        # Always keep the newest clip, even if it alone exceeds the budget
+        while self.used_bytes > self.budget_bytes and len(self._clips) > 1:
+            _, evicted = self._clips.popitem(last=False)
+            self.used_bytes -= len(evicted)
+
+
+class DiskAudioStore(AudioStore):
+    """
+    Keeps clips as files in a directory. An in-memory index answers lookups,
+    so serving never stats the filesystem; only the clip itself is read.
+    """
+    blocking = True
+
+    def __init__(self, directory, budget_bytes=256 * 1024 * 1024):
+        super().__init__(budget_bytes)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index = OrderedDict()  # id -> size, oldest first
+        self._load_index()
+
+    def _load_index(self):
+        files = [p for p in self.directory.iterdir() if p.is_file() and p.suffix.lower() in CONTENT_TYPES]
+        for path in sorted(files, key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._index[path.name] = size
+            self.used_bytes += size
+        with self._lock:
+            self._evict()
+
+    def put(self, data, prefix="el", extension=".mp3"):
+        audio_id = new_audio_id(prefix, extension)
+        path = self.directory / audio_id
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        with self._lock:
+            self._index[audio_id] = len(data)
+            self.used_bytes += len(data)
+            self._evict()
+        return audio_id
+
+    def get(self, audio_id):
+        with self._lock:
+            if audio_id not in self._index:
+                return None
+            self._index.move_to_end(audio_id)
+        try:
+            data = (self.directory / audio_id).read_bytes()
+        except OSError:
+            with self._lock:
+                size = self._index.pop(audio_id, None)
+                if size is not None:
+                    self.used_bytes -= size
+            return None
+        return data, _content_type(audio_id)
+
+    def __len__(self):
+        return len(self._index)
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and len(self._index) > 1:
+            audio_id, size = self._index.popitem(last=False)
+            self.used_bytes -= size
+            try:
+                (self.directory / audio_id).unlink()
+            except OSError:
+                pass
@@ -0,0 +1,121 @@
+"""
+Audio Streams - in-progress TTS audio that HTTP clients can start playing
+while the generator is still producing bytes.
+"""
+import time
+import uuid
+import asyncio
+import logging
+
+from aiohttp import web
+
+logger = logging.getLogger("AudioStreams")
+
+
+class AudioStream:
+    """
+    A growing byte stream with one producer and any number of readers.
+    Must be fed on the event loop; threads use feed_threadsafe/finish_threadsafe.
+    """
+
+    def __init__(self, stream_id, loop, content_type="audio/mpeg"):
+        self.id = stream_id
+        self.loop = loop
+        self.content_type = content_type
+        self.chunks = []
+        self.size = 0
+        self.done = False
+        self.error = None
+        self.finished_at = None
+        self._changed = asyncio.Event()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def feed(self, chunk):
+        if chunk and not self.done:
+            self.chunks.append(chunk)
+            self.size += len(chunk)
+            self._notify()
+
+    def finish(self, error=None):
+        if self.done:
+            return
+        self.done = True
+        self.error = error
+        self.finished_at = time.monotonic()
+        self._notify()
+
+    def feed_threadsafe(self, chunk):
+        self.loop.call_soon_threadsafe(self.feed, chunk)
+
+    def finish_threadsafe(self, error=None):
+        self.loop.call_soon_threadsafe(self.finish, error)
+
+    async def iter_chunks(self):
+        """Yields every chunk from the start, waiting for new ones until finished."""
+        index = 0
+        while True:
+            if index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            elif self.done:
+                return
+            else:
+                await self._changed.wait()
+
+    async def wait_done(self):
+        while not self.done:
+            await self._changed.wait()
+
+
+class AudioStreamRegistry:
+    """Tracks live and recently finished streams by ID."""
+
+    def __init__(self, ttl=120.0):
+        self.ttl = ttl  # Seconds a finished stream stays readable
+        self.streams = {}
+
+    def create(self, prefix="el", content_type="audio/mpeg"):
+        self._expire()
+        stream_id = f"{prefix}_{uuid.uuid4().hex}"
+        stream = AudioStream(stream_id, asyncio.get_running_loop(), content_type)
+        self.streams[stream_id] = stream
+        return stream
+
+    def get(self, stream_id):
+        return self.streams.get(stream_id)
+
+    async def serve(self, request):
+        """aiohttp handler for /audio/stream/{stream_id}: chunked audio while TTS is still producing it."""
+        stream = self.get(request.match_info.get("stream_id", ""))
+        if not stream:
+            return web.Response(status=404)
+        if stream.done and stream.error is not None and not stream.chunks:
+            return web.Response(status=502)
+        resp = web.StreamResponse(headers={
+            "Content-Type": stream.content_type,
+            "Access-Control-Allow-Origin": "*",
+            "Cache-Control": "no-cache"
+        })
+        resp.enable_chunked_encoding()
+        await resp.prepare(request)
+        async for chunk in stream.iter_chunks():
+            await resp.write(chunk)
+        if stream.error is not None:
+            # The 200 is already out; cut the connection so the client sees a
+            # failed download instead of a clip that ends early
+            logger.warning(f"Audio stream {stream.id} failed: {stream.error}")
+            if request.transport is not None:
+                request.transport.close()
+            return resp
+        await resp.write_eof()
+        return resp
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = [sid for sid, s in self.streams.items()
+                   if s.done and now - s.finished_at > self.ttl]
+        for sid in expired:
+            del self.streams[sid]
@@ -1,24 +1,167 @@
+"""
+Event Router - runs handlers for inbound client events.
+
+Events are submitted to a bounded queue and started by one dispatcher task:
+- higher-priority events (mode / voice control) start before lower ones (debug)
+- each route belongs to a group with a concurrency limit, so e.g. mode changes
+  and voice start/stop run one at a time instead of overlapping
+- coalescing routes keep only the newest queued event (the last `mode` wins),
+  queued behind everything submitted before it
+- when the queue is full the oldest lower-priority event is dropped, or the
+  new one if nothing queued ranks below it
+"""
+import time
 import asyncio
 import inspect
 import logging
+from collections import deque
+
+from server.core import metrics
 
 logger = logging.getLogger("EventRouter")
 
+DISPATCH_TIME = metrics.histogram(
+    "hologram_event_dispatch_seconds", "Event handler run time", ("event",))
+QUEUE_WAIT = metrics.histogram(
+    "hologram_event_queue_wait_seconds", "Time an event waited in the dispatch queue", ("event",))
+
+PRIORITY_CONTROL = 0  # Mode and voice control
+PRIORITY_NORMAL = 1
+PRIORITY_DEBUG = 2    # Dropped first
+QUEUE_SIZE = 64       # Events waiting to start, across all priorities
+DEFAULT_CONCURRENCY = 4  # Handlers of one group running at once
+PRIORITY_NAMES = {PRIORITY_CONTROL: "control", PRIORITY_NORMAL: "normal", PRIORITY_DEBUG: "debug"}
+
+
+class Route:
+    def __init__(self, handler, priority, group, coalesce):
+        self.handler = handler
+        self.priority = priority
+        self.group = group
+        self.coalesce = coalesce  # Key shared by events that supersede each other, or None
+
+
 class EventRouter:
-    def __init__(self):
-        self.handlers = {}
+    def __init__(self, max_queue=QUEUE_SIZE):
+        self.handlers = {}  # event name -> Route
+        self.max_queue = max_queue
+        self.limits = {}  # group -> max concurrent handlers
+        self._queues = {level: deque() for level in PRIORITY_NAMES}
+        self._running = {}  # group -> handlers in flight
+        self._wakeup = None
+        self._worker = None
+        self._tasks = set()
+        self.dispatched = {}
+        self.dropped = {}
+        self.coalesced = {}
 
-    def register(self, event_name, handler):
-        self.handlers[event_name] = handler
+    def register(self, event_name, handler, priority=PRIORITY_NORMAL, group=None,
+                 concurrency=None, coalesce=False):
+        """
+        group: routes sharing a group share its concurrency limit (default: the event name).
+        concurrency: max handlers of the group at once (default DEFAULT_CONCURRENCY).
+        coalesce: True, or a key shared with other routes (e.g. start/stop): a newer
+            event replaces a queued one with the same key that hasn't started yet.
+        """
+        group = group or event_name
+        key = event_name if coalesce is True else (coalesce or None)
+        self.handlers[event_name] = Route(handler, priority, group, key)
+        if concurrency is not None or group not in self.limits:
+            self.limits[group] = concurrency or DEFAULT_CONCURRENCY
         logger.info(f"Registered handler for: {event_name}")
 
+    @property
+    def depth(self):
+        return sum(len(q) for q in self._queues.values())
+
+    def submit(self, event_name, payload):
+        """Queues an event without blocking (call from the loop). Returns False if it was dropped."""
+        route = self.handlers.get(event_name)
+        if not route:
+            logger.warning(f"No handlers registered for message type: {event_name}")
+            return False
+
+        queue = self._queues[route.priority]
+        if route.coalesce:
+            for entry in queue:
+                if self.handlers[entry[0]].coalesce == route.coalesce:
+                    # Superseded before it started. The new event goes to the tail,
+                    # so it still runs after everything submitted before it
+                    queue.remove(entry)
+                    self.coalesced[event_name] = self.coalesced.get(event_name, 0) + 1
+                    break
+
+        if self.depth >= self.max_queue and not self._make_room(route.priority):
+            self._count_drop(event_name)
+            return False
+
+        queue.append([event_name, payload, time.monotonic()])
+        self._start_worker()
+        self._wakeup.set()
+        return True
+
+    def _make_room(self, priority):
+        # Evict the oldest event of the lowest priority below the incoming one
+        for level in sorted(self._queues, reverse=True):
+            if level <= priority:
+                break
+            if self._queues[level]:
+                self._count_drop(self._queues[level].popleft()[0])
+                return True
+        return False
+
+    def _count_drop(self, event_name):
+        self.dropped[event_name] = self.dropped.get(event_name, 0) + 1
+        logger.warning(f"Event queue full, dropped {event_name}")
+
+    def _start_worker(self):
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.create_task(self._dispatch_loop())
+
+    def _next(self):
+        """Highest-priority, oldest event whose group has a free slot."""
+        for level in sorted(self._queues):
+            for entry in self._queues[level]:
+                route = self.handlers[entry[0]]
+                if self._running.get(route.group, 0) < self.limits[route.group]:
+                    self._queues[level].remove(entry)
+                    return entry, route
+        return None, None
+
+    async def _dispatch_loop(self):
+        while True:
+            entry, route = self._next()
+            if entry is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            self._running[route.group] = self._running.get(route.group, 0) + 1
+            task = asyncio.create_task(self._run(entry, route))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, entry, route):
+        event_name, payload, enqueued_at = entry
+        started = time.monotonic()
+        QUEUE_WAIT.labels(event=event_name).observe(started - enqueued_at)
+        try:
+            await self.dispatch(event_name, payload)
+        finally:
+            DISPATCH_TIME.labels(event=event_name).observe(time.monotonic() - started)
+            self._running[route.group] -= 1
+            self.dispatched[event_name] = self.dispatched.get(event_name, 0) + 1
+            self._wakeup.set()
+
     async def dispatch(self, event_name, payload):
-        handler = self.handlers.get(event_name)
+        """Runs the handler right away, bypassing the queue."""
+        route = self.handlers.get(event_name)
 
-        if not handler:
+        if not route:
             logger.warning(f"No handlers registered for message type: {event_name}")
             return
 
+        handler = route.handler
         try:
             logger.info(f"Dispatching {event_name}")
             if inspect.iscoroutinefunction(handler):
@@ -30,3 +173,14 @@ class EventRouter:
             raise
         except Exception as e:
             logger.exception(f"Handler error for event {event_name}: {e}")
+
+    def stats(self):
+        """Queue depth per priority, handlers in flight per group, and per-event counters."""
+        return {
+            "depth": self.depth,
+            "queued": {PRIORITY_NAMES[level]: len(q) for level, q in self._queues.items()},
+            "running": {group: n for group, n in self._running.items() if n},
+            "dispatched": dict(self.dispatched),
+            "dropped": dict(self.dropped),
+            "coalesced": dict(self.coalesced),
+        }
@@ -0,0 +1,85 @@
+"""
+Gemini Client - generateContent and streamGenerateContent (SSE) calls over a
+shared, keep-alive aiohttp session.
+"""
+import json
+import logging
+import aiohttp
+
+logger = logging.getLogger("GeminiClient")
+
+
+class GeminiError(Exception):
+    """Raised when the Gemini API returns an error or an unreadable response."""
+
+
+class GeminiClient:
+    BASE_URL = "https://generativelanguage.googleapis.com/v1"
+
+    def __init__(self, api_key, model, session=None, base_url=None, timeout=10):
+        self.api_key = api_key
+        self.model = model
+        self.session = session
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self._owns_session = False
+
+    def _get_session(self):
+        # Normally injected by main.py; standalone use gets a private session, released by close()
+        if self.session is not None and self.session.closed and not self._owns_session:
+            # The app is shutting down; a replacement session would never be closed
+            raise GeminiError("Shared HTTP session is closed")
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self.session
+
+    async def close(self):
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+
+    def _url(self, method, **params):
+        query = "&".join(f"{k}={v}" for k, v in {**params, "key": self.api_key}.items())
+        return f"{self.base_url}/models/{self.model}:{method}?{query}"
+
+    @staticmethod
+    def _body(prompt):
+        return {"contents": [{"parts": [{"text": prompt}]}]}
+
+    @staticmethod
+    def _extract_text(data):
+        try:
+            parts = data["candidates"][0]["content"]["parts"]
+        except (KeyError, IndexError, TypeError):
+            return ""
+        return "".join(part.get("text", "") for part in parts)
+
+    async def generate(self, prompt):
+        """Single-shot generation. Returns the full reply text."""
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with self._get_session().post(self._url("generateContent"), json=self._body(prompt),
+                                            timeout=timeout) as resp:
+            if resp.status != 200:
+                raise GeminiError(f"Gemini API Error {resp.status}: {await resp.text()}")
+            return self._extract_text(await resp.json())
+
+    async def stream(self, prompt):
+        """Async generator yielding reply text fragments as the server streams them."""
+        # No total limit for streams; fail only if the server goes quiet
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+        async with self._get_session().post(self._url("streamGenerateContent", alt="sse"),
+                                            json=self._body(prompt), timeout=timeout) as resp:
+            if resp.status != 200:
+                raise GeminiError(f"Gemini API Error {resp.status}: {await resp.text()}")
+            async for raw in resp.content:
+                line = raw.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    data = json.loads(line[5:].strip())
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed stream event: {line[:80]}")
+                    continue
+                text = self._extract_text(data)
+                if text:
+                    yield text
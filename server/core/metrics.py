@@ -0,0 +1,290 @@
+"""
+Metrics - counters, gauges and latency histograms that are cheap enough to
+leave on in production (a lock and a bisect per observation).
+
+Everything lives in one process-wide registry and is exported two ways:
+- render(): Prometheus text format, served at GET /metrics
+- snapshot(): a compact dict for the "metrics" WebSocket message (debug panel)
+
+Components that already keep their own stats (event router, clients, vision,
+speculation) are folded in through collectors, functions called at export
+time that yield (name, labels, value) gauge samples, or (name, labels, value, "counter")
+for running totals.
+
+    STAGE = metrics.histogram("hologram_voice_stage_seconds", "Voice stage time", ("stage",))
+    with STAGE.labels(stage="stt").time():
+        ...
+"""
+import abc
+import time
+import bisect
+import logging
+import threading
+
+logger = logging.getLogger("Metrics")
+
+# Seconds; covers per-frame vision work up to slow cloud calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _series(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Value:
+    """One counter or gauge series."""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started)
+
+
+class _Buckets:
+    """One histogram series: per-bucket counts, sum and count."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        i = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += seconds
+            self.count += 1
+            if seconds > self.max:
+                self.max = seconds
+
+    def time(self):
+        """Context manager that observes the time spent in its block."""
+        return _Timer(self)
+
+    def quantile(self, q):
+        """Estimate, interpolated within the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                return lower + (min(upper, self.max) - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum / self.count * 1000, 2) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.5) * 1000, 2),
+            "p99_ms": round(self.quantile(0.99) * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class Metric(abc.ABC):
+    """A named metric with optional labels; unlabelled metrics are used directly."""
+    kind = None
+
+    def __init__(self, name, help="", labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._series = {}  # label values -> series
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _new(self):
+        """A fresh series for one combination of label values."""
+
+    def labels(self, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, self._new())
+        return series
+
+    def items(self):
+        """(labels dict, series) pairs."""
+        return [(dict(zip(self.labelnames, key)), series) for key, series in list(self._series.items())]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def _new(self):
+        return _Value()
+
+    def inc(self, amount=1.0):
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def _new(self):
+        return _Value()
+
+    def set(self, value):
+        self.labels().set(value)
+
+    def inc(self, amount=1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount=1.0):
+        self.labels().dec(amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help="", labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new(self):
+        return _Buckets(self.buckets)
+
+    def observe(self, seconds):
+        self.labels().observe(seconds)
+
+    def time(self):
+        return self.labels().time()
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help, labelnames, **options):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **options)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name!r} already registered differently")
+            return metric
+
+    def counter(self, name, help="", labelnames=()):
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name, help="", labelnames=()):
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(self, name, help="", labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help, labelnames, buckets=buckets)
+
+    def add_collector(self, collect):
+        """
+        collect() yields (name, labels dict, value) samples at export time, with
+        an optional fourth item, the type: "gauge" (default) or "counter".
+        """
+        self._collectors.append(collect)
+
+    def _collected(self):
+        """(name, labels, value, kind) samples from every collector; None values are skipped."""
+        samples = []
+        for collect in self._collectors:
+            try:
+                for name, labels, value, *kind in collect():
+                    if value is not None:
+                        samples.append((name, labels, value, kind[0] if kind else "gauge"))
+            except Exception as e:
+                logger.warning(f"Metrics collector {getattr(collect, '__name__', collect)} failed: {e}")
+        return samples
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            if metric.help:
+                lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, series in metric.items():
+                if metric.kind != "histogram":
+                    lines.append(f"{_series(metric.name, labels)} {_number(series.value)}")
+                    continue
+                cumulative = 0
+                for bound, n in zip(metric.buckets + (float("inf"),), series.counts):
+                    cumulative += n
+                    le = {**labels, "le": _number(bound)}
+                    lines.append(f"{_series(metric.name + '_bucket', le)} {cumulative}")
+                lines.append(f"{_series(metric.name + '_sum', labels)} {_number(series.sum)}")
+                lines.append(f"{_series(metric.name + '_count', labels)} {series.count}")
+
+        # Collectors may interleave metrics; each one's series must stay together
+        collected = {}  # name -> (kind, sample lines)
+        for name, labels, value, kind in self._collected():
+            collected.setdefault(name, (kind, []))[1].append(f"{_series(name, labels)} {_number(value)}")
+        for name, (kind, samples) in collected.items():
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """Histogram summaries (ms) and current values, keyed by series, for the debug panel."""
+        histograms = {}
+        values = {}
+        for metric in list(self._metrics.values()):
+            for labels, series in metric.items():
+                if metric.kind == "histogram":
+                    key = ",".join(labels.values()) or "all"
+                    histograms.setdefault(metric.name, {})[key] = series.summary()
+                else:
+                    values[_series(metric.name, labels)] = series.value
+        for name, labels, value, _ in self._collected():
+            values[_series(name, labels)] = value
+        return {"histograms": histograms, "values": values}
+
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+add_collector = REGISTRY.add_collector
+render = REGISTRY.render
+snapshot = REGISTRY.snapshot
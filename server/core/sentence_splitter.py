@@ -0,0 +1,38 @@
+"""
+Sentence Splitter - cuts a streamed token sequence into complete sentences.
+"""
+import re
+
+# Sentence-ending punctuation followed by whitespace, or a line break
+_BOUNDARY = re.compile(r"[.!?…]+[\"')\]]*\s+|\n+")
+
+
+class SentenceSplitter:
+    """
+    Incremental splitter: feed() text fragments, get back finished sentences.
+    Sentences shorter than `min_length` are merged with the next one so TTS
+    isn't asked for tiny clips.
+    """
+
+    def __init__(self, min_length=12):
+        self.min_length = min_length
+        self._buffer = ""
+
+    def feed(self, text):
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            if len(candidate) < self.min_length:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self):
+        """Returns whatever is left at the end of the stream, or None."""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return rest or None
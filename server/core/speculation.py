@@ -0,0 +1,111 @@
+"""
+Speculative endpointing - starts downstream work (STT, optionally the LLM) on a
+short pause, cancels it if the user keeps talking, commits it at the real endpoint.
+"""
+import time
+import asyncio
+import logging
+
+logger = logging.getLogger("Speculation")
+
+
+class SpeculationStats:
+    """Counters for speculation hit rate and latency saved."""
+
+    def __init__(self):
+        self.attempts = 0   # Speculative runs started
+        self.cancelled = 0  # Runs discarded because speech resumed
+        self.hits = 0       # Turns answered from a speculative run
+        self.misses = 0     # Turns that had to run STT after the endpoint
+        self.latency_saved = 0.0
+
+    @property
+    def hit_rate(self):
+        turns = self.hits + self.misses
+        return self.hits / turns if turns else 0.0
+
+    def as_dict(self):
+        return {
+            "attempts": self.attempts,
+            "cancelled": self.cancelled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "latency_saved_total": round(self.latency_saved, 3),
+            "latency_saved_avg": round(self.latency_saved / self.hits, 3) if self.hits else 0.0,
+        }
+
+
+class Speculator:
+    """
+    Runs `work(pcm)` on the event loop whenever the recorder reports a pause.
+    `work` returns None when it produced nothing usable (e.g. STT heard no text),
+    which counts as a miss. on_pause/on_resume are safe to call from the recording thread.
+    """
+
+    def __init__(self, loop, work, stats):
+        self.loop = loop
+        self.work = work
+        self.stats = stats
+        self._task = None
+        self._started_at = 0.0
+        self._finished_at = None
+
+    def on_pause(self, pcm):
+        self.loop.call_soon_threadsafe(self._launch, pcm)
+
+    def on_resume(self):
+        self.loop.call_soon_threadsafe(self.cancel)
+
+    def _launch(self, pcm):
+        self.cancel()
+        self.stats.attempts += 1
+        self._started_at = time.monotonic()
+        self._finished_at = None
+        self._task = asyncio.ensure_future(self.work(pcm))
+        self._task.add_done_callback(self._mark_finished)
+        logger.info("⚡ Pause detected, speculating")
+
+    def _mark_finished(self, task):
+        if task is self._task:
+            self._finished_at = time.monotonic()
+
+    def cancel(self):
+        """Discards the current speculative run (its snapshot is stale even if it finished)."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self.stats.cancelled += 1
+        logger.info("⚡ Speculation discarded")
+
+    async def commit(self):
+        """
+        Called at the real endpoint. Returns the speculative result, or None if
+        there was no usable run and the caller must do the work itself.
+        """
+        task, self._task = self._task, None
+        endpoint = time.monotonic()
+        if task is None or task.cancelled():
+            self.stats.misses += 1
+            return None
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Speculative run failed: {e}")
+            self.stats.misses += 1
+            return None
+        if result is None:
+            logger.info("⚡ Speculative run produced nothing, redoing it on the full utterance")
+            self.stats.misses += 1
+            return None
+
+        finished = self._finished_at or time.monotonic()
+        saved = min(finished, endpoint) - self._started_at
+        self.stats.hits += 1
+        self.stats.latency_saved += max(0.0, saved)
+        logger.info(f"⚡ Speculation hit, saved {saved:.2f}s (hit rate {self.stats.hit_rate:.0%})")
+        return result
@@ -0,0 +1,139 @@
+"""
+TTS Cache - content-addressed synthesized audio, keyed on the text and the
+voice configuration. A small in-memory LRU sits in front of a size-bounded disk tier.
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+logger = logging.getLogger("TTSCache")
+
+
+class TTSCache:
+    def __init__(self, cache_dir, memory_budget=16 * 1024 * 1024, disk_budget=256 * 1024 * 1024,
+                 extension=".mp3"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.extension = extension
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> bytes, oldest first
+        self._memory_bytes = 0
+        self._disk = OrderedDict()    # key -> size, oldest first
+        self._disk_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(text, voice_id, model_id, voice_settings=None):
+        """Stable hash of everything that changes the synthesized audio."""
+        if hasattr(voice_settings, "model_dump"):
+            settings = voice_settings.model_dump()
+        elif voice_settings is not None:
+            settings = dict(vars(voice_settings))
+        else:
+            settings = None
+        material = json.dumps([text, voice_id, model_id, settings], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _load_index(self):
+        # Rebuild LRU order from modification times (touched on every disk hit)
+        files = sorted(self.cache_dir.glob(f"*{self.extension}"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            size = path.stat().st_size
+            self._disk[path.stem] = size
+            self._disk_bytes += size
+        if files:
+            logger.info(f"TTS cache: {len(files)} clips on disk ({self._disk_bytes / 1e6:.1f} MB)")
+        self._evict_disk()
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}{self.extension}"
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._memory or key in self._disk
+
+    def get(self, key):
+        """Returns the cached audio bytes, or None."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+            if key not in self._disk:
+                self.misses += 1
+                return None
+            self._disk.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            path.touch()
+        except OSError:
+            with self._lock:
+                self._forget_disk(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """Stores audio in both tiers (write-through)."""
+        if not data:
+            return
+        path = self._path(key)
+        # Per-writer temp name: prebuild and live synthesis may write the same key at once
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(path)  # Atomic: readers never see a partial clip
+        except OSError as e:
+            logger.error(f"TTS cache write failed: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._forget_disk(key)
+            self._disk[key] = len(data)
+            self._disk_bytes += len(data)
+            self._remember(key, data)
+            self._evict_disk()
+
+    def _remember(self, key, data):
+        if len(data) > self.memory_budget:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.memory_budget:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _forget_disk(self, key):
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    def _evict_disk(self):
+        while self._disk_bytes > self.disk_budget and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
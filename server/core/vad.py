@@ -0,0 +1,89 @@
+"""
+Voice Activity Detection - vectorized frame-energy detector with an adaptive noise floor.
+Works directly on np.frombuffer views of 16-bit PCM, no per-sample Python work.
+"""
+import math
+import logging
+import numpy as np
+
+logger = logging.getLogger("VAD")
+
+
+def frame_rms(data) -> float:
+    """Returns the RMS energy of a 16-bit little-endian mono PCM frame."""
+    if not data:
+        return 0.0
+    samples = np.frombuffer(data, dtype="<i2", count=len(data) // 2)
+    if samples.size == 0:
+        return 0.0
+    # Widen once so the dot product cannot overflow int16
+    wide = samples.astype(np.float64)
+    return math.sqrt(float(np.dot(wide, wide)) / wide.size)
+
+
+class EnergyVAD:
+    """
+    Frame-energy speech detector.
+    Ambient frames feed an exponential noise-floor estimate; both thresholds are
+    raised above it in noisy rooms but never drop below their configured values.
+    """
+
+    def __init__(self, silence_threshold, min_energy_threshold, adaptive=True,
+                 calibration_frames=8, noise_alpha=0.05,
+                 silence_ratio=2.0, energy_ratio=3.5):
+        self.base_silence_threshold = silence_threshold
+        self.base_min_energy_threshold = min_energy_threshold
+        self.silence_threshold = silence_threshold
+        self.min_energy_threshold = min_energy_threshold
+
+        self.adaptive = adaptive
+        self.calibration_frames = calibration_frames
+        self.noise_alpha = noise_alpha
+        self.silence_ratio = silence_ratio
+        self.energy_ratio = energy_ratio
+
+        self.noise_floor = None
+        self._calibration = []
+
+    def is_speech(self, rms: float) -> bool:
+        return rms > self.min_energy_threshold
+
+    def is_silent(self, rms: float) -> bool:
+        return rms < self.silence_threshold
+
+    def observe_ambient(self, rms: float):
+        """Feeds a frame recorded while nobody is speaking into the noise floor."""
+        if not self.adaptive or self.is_speech(rms):
+            return
+
+        if self.noise_floor is None:
+            # Seed with the median of the first frames so a single click can't skew it
+            self._calibration.append(rms)
+            if len(self._calibration) < self.calibration_frames:
+                return
+            self.noise_floor = float(np.median(self._calibration))
+            self._calibration = []
+            self._recalibrate()
+            logger.info(
+                f"🎚️ Noise floor calibrated: {self.noise_floor:.0f} "
+                f"(silence={self.silence_threshold:.0f}, speech={self.min_energy_threshold:.0f})"
+            )
+            return
+
+        self.noise_floor += self.noise_alpha * (rms - self.noise_floor)
+        self._recalibrate()
+
+    def calibrate(self, frames):
+        """Estimates the noise floor from a batch of ambient PCM frames."""
+        for data in frames:
+            self.observe_ambient(frame_rms(data))
+
+    def reset(self):
+        self.noise_floor = None
+        self._calibration = []
+        self.silence_threshold = self.base_silence_threshold
+        self.min_energy_threshold = self.base_min_energy_threshold
+
+    def _recalibrate(self):
+        self.silence_threshold = max(self.base_silence_threshold, self.noise_floor * self.silence_ratio)
+        self.min_energy_threshold = max(self.base_min_energy_threshold, self.noise_floor * self.energy_ratio)
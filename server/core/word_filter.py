@@ -1,9 +1,133 @@
+"""
+Word Filter - blocks and censors words from blocked_words.txt.
+
+The lexicon is compiled once into a single regex (the words' prefix trie,
+longest match first) that runs over normalized text: Turkish casefolding (İ -> i, I -> ı),
+leetspeak folding (0 -> o, 4 -> a, $ -> s, ...) and, for words longer than
+EXACT_MAX_LENGTH, diacritic folding (ç/c, ğ/g, ı/i, ö/o, ş/s, ü/u). Short
+words keep their diacritics, so "öl" doesn't also block "ol".
+Normalization maps one character to one character, so match spans index
+straight into the original text.
+
+The matcher is rebuilt (and swapped in one assignment) when the file changes on disk.
+StreamingCensor applies the same filter to text that arrives in chunks.
+"""
 import re
+import time
 from pathlib import Path
 import logging
 
 logger = logging.getLogger("WordFilter")
 
+EXACT_MAX_LENGTH = 3  # Words up to this long are matched with their diacritics
+RELOAD_CHECK_INTERVAL = 1.0  # Seconds between blocked_words.txt mtime checks
+
+# Turkish casefolding of the dotted/dotless I plus leetspeak; one char in, one char out
+_FOLD = str.maketrans({
+    "İ": "i", "I": "ı",
+    "0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "@": "a", "$": "s",
+})
+# Base letter -> every spelling of it that diacritic folding accepts
+_SPELLINGS = {"a": "aâ", "c": "cç", "g": "gğ", "i": "iıî", "o": "oö", "s": "sş", "u": "uüû"}
+_BASE = {spelling: base for base, spellings in _SPELLINGS.items() for spelling in spellings}
+
+
+def normalize(text: str) -> str:
+    """Turkish-aware lowercase with leetspeak folded; same length as text."""
+    folded = text.translate(_FOLD).lower()
+    if len(folded) != len(text):  # A character lowercased to several (rare outside Turkish)
+        folded = "".join(ch.lower()[0] for ch in text.translate(_FOLD))
+    return folded
+
+
+def _word_tokens(word):
+    """Regex atoms for one normalized word: literal characters, or classes for folded letters."""
+    if len(word) <= EXACT_MAX_LENGTH:
+        return tuple(re.escape(ch) for ch in word)
+    tokens = []
+    for ch in word:
+        spellings = _SPELLINGS.get(_BASE.get(ch))
+        tokens.append(f"[{spellings}]" if spellings else re.escape(ch))
+    return tuple(tokens)
+
+
+def _trie_pattern(node):
+    """
+    Regex for a trie of word tokens, sharing common prefixes so matching cost
+    doesn't grow with the number of words. Longer continuations are tried
+    before ending a word (and a class can only lead to a word longer than any
+    literal path it overlaps), so the longest word at a position wins.
+    """
+    branches = [token + _trie_pattern(child) for token, child in sorted(
+        ((token, child) for token, child in node.items() if token),
+        key=lambda item: (not item[0].startswith("["), item[0]))]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    return f"(?:{'|'.join(branches)}){'?' if '' in node else ''}"
+
+
+_UNACCENT = str.maketrans({spelling: base for spelling, base in _BASE.items() if spelling != base})
+_WORD_CHAR = re.compile(r"\w")
+
+
+class Lexicon:
+    """
+    A compiled, immutable snapshot of the blocked words: the matcher regex
+    (a prefix trie, longest word first, None if empty) plus every word prefix, which the
+    streaming censor uses to decide how much text it has to hold back.
+    """
+
+    def __init__(self, words=()):
+        trie = {}
+        self.longest = 0
+        self._exact_prefixes = set()
+        self._folded_prefixes = set()
+        for word in words:
+            word = normalize(word)
+            if not word:
+                continue
+            node = trie
+            for token in _word_tokens(word):
+                node = node.setdefault(token, {})
+            node[""] = None  # A word ends here
+            self.longest = max(self.longest, len(word))
+            if len(word) <= EXACT_MAX_LENGTH:
+                prefixes, key = self._exact_prefixes, word
+            else:
+                prefixes, key = self._folded_prefixes, word.translate(_UNACCENT)
+            prefixes.update(key[:i] for i in range(1, len(key) + 1))
+        self.matcher = None
+        if trie:
+            self.matcher = re.compile(rf"(?<!\w){_trie_pattern(trie)}(?!\w)")
+
+    def could_start(self, tail):
+        """True if normalized text `tail` is (a prefix of) a blocked word."""
+        return tail in self._exact_prefixes or tail.translate(_UNACCENT) in self._folded_prefixes
+
+    def censor(self, text, norm, start, end, placeholder):
+        """
+        Censors text[start:] (norm is its normalization) for matches starting
+        before `end`. Returns (censored text, index where it stopped, words censored).
+        """
+        parts = []
+        cut = start
+        count = 0
+        if self.matcher is not None:
+            for match in self.matcher.finditer(norm, start):
+                if match.start() >= end:
+                    break
+                parts.append(text[cut:match.start()])
+                parts.append(placeholder)
+                cut = match.end()
+                count += 1
+        if cut < end:
+            parts.append(text[cut:end])
+            cut = end
+        return "".join(parts), cut, count
+
+
 class WordFilter:
     def __init__(self, blocked_words_file="blocked_words.txt"):
         self.blocked_words = set()
@@ -12,49 +136,122 @@ class WordFilter:
             # Assume it's relative to the project root or server dir
             # For simplicity, let's look in the same dir as this file if it's not found
             self.file_path = Path(__file__).parent.parent / blocked_words_file
-            
+
+        self._lexicon = Lexicon()
+        self._mtime = None
+        self._next_check = 0.0
         self.load_words()
 
     def load_words(self):
-        """Loads blocked words from the text file."""
+        """Loads blocked words from the text file and rebuilds the matcher."""
         if not self.file_path.exists():
             logger.warning(f"Blocked words file not found at {self.file_path}. Filter will be empty.")
             return
 
         try:
+            mtime = self.file_path.stat().st_mtime_ns
+            words = set()
             with open(self.file_path, "r", encoding="utf-8") as f:
                 for line in f:
-                    word = line.strip().lower()
+                    word = line.strip()  # Lexicon applies the Turkish-aware casefolding
                     if word:
-                        self.blocked_words.add(word)
-            logger.info(f"Loaded {len(self.blocked_words)} blocked words.")
+                        words.add(word)
+            lexicon = Lexicon(words)
         except Exception as e:
             logger.error(f"Error loading blocked words: {e}")
+            return
+        # Readers only ever see the old or the new lexicon, never a half-built one
+        self._lexicon = lexicon
+        self.blocked_words = words
+        self._mtime = mtime
+        logger.info(f"Loaded {len(words)} blocked words.")
+
+    def _check_reload(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + RELOAD_CHECK_INTERVAL
+        try:
+            mtime = self.file_path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._mtime:
+            logger.info("Blocked words file changed, reloading.")
+            self.load_words()
+
+    @property
+    def lexicon(self):
+        """The current Lexicon (reloaded first if blocked_words.txt changed)."""
+        self._check_reload()
+        return self._lexicon
 
     def contains_profanity(self, text: str) -> bool:
         """Returns True if text contains any of the blocked words."""
         if not text:
             return False
-        
-        lowered = text.lower()
-        for word in self.blocked_words:
-            # Use regex for whole-word matching to avoid false positives (e.g. "lan" in "alan")
-            pattern = rf"\b{re.escape(word)}\b"
-            if re.search(pattern, lowered, flags=re.IGNORECASE):
-                return True
-        return False
+        matcher = self.lexicon.matcher
+        # Whole-word matching avoids false positives (e.g. "lan" in "alan")
+        return matcher is not None and matcher.search(normalize(text)) is not None
 
     def censor_text(self, text: str, placeholder="***") -> str:
         """Replaces blocked words in the text with a placeholder."""
         if not text:
             return text
-            
-        censored = text
-        # Sort words by length descending to avoid partial replacement of longer words first
-        sorted_words = sorted(list(self.blocked_words), key=len, reverse=True)
-        
-        for word in sorted_words:
-            pattern = rf"\b{re.escape(word)}\b"
-            censored = re.sub(pattern, placeholder, censored, flags=re.IGNORECASE)
-            
-        return censored
+        lexicon = self.lexicon
+        if lexicon.matcher is None:
+            return text
+        return lexicon.censor(text, normalize(text), 0, len(text), placeholder)[0]
+
+    def streaming(self, placeholder="***"):
+        """A StreamingCensor for text that arrives in chunks."""
+        return StreamingCensor(self, placeholder)
+
+
+class StreamingCensor:
+    """
+    Incremental censor_text: feed() text chunks (e.g. streamed LLM output) and
+    get back the part that is final; flush() at the end returns the rest.
+    Only a tail that could still grow into a blocked word is held back, and
+    the concatenated output equals censor_text() of the concatenated input.
+    """
+
+    def __init__(self, word_filter, placeholder="***"):
+        self.word_filter = word_filter
+        self.placeholder = placeholder
+        self.censored = 0  # Blocked words replaced so far
+        self._context = ""  # Last character already emitted, for the word-boundary lookbehind
+        self._buffer = ""
+
+    def feed(self, text):
+        if not text:
+            return ""
+        self._buffer += text
+        return self._emit(final=False)
+
+    def flush(self):
+        """Returns whatever is still held back; the censor can then be reused."""
+        out = self._emit(final=True)
+        self._context = ""
+        return out
+
+    def _emit(self, final):
+        lexicon = self.word_filter.lexicon
+        text = self._context + self._buffer
+        norm = normalize(text)
+        start = len(self._context)
+
+        # Hold back from the first word start whose tail could still become a
+        # blocked word (or get a longer match, or lose its word boundary)
+        hold = len(text)
+        if not final:
+            for i in range(max(start, len(text) - lexicon.longest), len(text)):
+                if (i == 0 or not _WORD_CHAR.match(norm[i - 1])) and lexicon.could_start(norm[i:]):
+                    hold = i
+                    break
+
+        out, cut, count = lexicon.censor(text, norm, start, hold, self.placeholder)
+        self.censored += count
+        if cut > 0:
+            self._context = text[cut - 1]
+        self._buffer = text[cut:]
+        return out
@@ -1,14 +1,20 @@
-from server.components.websocket import handler, set_event_router
+from server.components.websocket import handler, set_event_router, broadcast_message, client_stats
 from server.components.vision import VisionComponent
+from server.components.multi_vision import MultiCameraVision, parse_sources
 from server.controllers.mode_controller import ModeController
 from server.controllers.voice_controller import VoiceController
 from server.core.task_manager import TaskManager
-from server.core.event_router import EventRouter
+from server.core.event_router import EventRouter, PRIORITY_CONTROL, PRIORITY_DEBUG
+from server.core import metrics
+from server.core.audio_streams import AudioStreamRegistry
+from server.core.audio_store import DiskAudioStore, MemoryAudioStore
 import websockets
+import aiohttp
 import aiohttp_cors
 from aiohttp import web
 import logging
 import asyncio
+import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -41,6 +47,50 @@ HOST = "localhost"
 WS_PORT = 8765
 HTTP_PORT = 8090
 
+# Generated clips: "memory" (default, no disk I/O) or "disk" (.audio_cache/clips)
+AUDIO_STORE = os.getenv("AUDIO_STORE", "memory").strip().lower()
+AUDIO_STORE_MB = int(os.getenv("AUDIO_STORE_MB", "64"))
+
+# Cameras: VISION_SOURCE (single camera, in-process) or VISION_SOURCES
+# ("front=camera:0,side=camera:1") for one worker process per camera
+VISION_SOURCES = parse_sources(os.getenv("VISION_SOURCES", ""))
+
+# Outbound HTTP (Gemini etc.): one keep-alive pool for the app's lifetime
+HTTP_CLIENT_LIMIT = 20           # Total pooled connections
+HTTP_CLIENT_LIMIT_PER_HOST = 8   # Per cloud endpoint
+HTTP_CLIENT_KEEPALIVE = 60       # Seconds an idle connection stays open
+HTTP_CLIENT_TIMEOUT = 30         # Default total timeout; calls override per request
+
+
+def component_samples(router, vc, vision):
+    """Stats the components already keep, exported next to the metrics (name, labels, value[, type])."""
+    stats = router.stats()
+    yield "hologram_event_queue_depth", {}, stats["depth"]
+    for priority, count in stats["queued"].items():
+        yield "hologram_event_queued", {"priority": priority}, count
+    for counter in ("dispatched", "dropped", "coalesced"):
+        for event, count in stats[counter].items():
+            yield f"hologram_events_{counter}", {"event": event}, count, "counter"
+
+    for client, stats in client_stats().items():
+        for key in ("depth", "lag"):
+            yield f"hologram_client_{key}", {"client": client}, stats[key]
+        for key in ("dropped", "coalesced"):
+            yield f"hologram_client_{key}", {"client": client}, stats[key], "counter"
+
+    for key, value in vc.speculation_stats.as_dict().items():
+        kind = "counter" if key in ("attempts", "cancelled", "hits", "misses", "latency_saved_total") else "gauge"
+        yield f"hologram_speculation_{key}", {}, value, kind
+
+    cameras = vision.stats() if isinstance(vision, MultiCameraVision) else {"default": vision.stats()}
+    for camera, report in cameras.items():
+        if not report:
+            continue
+        for key in ("effective_fps", "latency_ms", "ready_ms", "event_latency_ms"):
+            yield f"hologram_vision_{key}", {"camera": camera}, report.get(key)
+        for level, seconds in report.get("seconds", {}).items():
+            yield "hologram_vision_level_seconds", {"camera": camera, "level": level}, seconds
+
 
 async def main():
     logger.info("Initializing Hologram Assistant Backend...")
@@ -49,29 +99,76 @@ async def main():
     router = EventRouter()
     tm = TaskManager()
 
+    # Shared HTTP client for all cloud calls (DNS + TLS paid once, not per turn)
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=HTTP_CLIENT_LIMIT,
+            limit_per_host=HTTP_CLIENT_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_CLIENT_KEEPALIVE,
+            ttl_dns_cache=300,
+        ),
+        timeout=aiohttp.ClientTimeout(total=HTTP_CLIENT_TIMEOUT),
+    )
+
     # 2. Initialize Components
-    vision = VisionComponent()
-    vc = VoiceController(tm, AUDIO_OUTPUT_DIR)
+    if VISION_SOURCES:
+        vision = MultiCameraVision(VISION_SOURCES)
+        logger.info(f"Vision: {len(VISION_SOURCES)} camera worker(s) {VISION_SOURCES}")
+    else:
+        vision = VisionComponent()
+    audio_streams = AudioStreamRegistry()
+    if AUDIO_STORE == "disk":
+        audio_store = DiskAudioStore(AUDIO_OUTPUT_DIR / "clips", budget_bytes=AUDIO_STORE_MB * 1024 * 1024)
+    else:
+        audio_store = MemoryAudioStore(budget_bytes=AUDIO_STORE_MB * 1024 * 1024)
+    logger.info(f"Audio store: {type(audio_store).__name__} ({AUDIO_STORE_MB} MB)")
+    vc = VoiceController(tm, AUDIO_OUTPUT_DIR, http_session=http_session,
+                         audio_streams=audio_streams, audio_store=audio_store)
     mc = ModeController(tm, vision, vc)
 
     # 3. Register Correct Event Handlers
-    router.register("voice_control:start", vc.start)
-    router.register("voice_control:stop", vc.stop)
-    router.register("mode", mc.handle)
-    router.register("internal_disconnect", mc.handle_disconnect)
+    # Everything that starts/stops the pipelines runs one at a time, and a burst
+    # of mode messages (e.g. on reconnect) collapses to the last one
+    control = dict(priority=PRIORITY_CONTROL, group="control", concurrency=1)
+    router.register("voice_control:start", vc.start, coalesce="voice_control", **control)
+    router.register("voice_control:stop", vc.stop, coalesce="voice_control", **control)
+    router.register("mode", mc.handle, coalesce=True, **control)
+    router.register("internal_disconnect", mc.handle_disconnect, coalesce=True, **control)
+
+    # Debug panel asks for {"type": "metrics"}; answered with a snapshot
+    async def send_metrics(payload=None):
+        await broadcast_message({"type": "metrics", **metrics.snapshot()})
+
+    router.register("metrics", send_metrics, priority=PRIORITY_DEBUG, coalesce=True)
+    metrics.add_collector(lambda: component_samples(router, vc, vision))
 
     set_event_router(router)
 
+    # Pre-synthesize canned replies into the TTS cache without delaying startup
+    asyncio.get_running_loop().run_in_executor(None, vc.prebuild_phrases)
+
     # 4. HTTP Server (Audio Serving)
     async def serve_audio(request):
-        filename = request.match_info.get('path', '')
-        filepath = AUDIO_OUTPUT_DIR / filename
-        if filepath.exists():
-            return web.FileResponse(filepath, headers={
-                "Access-Control-Allow-Origin": "*",
-                "Cache-Control": "no-cache"
-            })
-        return web.Response(status=404)
+        audio_id = request.match_info.get('path', '')
+        if audio_store.blocking:
+            # Disk reads stay off the event loop
+            clip = await asyncio.get_running_loop().run_in_executor(None, audio_store.get, audio_id)
+        else:
+            clip = audio_store.get(audio_id)
+        if clip is None:
+            return web.Response(status=404)
+        data, content_type = clip
+        return web.Response(body=data, content_type=content_type, headers={
+            "Access-Control-Allow-Origin": "*",
+            "Cache-Control": "no-cache"
+        })
+
+    async def serve_metrics(request):
+        """Prometheus scrape endpoint."""
+        return web.Response(body=metrics.render().encode("utf-8"), headers={
+            "Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+            "Cache-Control": "no-cache"
+        })
 
     app = web.Application()
     cors = aiohttp_cors.setup(app, defaults={
@@ -81,7 +178,9 @@ async def main():
             allow_headers="*"
         )
     })
+    app.router.add_get('/audio/stream/{stream_id}', audio_streams.serve)
     app.router.add_get('/audio/{path:.*}', serve_audio)
+    app.router.add_get('/metrics', serve_metrics)
 
     runner = web.AppRunner(app)
     await runner.setup()
@@ -100,6 +199,7 @@ async def main():
         await tm.cancel_all()
         vision.stop()
         await runner.cleanup()
+        await http_session.close()
         logger.info("Cleanup complete. Goodbye.")
 
 if __name__ == "__main__":
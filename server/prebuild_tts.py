@@ -0,0 +1,39 @@
+"""
+Pre-synthesizes the TTS phrase pack into the audio cache.
+
+Usage: python server/prebuild_tts.py [--phrases path/to/phrases.txt]
+"""
+import os
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=project_root / ".env")
+
+from server.controllers.voice_controller import VoiceController
+from server.core.task_manager import TaskManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--phrases", help="Phrase pack file (defaults to server/tts_phrases.txt)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(name)s] %(levelname)s: %(message)s',
+                        datefmt='%H:%M:%S')
+    if args.phrases:
+        os.environ["TTS_PHRASES_FILE"] = str(Path(args.phrases).resolve())
+
+    vc = VoiceController(TaskManager(), project_root / ".audio_cache", microphone=False)
+    vc.prebuild_phrases()
+
+
+if __name__ == "__main__":
+    main()
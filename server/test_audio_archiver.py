@@ -0,0 +1,52 @@
+import sys
+import time
+import wave
+import threading
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core import audio_archiver
+from server.core.audio_archiver import AudioArchiver
+
+
+def test_utterance_is_written_as_wav(tmp_path):
+    archiver = AudioArchiver(tmp_path, channels=2, sample_width=2, rate=22050)
+    pcm = bytes(range(256)) * 40  # 2560 stereo 16-bit frames
+    assert archiver.submit(pcm)
+    archiver.close()
+
+    [path] = tmp_path.glob("rec_*.wav")
+    with wave.open(str(path), "rb") as wf:
+        assert (wf.getnchannels(), wf.getsampwidth(), wf.getframerate()) == (2, 2, 22050)
+        assert wf.getnframes() == len(pcm) // 4
+        assert wf.readframes(wf.getnframes()) == pcm
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path, monkeypatch):
+    release = threading.Event()
+    real_open = wave.open
+
+    def slow_open(*args, **kwargs):
+        release.wait(5.0)  # A disk that has stalled
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(audio_archiver.wave, "open", slow_open)
+    archiver = AudioArchiver(tmp_path, max_pending=2)
+    try:
+        assert archiver.submit(b"\0\0" * 100)  # Taken by the writer, which stalls
+        deadline = time.monotonic() + 1.0
+        while not archiver._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert archiver.submit(b"\0\0" * 100) and archiver.submit(b"\0\0" * 100)
+        started = time.monotonic()
+        assert not archiver.submit(b"\0\0" * 100)  # Queue full: dropped right away
+        assert time.monotonic() - started < 0.1
+    finally:
+        release.set()
+        archiver.close()
+
+    assert len(list(tmp_path.glob("rec_*.wav"))) == 3
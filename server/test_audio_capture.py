@@ -0,0 +1,122 @@
+import sys
+import wave
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from server.core.audio_capture import MicrophoneCapture, RingBuffer, WavFileStream
+from server.core.vad import EnergyVAD
+
+RATE = 16000
+CHUNK = 1024
+
+
+def _write_wav(path, segments):
+    """segments: list of (seconds, amplitude) pieces of a 440 Hz tone (0 = silence)."""
+    pieces = []
+    for seconds, amplitude in segments:
+        t = np.arange(int(seconds * RATE)) / RATE
+        pieces.append(amplitude * np.sin(2 * np.pi * 440 * t))
+    samples = np.concatenate(pieces).astype("<i2")
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes(samples.tobytes())
+
+
+def test_ring_buffer_wraps_and_tracks_positions():
+    ring = RingBuffer(8)
+    ring.write(b"abcdef")
+    ring.write(b"ghij")
+    assert ring.write_pos == 10
+    assert ring.oldest == 2
+    assert bytes(ring.read(2, 10)) == b"cdefghij"
+    try:
+        ring.read(0, 4)
+        assert False, "overwritten range must not be readable"
+    except ValueError:
+        pass
+
+
+def test_utterance_includes_pre_roll(tmp_path):
+    path = tmp_path / "speech.wav"
+    _write_wav(path, [(1.0, 0), (1.5, 8000), (3.0, 0)])
+
+    capture = MicrophoneCapture(lambda: WavFileStream(path, speed=20.0), chunk=CHUNK, rate=RATE)
+    capture.start()
+    try:
+        vad = EnergyVAD(300, 500, adaptive=False)
+        pcm = capture.record_utterance(vad, silence_duration=0.5, pre_roll=0.3)
+    finally:
+        capture.stop()
+
+    assert pcm is not None
+    samples = np.frombuffer(pcm, dtype="<i2")
+    loud = np.flatnonzero(np.abs(samples) > 1000)
+    # Roughly 0.3 s of pre-roll before the first voiced sample (chunk aligned)
+    pre_roll_seconds = loud[0] / RATE
+    assert 0.2 <= pre_roll_seconds <= 0.4
+    # The whole tone is captured
+    assert (loud[-1] - loud[0]) / RATE > 1.4
+
+
+def test_stream_stays_open_between_turns(tmp_path):
+    path = tmp_path / "two_turns.wav"
+    _write_wav(path, [(0.5, 0), (1.0, 8000), (1.0, 0), (1.0, 8000), (1.0, 0)])
+
+    opened = []
+
+    def factory():
+        opened.append(1)
+        return WavFileStream(path, speed=20.0)
+
+    capture = MicrophoneCapture(factory, chunk=CHUNK, rate=RATE)
+    capture.start()
+    try:
+        vad = EnergyVAD(300, 500, adaptive=False)
+        first = capture.record_utterance(vad, silence_duration=0.5)
+        second = capture.record_utterance(vad, silence_duration=0.5)
+    finally:
+        capture.stop()
+
+    assert first is not None and second is not None
+    assert len(opened) == 1
+
+
+
+class _FailingStream(WavFileStream):
+    def read(self, num_frames, exception_on_overflow=True):
+        raise OSError("Device unavailable")
+
+
+def test_capture_reports_read_error_and_restarts(tmp_path):
+    path = tmp_path / "speech.wav"
+    _write_wav(path, [(0.5, 0), (1.0, 8000), (1.0, 0)])
+    streams = [_FailingStream(path), WavFileStream(path, speed=20.0)]
+    opened = []
+
+    def factory():
+        opened.append(streams[len(opened)])
+        return opened[-1]
+
+    capture = MicrophoneCapture(factory, chunk=CHUNK, rate=RATE)
+    capture.start()
+    try:
+        capture._thread.join(timeout=1.0)
+        assert not capture.running
+        assert isinstance(capture.error, OSError)
+
+        capture.start()  # Reopens the device
+        assert capture.running and capture.error is None
+        assert not opened[0].is_active()  # The dead stream was released
+        utterance = capture.record_utterance(EnergyVAD(300, 500, adaptive=False), silence_duration=0.5)
+    finally:
+        capture.stop()
+
+    assert utterance is not None
+    assert len(opened) == 2
@@ -0,0 +1,54 @@
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core.audio_store import AudioStore, DiskAudioStore, MemoryAudioStore
+
+
+def _check_store(store):
+    ids = [store.put(bytes([i]) * 100, prefix="el") for i in range(5)]
+    assert len(set(ids)) == 5
+    assert all(audio_id.startswith("el_") and audio_id.endswith(".mp3") for audio_id in ids)
+    assert store.get(ids[-1]) == (bytes([4]) * 100, "audio/mpeg")
+    assert store.get("el_unknown.mp3") is None
+
+    # Budget is 250 bytes: only the two newest clips fit
+    assert len(store) == 2
+    assert store.used_bytes == 200
+    assert store.get(ids[0]) is None
+
+    # A get() makes a clip the most recently used, so the other one goes next
+    store.get(ids[3])
+    newest = store.put(b"x" * 100, prefix="gm", extension=".wav")
+    assert store.get(ids[4]) is None
+    assert store.get(ids[3]) is not None
+    assert store.get(newest) == (b"x" * 100, "audio/wav")
+
+
+def test_memory_store_ids_and_eviction():
+    _check_store(MemoryAudioStore(budget_bytes=250))
+
+
+def test_disk_store_ids_and_eviction():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DiskAudioStore(tmp, budget_bytes=250)
+        _check_store(store)
+        assert sorted(p.name for p in Path(tmp).iterdir()) == sorted(store._index)
+
+        # The index is rebuilt from the directory after a restart
+        reopened = DiskAudioStore(tmp, budget_bytes=250)
+        assert len(reopened) == 2
+        assert reopened.used_bytes == 200
+
+
+def test_base_store_is_abstract():
+    try:
+        AudioStore(100)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("AudioStore should not be instantiable")
@@ -0,0 +1,106 @@
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from server.core.audio_streams import AudioStreamRegistry
+
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream.iter_chunks()])
+
+
+def test_readers_get_every_chunk_live_or_late():
+    async def scenario():
+        registry = AudioStreamRegistry()
+        stream = registry.create("el")
+        assert stream.id.startswith("el_") and registry.get(stream.id) is stream
+
+        early = asyncio.create_task(_collect(stream))
+        waiter = asyncio.create_task(stream.wait_done())
+
+        def produce():  # TTS feeds from an executor thread
+            for chunk in (b"ab", b"cd", b"ef"):
+                stream.feed_threadsafe(chunk)
+            stream.finish_threadsafe()
+
+        threading.Thread(target=produce).start()
+        await asyncio.wait_for(waiter, 1.0)
+        late = await _collect(stream)  # Started after synthesis finished
+        stream.feed(b"ignored")  # Nothing is added once finished
+        return await early, late, stream
+
+    early, late, stream = asyncio.run(scenario())
+    assert early == late == b"abcdef"
+    assert stream.size == 6 and stream.error is None
+
+
+def test_finished_streams_expire_after_ttl():
+    async def scenario():
+        registry = AudioStreamRegistry(ttl=0.01)
+        finished, live = registry.create(), registry.create()
+        finished.finish()
+        await asyncio.sleep(0.02)
+        registry.create()  # Expiry runs on create
+        return registry, finished, live
+
+    registry, finished, live = asyncio.run(scenario())
+    assert registry.get(finished.id) is None
+    assert registry.get(live.id) is live  # Still being produced
+
+
+async def _fetch(registry, stream_id, produce=None):
+    app = web.Application()
+    app.router.add_get("/audio/stream/{stream_id}", registry.serve)
+    async with TestServer(app) as server:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(server.make_url(f"/audio/stream/{stream_id}")) as resp:
+                if produce:
+                    asyncio.get_running_loop().call_later(0.01, produce)
+                try:
+                    return resp.status, await resp.read()
+                except aiohttp.ClientPayloadError:
+                    return resp.status, None
+
+
+def test_route_streams_chunks_until_finished():
+    async def scenario():
+        registry = AudioStreamRegistry()
+        stream = registry.create("el")
+        stream.feed(b"first")
+
+        def produce():
+            stream.feed(b"-second")
+            stream.finish()
+
+        return await _fetch(registry, stream.id, produce)
+
+    assert asyncio.run(scenario()) == (200, b"first-second")
+
+
+def test_route_aborts_a_failed_stream():
+    async def scenario():
+        registry = AudioStreamRegistry()
+        broken, empty = registry.create(), registry.create()
+        broken.feed(b"partial")
+
+        def fail():
+            broken.finish(RuntimeError("TTS failed"))
+
+        empty.finish(RuntimeError("TTS and fallback failed"))
+        return (await _fetch(registry, broken.id, fail),
+                await _fetch(registry, empty.id),
+                await _fetch(registry, "el_unknown"))
+
+    broken, empty, unknown = asyncio.run(scenario())
+    assert broken == (200, None)  # Truncated transfer, not a clean end of clip
+    assert empty[0] == 502
+    assert unknown[0] == 404
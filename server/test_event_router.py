@@ -0,0 +1,93 @@
+import sys
+import asyncio
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core.event_router import EventRouter, PRIORITY_CONTROL, PRIORITY_DEBUG
+
+
+def test_mode_changes_are_serialized_and_coalesced():
+    async def scenario():
+        router = EventRouter()
+        applied = []
+        running = 0
+
+        async def handle_mode(payload):
+            nonlocal running
+            running += 1
+            assert running == 1  # Never overlapping
+            await asyncio.sleep(0.02)
+            applied.append(payload["value"])
+            running -= 1
+
+        router.register("mode", handle_mode, priority=PRIORITY_CONTROL,
+                        group="control", concurrency=1, coalesce=True)
+        router.submit("mode", {"value": "VISION"})
+        await asyncio.sleep(0.005)  # First one is running now
+        for value in ("VOICE", "VISION", "VOICE"):
+            router.submit("mode", {"value": value})
+        await asyncio.sleep(0.1)
+        return applied, router.stats()
+
+    applied, stats = asyncio.run(scenario())
+    assert applied == ["VISION", "VOICE"]  # Only the last queued mode is applied
+    assert stats["coalesced"] == {"mode": 2}
+    assert stats["dispatched"] == {"mode": 2}
+    assert stats["depth"] == 0
+
+
+def test_control_events_jump_debug_traffic_and_full_queue_drops_debug():
+    async def scenario():
+        router = EventRouter(max_queue=3)
+        order = []
+
+        async def record(payload):
+            order.append(payload["id"])
+
+        router.register("debug", record, priority=PRIORITY_DEBUG, concurrency=1)
+        router.register("voice_control:start", record, priority=PRIORITY_CONTROL,
+                        group="control", concurrency=1, coalesce="voice_control")
+        router.register("voice_control:stop", record, priority=PRIORITY_CONTROL,
+                        group="control", concurrency=1, coalesce="voice_control")
+
+        for i in range(4):
+            router.submit("debug", {"id": f"debug{i}"})  # debug3 doesn't fit
+        assert router.submit("voice_control:start", {"id": "start"})  # Evicts debug0
+        assert router.submit("voice_control:stop", {"id": "stop"})  # Supersedes the queued start
+        depth = router.depth
+        await asyncio.sleep(0.05)
+        return order, depth, router.stats()
+
+    order, depth, stats = asyncio.run(scenario())
+    assert depth == 3
+    assert order == ["stop", "debug1", "debug2"]
+    assert stats["dropped"] == {"debug": 2}
+    assert stats["coalesced"] == {"voice_control:stop": 1}
+
+
+def test_coalesced_event_runs_after_events_submitted_before_it():
+    async def scenario():
+        router = EventRouter()
+        order = []
+
+        async def record(payload):
+            order.append(payload["id"])
+            await asyncio.sleep(0.01)
+
+        control = dict(priority=PRIORITY_CONTROL, group="control", concurrency=1)
+        router.register("mode", record, coalesce=True, **control)
+        router.register("voice_control:start", record, coalesce="voice_control", **control)
+        router.register("voice_control:stop", record, coalesce="voice_control", **control)
+
+        router.submit("mode", {"id": "mode:VISION"})
+        await asyncio.sleep(0.002)  # Running now
+        router.submit("voice_control:start", {"id": "start"})
+        router.submit("mode", {"id": "mode:VOICE"})  # Starts voice itself
+        router.submit("voice_control:stop", {"id": "stop"})  # ...but the user's last word is stop
+        await asyncio.sleep(0.1)
+        return order
+
+    assert asyncio.run(scenario()) == ["mode:VISION", "mode:VOICE", "stop"]
@@ -1,4 +1,6 @@
+import os
 import sys
+import time
 from pathlib import Path
 
 # Add project root to sys.path
@@ -47,6 +49,74 @@ def test_word_filter():
         print("\n✅ ALL TESTS PASSED")
     else:
         print("\n❌ SOME TESTS FAILED")
+    assert all_passed
+
+def test_turkish_normalization():
+    wf = WordFilter("blocked_words.txt")
+
+    assert wf.contains_profanity("SEN GERİZEKALI MISIN")  # Turkish İ / I casefolding
+    assert wf.contains_profanity("g3r1z3k4l1")  # Leetspeak
+    assert wf.contains_profanity("kufur etme")  # Diacritics folded for longer words
+    assert wf.contains_profanity("Bu ÖL dedi")
+    assert not wf.contains_profanity("Mutlu ol")  # ...but not for short ones ("öl" vs "ol")
+    assert not wf.contains_profanity("Alan, ALAN")
+    assert wf.censor_text("Sen @pt@l, $alak!") == "Sen ***, ***!"
+    assert wf.censor_text("İyi günler") == "İyi günler"
+
+def test_uppercase_turkish_entries(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("KIZ\nİT\nIrk\n", encoding="utf-8")
+    wf = WordFilter(str(path))
+
+    assert wf.contains_profanity("kız")
+    assert wf.contains_profanity("İT")
+    assert wf.contains_profanity("it")
+    assert wf.contains_profanity("ırk")
+    assert not wf.contains_profanity("kiz")  # Short entries keep their dotless ı
+    assert wf.censor_text("Bu KIZ") == "Bu ***"
+
+def test_reload_on_change(tmp_path, monkeypatch):
+    import server.core.word_filter as word_filter
+    monkeypatch.setattr(word_filter, "RELOAD_CHECK_INTERVAL", 0.0)
+    path = tmp_path / "words.txt"
+    path.write_text("elma\n", encoding="utf-8")
+    wf = WordFilter(str(path))
+    assert wf.censor_text("elma armut") == "*** armut"
+
+    path.write_text("elma\narmut\n", encoding="utf-8")
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert wf.censor_text("elma armut") == "*** ***"
+
+def test_streaming_censor_matches_batch():
+    import random
+    wf = WordFilter("blocked_words.txt")
+    rng = random.Random(1234)
+    words = sorted(wf.blocked_words) + ["alan", "ol", "Aptal", "GERİZEKALI", "k0kain", "$alak", "argon"]
+    separators = [" ", " ", ", ", ".", "!", "\n", "'", "-", ""]
+
+    for _ in range(300):
+        text = "".join(rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(0, 12)))
+        censor = wf.streaming()
+        out = []
+        pos = 0
+        while pos < len(text):
+            size = rng.randint(1, 6)
+            out.append(censor.feed(text[pos:pos + size]))
+            pos += size
+        out.append(censor.flush())
+        assert "".join(out) == wf.censor_text(text), text
+
+def test_streaming_censor_emits_early():
+    wf = WordFilter("blocked_words.txt")
+    censor = wf.streaming()
+    assert censor.feed("Merhaba ") == "Merhaba "
+    assert censor.feed("apt") == ""  # Could still become "aptal"
+    assert censor.feed("al") == ""  # Still needs a word boundary after it
+    assert censor.feed(" dostum") == "*** dostum"
+    assert censor.feed("; bu bir sal") == "; bu bir "  # Could become "salak"
+    assert censor.feed("on") == "salon"
+    assert censor.flush() == ""
+    assert censor.censored == 1
 
 if __name__ == "__main__":
     test_word_filter()
@@ -0,0 +1,88 @@
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from server.components import frame_bus
+from server.components.frame_bus import FrameBus
+
+
+def _frame(value):
+    return np.full((48, 64, 3), value, np.uint8)
+
+
+def test_subscriber_reads_latest_frame_zero_copy():
+    bus = FrameBus(slots=3)
+    try:
+        bus.publish(_frame(1), timestamp=10.0)
+        sub = FrameBus.attach(bus.name)
+        frame, seq, ts = sub.read(0, timeout=0.1)
+        assert (seq, ts, frame[0, 0, 0]) == (1, 10.0, 1)
+        assert not frame.flags.owndata  # A view into shared memory, not a copy
+
+        # Nothing newer yet: the subscriber times out and registers demand
+        assert not bus.wanted
+        assert sub.read(seq, timeout=0.02)[0] is None
+        assert bus.wanted
+
+        # A slot is only reused after `slots` publishes
+        for value in (2, 3):
+            bus.publish(_frame(value))
+        assert sub.valid(1) and frame[0, 0, 0] == 1
+        bus.publish(_frame(4))
+        assert not sub.valid(1) and frame[0, 0, 0] == 4  # Overwritten in place
+        latest, seq, _ = sub.read(seq, timeout=0.1)
+        assert (seq, latest[0, 0, 0]) == (4, 4)
+        del frame, latest
+        sub.release()
+    finally:
+        bus.close()
+        bus.release()
+
+
+def test_owner_reader_wakes_on_publish_and_close():
+    bus = FrameBus(slots=2)
+    results = []
+
+    def reader():
+        frame, seq, _ = bus.read(0, timeout=2.0, copy=True)  # Waits for allocation + first frame
+        results.append((seq, int(frame[0, 0, 0])))
+        results.append(bus.read(seq, timeout=2.0)[0])  # Woken by close()
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    bus.publish(_frame(7))
+    while len(results) < 1:
+        thread.join(0.01)
+    bus.close()
+    thread.join(2.0)
+    assert results == [(1, 7), None]
+    bus.release()
+
+
+def test_attach_skips_only_its_own_tracker_registration(monkeypatch):
+    from multiprocessing import resource_tracker, shared_memory
+
+    bus = FrameBus(slots=2)
+    try:
+        bus.publish(_frame(1))
+        registered = []
+        monkeypatch.setattr(resource_tracker, "register", lambda resource, rtype: registered.append(resource))
+        real = shared_memory.SharedMemory
+
+        def attach_while_another_thread_registers(*args, **kwargs):
+            resource_tracker.register("/other_segment", "shared_memory")
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(shared_memory, "SharedMemory", attach_while_another_thread_registers)
+        frame_bus._open_shm(bus.name).close()
+        assert "/other_segment" in registered
+        assert all(resource.lstrip("/") != bus.name.lstrip("/") for resource in registered)
+    finally:
+        monkeypatch.undo()
+        bus.close()
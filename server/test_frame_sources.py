@@ -0,0 +1,89 @@
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import cv2
+import numpy as np
+
+from server.components.frame_sources import (
+    FrameSource, SyntheticSource, VideoFileSource, open_source,
+)
+
+
+def _write_clip(path, frames=6, fps=10.0):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (160, 120))
+    for i in range(frames):
+        writer.write(np.full((120, 160, 3), i * 40, np.uint8))
+    writer.release()
+
+
+def test_synthetic_source_timestamps_and_labelled_motion():
+    source = SyntheticSource(duration=1.0, fps=10.0, size=(160, 120), labels=[(0.5, 1.0)], realtime=False)
+    frames = []
+    while True:
+        ok, frame = source.read()
+        if not ok:
+            break
+        frames.append((source.timestamp, frame))
+
+    assert len(frames) == 10
+    assert [round(t, 1) for t, _ in frames] == [i / 10 for i in range(10)]
+    assert frames[0][1].shape == (120, 160, 3)
+    # The dark block only sweeps through the labelled window
+    assert frames[2][1].min() > 15
+    assert (frames[7][1] == 15).any()
+
+    source.release()
+    assert not source.isOpened()
+    assert source.read() == (False, None)
+
+
+def test_video_file_source_replays_and_loops():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "clip.avi"
+        _write_clip(path)
+
+        source = VideoFileSource(path, realtime=False)
+        assert source.isOpened() and source.fps == 10.0
+        count = 0
+        while source.read()[0]:
+            count += 1
+        assert count == 6
+        assert abs(source.timestamp - 0.5) < 1e-9
+        source.release()
+
+        looping = VideoFileSource(path, realtime=False, loop=True)
+        assert all(looping.read()[0] for _ in range(15))
+        assert looping.frame_index == 14
+        looping.release()
+
+
+def test_open_source_specs():
+    assert isinstance(open_source("synthetic:2", realtime=False), SyntheticSource)
+    assert open_source("synthetic:2").duration == 2.0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "clip.avi"
+        _write_clip(path)
+        for spec in (f"file:{path}", str(path)):
+            source = open_source(spec, realtime=False)
+            assert isinstance(source, VideoFileSource) and source.isOpened()
+            source.release()
+    try:
+        open_source("file:/nonexistent/clip.avi")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("missing file accepted")
+
+
+def test_frame_source_is_abstract():
+    try:
+        FrameSource()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("FrameSource should not be instantiable")
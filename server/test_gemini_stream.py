@@ -0,0 +1,115 @@
+import sys
+import json
+import asyncio
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import aiohttp
+
+from server.core.gemini_client import GeminiClient, GeminiError
+from server.core.sentence_splitter import SentenceSplitter
+
+FRAGMENTS = ["Merhaba! Ben bir holo", "gram asistanıyım. Bugün sana nas", "ıl yardım edebilirim? Hadi başlayalım"]
+
+
+class _StubGemini(BaseHTTPRequestHandler):
+    """Emits a chunked SSE response like streamGenerateContent?alt=sse."""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if "fail" in self.path:
+            self.send_response(500)
+            self.send_header("Content-Length", "5")
+            self.end_headers()
+            self.wfile.write(b"boom!")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for fragment in FRAGMENTS:
+            event = {"candidates": [{"content": {"parts": [{"text": fragment}]}}]}
+            payload = f"data: {json.dumps(event)}\r\n\r\n".encode()
+            self.wfile.write(f"{len(payload):x}\r\n".encode() + payload + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGemini)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _collect(client):
+    splitter = SentenceSplitter()
+    sentences = []
+    fragments = []
+    try:
+        async for fragment in client.stream("Merhaba"):
+            fragments.append(fragment)
+            sentences.extend(splitter.feed(fragment))
+        sentences.append(splitter.flush())
+    finally:
+        await client.close()
+    return fragments, sentences
+
+
+def test_stream_is_split_into_sentences():
+    server = _serve()
+    try:
+        client = GeminiClient("test-key", "stub-model", base_url=f"http://127.0.0.1:{server.server_port}/v1")
+        fragments, sentences = asyncio.run(_collect(client))
+    finally:
+        server.shutdown()
+
+    assert fragments == FRAGMENTS
+    assert sentences == [
+        "Merhaba! Ben bir hologram asistanıyım.",
+        "Bugün sana nasıl yardım edebilirim?",
+        "Hadi başlayalım",
+    ]
+
+
+def test_stream_error_status_raises():
+    server = _serve()
+    try:
+        client = GeminiClient("test-key", "fail-model", base_url=f"http://127.0.0.1:{server.server_port}/v1")
+        try:
+            asyncio.run(_collect(client))
+            assert False, "expected GeminiError"
+        except GeminiError as e:
+            assert "500" in str(e)
+    finally:
+        server.shutdown()
+
+
+def test_closed_shared_session_raises_instead_of_leaking():
+    async def scenario():
+        shared = aiohttp.ClientSession()
+        await shared.close()
+        client = GeminiClient("test-key", "model", session=shared, base_url="http://127.0.0.1:9/v1")
+        try:
+            await client.generate("Merhaba")
+            assert False, "expected GeminiError"
+        except GeminiError as e:
+            assert "closed" in str(e)
+        assert client.session is shared  # No private session was created behind main.py's back
+
+        # Standalone use owns its session, and close() releases it
+        standalone = GeminiClient("test-key", "model")
+        session = standalone._get_session()
+        await standalone.close()
+        assert session.closed
+
+    asyncio.run(scenario())
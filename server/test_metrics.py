@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core.metrics import Registry
+
+
+def test_histogram_export_and_summary():
+    registry = Registry()
+    stage = registry.histogram("test_stage_seconds", "Stage time", ("stage",), buckets=(0.01, 0.1, 1.0))
+    for seconds in (0.005, 0.05, 0.05, 0.5):
+        stage.labels(stage="stt").observe(seconds)
+    registry.counter("test_events_total", "Events").inc(3)
+    registry.add_collector(lambda: [("test_queue_depth", {"priority": "control"}, 2),
+                                    ("test_missing", {}, None)])
+
+    text = registry.render()
+    assert "# TYPE test_stage_seconds histogram" in text
+    assert 'test_stage_seconds_bucket{stage="stt",le="0.01"} 1' in text
+    assert 'test_stage_seconds_bucket{stage="stt",le="0.1"} 3' in text
+    assert 'test_stage_seconds_bucket{stage="stt",le="+Inf"} 4' in text
+    assert 'test_stage_seconds_count{stage="stt"} 4' in text
+    assert "test_events_total 3.0" in text
+    assert 'test_queue_depth{priority="control"} 2' in text
+    assert "test_missing" not in text
+
+    snap = registry.snapshot()
+    summary = snap["histograms"]["test_stage_seconds"]["stt"]
+    assert summary["count"] == 4
+    assert 10 <= summary["p50_ms"] <= 100
+    assert summary["max_ms"] == 500.0
+    assert snap["values"]['test_queue_depth{priority="control"}'] == 2
+
+
+def test_same_name_returns_same_metric():
+    registry = Registry()
+    assert registry.histogram("a_seconds", labelnames=("x",)) is registry.histogram("a_seconds", labelnames=("x",))
+    try:
+        registry.counter("a_seconds")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("type clash not detected")
+
+
+def test_collected_samples_are_grouped_and_typed():
+    registry = Registry()
+    registry.add_collector(lambda: [("test_dispatched", {"event": "mode"}, 1, "counter"),
+                                    ("test_depth", {}, 0),
+                                    ("test_dispatched", {"event": "debug"}, 4, "counter")])
+
+    lines = registry.render().splitlines()
+    assert lines == [
+        "# TYPE test_dispatched counter",
+        'test_dispatched{event="mode"} 1',
+        'test_dispatched{event="debug"} 4',
+        "# TYPE test_depth gauge",
+        "test_depth 0",
+    ]
+    assert registry.snapshot()["values"]['test_dispatched{event="debug"}'] == 4
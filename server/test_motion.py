@@ -0,0 +1,89 @@
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from server.components.motion import MotionDetector, MotionPreprocessor, create_engine
+from server.components.person_detector import PersonDetector
+
+
+def _frame(block_x=None, brightness=120):
+    frame = np.full((480, 640, 3), brightness, np.uint8)
+    if block_x is not None:
+        frame[160:320, block_x:block_x + 160] = 0
+    return frame
+
+
+def test_motion_regions_and_centroid_are_mirrored_fractions():
+    preprocess = MotionPreprocessor((160, 120))
+    engine = create_engine("diff", preprocess)
+    assert engine.process(preprocess(_frame())) is None  # Baseline only
+
+    result = engine.process(preprocess(_frame(block_x=0)))
+    payload = result.describe()
+    assert result.fraction > 0.05
+    assert len(payload["regions"]) == 1
+    cx, cy = payload["centroid"]
+    assert 0.8 < cx < 0.95  # Block on the camera's left is on the right of the mirrored frame
+    assert 0.4 < cy < 0.6
+
+
+def test_running_average_ignores_global_brightness_change():
+    preprocess = MotionPreprocessor((160, 120))
+    diff = create_engine("diff", preprocess)
+    average = create_engine("average", preprocess)
+    for frame in (_frame(), _frame(brightness=160)):
+        gray = preprocess(frame)
+        diff_result, average_result = diff.process(gray), average.process(gray)
+    assert diff_result.fraction > 0.5
+    assert average_result.fraction == 0.0
+
+
+def test_person_detector_crops_motion_region_and_maps_boxes_back():
+    crops = []
+
+    def backend(image):
+        crops.append(image.shape)
+        return [(0, 0, image.shape[1], image.shape[0])]  # "Person" fills the crop
+
+    detector = PersonDetector(budget_per_second=2.0, backend=backend)
+    frame = np.zeros((480, 640, 3), np.uint8)
+    region = (0.5, 0.25, 0.25, 0.5)  # Mirrored fractions, as in motion_detected
+
+    result = detector(frame, [region])
+    assert crops[0][0] <= 320 and crops[0][1] <= 320  # Downscaled crop, not the whole frame
+    assert result["count"] == 1
+    x, y, w, h = result["boxes"][0]
+    # Padded region, back in mirrored fractions
+    assert abs(x - 0.4375) < 0.01 and abs(y - 0.125) < 0.01
+    assert abs(w - 0.375) < 0.01 and abs(h - 0.75) < 0.01
+
+    # Budget: two per second, so a burst of motion frames is mostly skipped
+    runs = sum(detector(frame, [region]) is not None for _ in range(10))
+    assert runs == 1 and detector.skipped == 9
+    assert detector(frame, []) is None
+
+
+def test_motion_detector_threshold_cooldown_and_refresh():
+    detector = MotionDetector("diff", threshold=0.01, cooldown=1.0)
+    assert detector.process(_frame(), 0.0) == (0.0, None)  # Baseline only
+
+    fraction, event = detector.process(_frame(block_x=0), 0.1)
+    assert fraction > 0.05 and event["regions"]
+
+    # Still moving, but within the cooldown
+    fraction, event = detector.process(_frame(block_x=240), 0.5)
+    assert fraction > 0.05 and event is None
+    assert detector.cooldown_left(0.5) > 0
+
+    fraction, event = detector.process(_frame(block_x=480), 1.2)
+    assert event is not None
+
+    # A refreshed baseline means a scene change while paused isn't reported as motion
+    detector.refresh(_frame(brightness=200))
+    fraction, event = detector.process(_frame(brightness=200), 5.0)
+    assert fraction == 0.0 and event is None
@@ -0,0 +1,87 @@
+import sys
+import time
+import queue
+import asyncio
+import threading
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.components import multi_vision
+from server.components.multi_vision import MultiCameraVision, camera_worker, parse_sources
+
+SETTINGS = {"PERSON_DETECTOR": None}
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_parse_sources_names_and_defaults():
+    assert parse_sources("") == {}
+    assert parse_sources("front=camera:0, camera:1,,side = file:clip.mp4") == {
+        "front": "camera:0", "cam1": "camera:1", "side": "file:clip.mp4"}
+
+
+def test_camera_worker_tags_events_follows_standby_and_stops(monkeypatch):
+    monkeypatch.setattr(multi_vision, "STATS_INTERVAL", 0.1)
+    events, stop, active = queue.Queue(), threading.Event(), threading.Event()
+    active.set()
+    worker = threading.Thread(target=camera_worker,
+                              args=("front", "synthetic:10", SETTINGS, events, stop, active))
+    worker.start()
+    received = []
+
+    def seen(kind, state=None):
+        while True:
+            try:
+                received.append(events.get_nowait())
+            except queue.Empty:
+                break
+        return any(m[0] == kind and (state is None or m[2]["state"] == state) for m in received)
+
+    try:
+        assert _wait_for(lambda: seen("event"))  # First labelled motion window at 2 s
+        kind, camera_id, action, data = next(m for m in received if m[0] == "event")
+        assert (camera_id, action, data["camera_id"]) == ("front", "motion_detected", "front")
+
+        active.clear()
+        assert _wait_for(lambda: seen("stats", "standby"))
+        active.set()
+        assert _wait_for(lambda: seen("stats", "active"))
+    finally:
+        stop.set()
+        worker.join(5.0)
+
+    assert not worker.is_alive()
+    assert seen("stopped")
+    assert received[-1][0] == "stopped" and received[-1][2]["state"] == "off"
+
+
+def test_workers_run_in_processes_and_stop_cleanly():
+    vision = MultiCameraVision({"a": "synthetic:10", "b": "synthetic:10"}, SETTINGS)
+    received = []
+    vision._broadcast = lambda action, data: received.append((action, data["camera_id"]))
+
+    async def scenario():
+        vision.start(asyncio.get_running_loop())
+        deadline = time.monotonic() + 20.0
+        while {cid for _, cid in received} != {"a", "b"} and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        vision.standby()
+        assert not any(active.is_set() for _, _, active in vision._workers.values())
+        vision.stop()
+
+    asyncio.run(scenario())
+    assert {cid for _, cid in received} == {"a", "b"}
+    assert not vision.running
+
+    processes = [process for process, _, _ in vision._workers.values()]
+    assert _wait_for(lambda: all(p is not None and not p.is_alive() for p in processes))
+    assert all(p.exitcode == 0 for p in processes)
+    assert _wait_for(lambda: all(vision.stats()[cid].get("alive") is False for cid in ("a", "b")))
@@ -0,0 +1,108 @@
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core.speculation import SpeculationStats, Speculator
+
+
+def _work(runs, delay=0.0, fail=False):
+    """A fake STT task that records what happened to it."""
+    async def work(pcm):
+        runs.append(pcm)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            runs.append("cancelled")
+            raise
+        if fail:
+            raise RuntimeError("STT failed")
+        return f"text:{pcm.decode()}"
+    return work
+
+
+def test_hit_returns_the_speculative_result():
+    async def scenario():
+        stats = SpeculationStats()
+        runs = []
+        speculator = Speculator(asyncio.get_running_loop(), _work(runs, delay=0.02), stats)
+        # The recorder reports the pause from its own thread
+        threading.Thread(target=speculator.on_pause, args=(b"hello",)).start()
+        await asyncio.sleep(0.1)  # The user stays quiet past the real endpoint
+        return await speculator.commit(), stats, runs
+
+    result, stats, runs = asyncio.run(scenario())
+    assert result == "text:hello"
+    assert runs == [b"hello"]
+    assert (stats.attempts, stats.hits, stats.misses, stats.cancelled) == (1, 1, 0, 0)
+    assert stats.latency_saved >= 0.02
+    assert stats.as_dict()["hit_rate"] == 1.0
+
+
+def test_miss_without_a_pause():
+    async def scenario():
+        stats = SpeculationStats()
+        speculator = Speculator(asyncio.get_running_loop(), _work([]), stats)
+        return await speculator.commit(), stats
+
+    result, stats = asyncio.run(scenario())
+    assert result is None
+    assert (stats.attempts, stats.hits, stats.misses) == (0, 0, 1)
+    assert stats.hit_rate == 0.0
+
+
+def test_resumed_speech_cancels_the_run():
+    async def scenario():
+        stats = SpeculationStats()
+        runs = []
+        speculator = Speculator(asyncio.get_running_loop(), _work(runs, delay=1.0), stats)
+        speculator.on_pause(b"hel")
+        await asyncio.sleep(0.01)
+        speculator.on_resume()  # Still talking: the snapshot is stale
+        await asyncio.sleep(0.01)
+        speculator.on_pause(b"hello")  # A later pause speculates again
+        await asyncio.sleep(0.01)
+        speculator.on_resume()
+        await asyncio.sleep(0.01)
+        return await speculator.commit(), stats, runs
+
+    result, stats, runs = asyncio.run(scenario())
+    assert result is None
+    assert runs == [b"hel", "cancelled", b"hello", "cancelled"]
+    assert (stats.attempts, stats.cancelled, stats.hits, stats.misses) == (2, 2, 0, 1)
+
+
+def test_failed_run_falls_back_to_the_caller():
+    async def scenario():
+        stats = SpeculationStats()
+        speculator = Speculator(asyncio.get_running_loop(), _work([], fail=True), stats)
+        speculator.on_pause(b"hello")
+        await asyncio.sleep(0.01)
+        return await speculator.commit(), stats
+
+    result, stats = asyncio.run(scenario())
+    assert result is None
+    assert (stats.attempts, stats.hits, stats.misses) == (1, 0, 1)
+    assert stats.latency_saved == 0.0
+
+
+def test_run_without_a_result_counts_as_a_miss():
+    async def scenario():
+        stats = SpeculationStats()
+
+        async def stt_heard_nothing(pcm):
+            return None
+
+        speculator = Speculator(asyncio.get_running_loop(), stt_heard_nothing, stats)
+        speculator.on_pause(b"hello")
+        await asyncio.sleep(0.01)
+        return await speculator.commit(), stats
+
+    result, stats = asyncio.run(scenario())
+    assert result is None  # The caller runs STT on the committed audio instead
+    assert (stats.attempts, stats.hits, stats.misses) == (1, 0, 1)
+    assert stats.latency_saved == 0.0
@@ -0,0 +1,112 @@
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.core.tts_cache import TTSCache
+
+
+class _Settings:
+    def __init__(self, stability):
+        self.stability = stability
+        self.similarity_boost = 0.75
+
+
+def test_key_is_stable_and_covers_the_voice_configuration():
+    key = TTSCache.make_key("Merhaba!", "voice", "model", _Settings(0.5))
+    assert key == TTSCache.make_key("Merhaba!", "voice", "model", _Settings(0.5))
+    assert len(key) == 64
+    others = {
+        TTSCache.make_key("Merhaba", "voice", "model", _Settings(0.5)),
+        TTSCache.make_key("Merhaba!", "other", "model", _Settings(0.5)),
+        TTSCache.make_key("Merhaba!", "voice", "other", _Settings(0.5)),
+        TTSCache.make_key("Merhaba!", "voice", "model", _Settings(0.6)),
+        TTSCache.make_key("Merhaba!", "voice", "model"),
+    }
+    assert key not in others and len(others) == 5
+
+
+def test_memory_tier_evicts_lru_but_disk_still_serves(tmp_path):
+    cache = TTSCache(tmp_path, memory_budget=250, disk_budget=10_000)
+    for key in "abc":
+        cache.put(key, key.encode() * 100)
+    assert list(cache._memory) == ["b", "c"]
+
+    assert cache.get("a") == b"a" * 100  # From disk, and back in memory
+    assert list(cache._memory) == ["c", "a"]
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = TTSCache(tmp_path, memory_budget=0, disk_budget=250)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    cache.get("a")  # Now "b" is the oldest
+    cache.put("c", b"c" * 100)
+
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert sorted(p.stem for p in tmp_path.glob("*.mp3")) == ["a", "c"]
+
+
+def test_disk_index_survives_restart(tmp_path):
+    cache = TTSCache(tmp_path, disk_budget=250)
+    for key in "abc":
+        cache.put(key, key.encode() * 80)
+    past = time.time() - 60
+    os.utime(tmp_path / "b.mp3", (past, past))  # Least recently used on disk
+
+    reopened = TTSCache(tmp_path, disk_budget=250)
+    assert all(key in reopened for key in "abc")
+    assert reopened.get("c") == b"c" * 80
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # The rebuilt LRU order comes from file times, so "b" goes first
+    reopened.put("d", b"d" * 80)
+    assert "b" not in reopened and "a" in reopened
+
+
+def test_concurrent_writers_of_one_key(tmp_path, caplog, monkeypatch):
+    cache = TTSCache(tmp_path)
+    # Both writers have written their temp file before either renames it
+    barrier = threading.Barrier(2, timeout=2.0)
+    replace = Path.replace
+
+    def replace_together(self, target):
+        barrier.wait()
+        return replace(self, target)
+
+    monkeypatch.setattr(Path, "replace", replace_together)
+    threads = [threading.Thread(target=cache.put, args=("same", bytes([i]) * 1000)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert "write failed" not in caplog.text
+    assert [p.name for p in tmp_path.iterdir()] == ["same.mp3"]
+    data = (tmp_path / "same.mp3").read_bytes()
+    assert len(data) == 1000 and len(set(data)) == 1  # One writer's clip, not a mix
+    assert cache._disk_bytes == 1000
+
+
+def test_prebuild_without_a_microphone(tmp_path):
+    from server.controllers.voice_controller import VoiceController
+    from server.core.task_manager import TaskManager
+
+    class FakeTTS:
+        def convert(self, text, **kwargs):
+            return iter([text.encode(), b"-audio"])
+
+    vc = VoiceController(TaskManager(), tmp_path, microphone=False)
+    assert vc.audio is None and vc.capture is None
+    vc.el_client = type("FakeElevenLabs", (), {"text_to_speech": FakeTTS()})()
+
+    assert vc.prebuild_phrases(["Merhaba", "Nasılsın?"]) == 2
+    assert vc.tts_cache.get(vc._tts_key("Merhaba")) == b"Merhaba-audio"
+    assert vc.prebuild_phrases(["Merhaba"]) == 0  # Already cached
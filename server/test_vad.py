@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from server.core.vad import EnergyVAD, frame_rms
+
+
+def _pcm(amplitude, n=1024, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, amplitude, n).clip(-32768, 32767).astype("<i2").tobytes()
+
+
+def test_frame_rms_matches_python_loop():
+    data = _pcm(1500)
+    samples = [int.from_bytes(data[i:i+2], 'little', signed=True) for i in range(0, len(data), 2)]
+    expected = (sum(x*x for x in samples) / len(samples)) ** 0.5
+    assert abs(frame_rms(data) - expected) < 1e-6 * expected
+    assert frame_rms(b"") == 0.0
+
+
+def test_adaptive_thresholds_track_noise_floor():
+    vad = EnergyVAD(300, 500, calibration_frames=4)
+
+    # Quiet room: thresholds stay at their configured minimum
+    vad.calibrate([_pcm(50, seed=i) for i in range(4)])
+    assert vad.silence_threshold == 300
+    assert vad.min_energy_threshold == 500
+
+    # Noisy room: ambient hum raises both thresholds above the floor
+    vad.reset()
+    vad.calibrate([_pcm(400, seed=i) for i in range(4)])
+    assert vad.noise_floor > 300
+    assert vad.min_energy_threshold > vad.noise_floor
+    assert not vad.is_speech(frame_rms(_pcm(400, seed=9)))
+    assert vad.is_speech(frame_rms(_pcm(4000)))
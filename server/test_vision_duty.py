@@ -0,0 +1,67 @@
+import sys
+import time
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.components.vision import DutyCycle, VisionComponent
+
+
+def test_duty_cycle_levels_and_report():
+    duty = DutyCycle(active_interval=0.03, idle_interval=0.25, idle_after=5.0)
+    t0 = duty.started
+
+    # Quiet for longer than idle_after: drop to the idle rate
+    assert duty.update(now=t0 + 1) == 0.03
+    assert duty.update(now=t0 + 6) == 0.25
+    assert duty.level == "idle"
+    duty.count_frame()
+
+    # Activity ramps straight back up
+    duty.activity(now=t0 + 8)
+    assert duty.update(now=t0 + 8) == 0.03
+    duty.count_frame()
+
+    # Cooldown skips analysis until it ends, and the idle countdown restarts after it
+    assert duty.update(cooldown_left=1.2, now=t0 + 9) == 1.2
+    assert duty.level == "cooldown"
+    assert duty.update(now=t0 + 10.2 + 4.9) == 0.03
+    assert duty.update(now=t0 + 10.2 + 5.1) == 0.25
+
+    report = duty.report(now=t0 + 20)
+    assert report["frames"] == {"active": 1, "idle": 1, "cooldown": 0, "standby": 0}
+    assert abs(sum(report["seconds"].values()) - 20) < 0.01
+    assert report["effective_fps"] == 0.1
+
+
+def _wait_ready(vision, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while vision._requested_at is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return vision._requested_at is None
+
+
+def test_standby_keeps_camera_open_and_resumes_warm():
+    vision = VisionComponent(source="synthetic:30", on_event=lambda action, data: None)
+    vision.PERSON_DETECTOR = None
+    vision.start()
+    try:
+        assert _wait_ready(vision)
+        capture = vision._capture_thread
+
+        vision.standby()
+        assert vision.state == "standby"
+        time.sleep(0.1)
+        assert vision.running and vision.cap is not None
+
+        vision.start()
+        assert vision.state == "active"
+        assert _wait_ready(vision)
+        assert vision._capture_thread is capture  # Same capture run, no reopen
+        assert vision.stats()["seconds"]["standby"] > 0
+    finally:
+        vision.stop()
+        vision.join(2.0)
+    assert vision.state == "off"
@@ -0,0 +1,51 @@
+import sys
+import asyncio
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.controllers import voice_controller
+from server.controllers.voice_controller import VoiceController
+from server.core.task_manager import TaskManager
+
+
+class _EmptyGemini:
+    """Replies whose candidates carry no text, as _extract_text reports them."""
+
+    async def generate(self, prompt):
+        return ""
+
+    async def stream(self, prompt):
+        for fragment in ("", "  "):
+            yield fragment
+
+
+def _controller(tmp_path, monkeypatch):
+    vc = VoiceController(TaskManager(), tmp_path, microphone=False)
+    vc.gemini = _EmptyGemini()
+    synthesized, spoken = [], []
+
+    async def synthesize(text):
+        synthesized.append(text)
+        return "/audio/x", b"audio"
+
+    async def speak(*args, **kwargs):
+        spoken.append(args)
+
+    monkeypatch.setattr(vc, "_synthesize", synthesize)
+    monkeypatch.setattr(voice_controller, "broadcast_speak", speak)
+    return vc, synthesized, spoken
+
+
+def test_empty_reply_is_not_synthesized(tmp_path, monkeypatch):
+    vc, synthesized, spoken = _controller(tmp_path, monkeypatch)
+
+    async def scenario():
+        await vc._speak(await vc._gemini("Merhaba"))
+        await vc._speak("   ")
+        await vc._speak_streaming("Merhaba")
+
+    asyncio.run(scenario())
+    assert synthesized == [] and spoken == []
@@ -0,0 +1,116 @@
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+# Add project root to sys.path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.components import websocket
+from server.components.websocket import (
+    AUDIO_CHUNK_SIZE, AUDIO_FRAME_HEADER, ClientConnection, broadcast_message, broadcast_speak,
+    broadcast_state, broadcast_video_frame,
+)
+
+
+class FakeWS:
+    def __init__(self, blocked=False):
+        self.sent = []
+        self.closed_with = None
+        self.unblock = asyncio.Event()
+        if not blocked:
+            self.unblock.set()
+
+    async def send(self, payload):
+        await self.unblock.wait()
+        self.sent.append(payload if isinstance(payload, bytes) else json.loads(payload))
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+
+def _connect(ws, **kwargs):
+    conn = ClientConnection(ws, **kwargs)
+    websocket.clients[ws] = conn
+    return conn
+
+
+def test_stalled_client_does_not_delay_others():
+    async def scenario():
+        fast, slow = FakeWS(), FakeWS(blocked=True)
+        _connect(fast)
+        _connect(slow, maxsize=4)
+        try:
+            for i in range(10):
+                await broadcast_message({"type": "action", "action": f"a{i}"})
+            await asyncio.sleep(0.01)
+            assert len(fast.sent) == 10
+            # The slow client's queue is bounded; extra actions were dropped
+            assert websocket.clients[slow].depth <= 4
+            assert websocket.clients[slow].dropped > 0
+        finally:
+            for conn in list(websocket.clients.values()):
+                conn.close()
+
+    asyncio.run(scenario())
+
+
+def test_state_messages_coalesce_when_full():
+    async def scenario():
+        ws = FakeWS(blocked=True)
+        conn = _connect(ws, maxsize=3)
+        try:
+            await broadcast_message({"type": "action", "action": "speak"})
+            await asyncio.sleep(0)  # The writer takes "speak" and blocks on send
+            for value in ("LISTENING", "WAITING", "IDLE", "LISTENING", "WAITING"):
+                await broadcast_state(value)
+            ws.unblock.set()
+            await asyncio.sleep(0.01)
+            states = [m["value"] for m in ws.sent if m["type"] == "state"]
+            assert states[-1] == "WAITING"
+            assert conn.coalesced > 0
+        finally:
+            conn.close()
+
+    asyncio.run(scenario())
+
+
+def test_lagging_client_is_disconnected():
+    async def scenario():
+        ws = FakeWS(blocked=True)
+        conn = _connect(ws, max_lag=0.05)
+        await broadcast_state("LISTENING")
+        await asyncio.sleep(0.1)
+        await broadcast_state("IDLE")
+        await asyncio.sleep(0)
+        assert conn.closed
+        assert ws not in websocket.clients
+        assert ws.closed_with == 1013
+
+    asyncio.run(scenario())
+
+
+def test_binary_audio_waits_for_a_full_queue_instead_of_dropping():
+    async def scenario():
+        ws = FakeWS(blocked=True)
+        conn = _connect(ws, maxsize=4)
+        conn.audio_transport = "binary"
+        try:
+            await broadcast_state("SPEAKING")
+            await asyncio.sleep(0)  # The writer takes it and blocks on send
+            await broadcast_video_frame("frame")  # Lossy; evicted to make room
+            await broadcast_speak("/audio/x", 1.0, "hi", audio=bytes(AUDIO_CHUNK_SIZE * 10))
+            await asyncio.sleep(0.01)
+            assert conn.depth == 4  # The stream is waiting for the client
+            ws.unblock.set()
+            await asyncio.sleep(0.05)
+            frames = [m for m in ws.sent if isinstance(m, bytes)]
+            assert [AUDIO_FRAME_HEADER.unpack_from(f)[1] for f in frames] == list(range(10))
+            end = ws.sent[-1]
+            assert end["type"] == "audio_end" and end["chunks"] == 10 and end["ok"]
+            assert not any(isinstance(m, dict) and m["type"] == "video" for m in ws.sent)
+        finally:
+            conn.close()
+
+    asyncio.run(scenario())